@@ -22,6 +22,7 @@ the classes contained therein.
 
 import collections
 import copy
+import hashlib
 import inspect
 import logging
 import os
@@ -33,6 +34,7 @@ from django.conf.urls import url
 from django.core.exceptions import ImproperlyConfigured  # noqa
 from django.core.urlresolvers import reverse
 from django.utils.datastructures import SortedDict
+from django.utils.encoding import force_bytes
 from django.utils.encoding import python_2_unicode_compatible
 from django.utils.functional import SimpleLazyObject  # noqa
 from django.utils.importlib import import_module  # noqa
@@ -57,20 +59,77 @@ def _decorate_urlconf(urlpatterns, decorator, *args, **kwargs):
             _decorate_urlconf(pattern.url_patterns, decorator, *args, **kwargs)
 
 
+def _get_cache():
+    # Imported lazily, horizon is imported by settings modules before the
+    # cache can be configured.
+    from django.core.cache import cache
+    return cache
+
+
+def _get_cache_timeout():
+    return getattr(settings, 'NAVIGATION_CACHE_TIMEOUT', 600)
+
+
+def _get_token_id(request):
+    token = request.session.get('token')
+    return getattr(token, 'id', token)
+
+
+def nav_cache_key(request):
+    """Returns the key under which the navigation of ``request`` is cached.
+
+    The key is derived from the token of the request, the roles of the
+    user and the services of the catalog, so it changes whenever what the
+    user can see may change. ``None`` is returned when nothing should be
+    cached, i.e. for anonymous requests or when ``NAVIGATION_CACHE_TIMEOUT``
+    is ``0``.
+    """
+    token_id = _get_token_id(request)
+    if not token_id or _get_cache_timeout() <= 0:
+        return None
+    user = request.user
+    roles = sorted(role.get('name', '') for role in
+                   getattr(user, 'roles', None) or [])
+    services = sorted(service.get('type', '') for service in
+                      getattr(user, 'service_catalog', None) or [])
+    parts = (token_id, roles, services,
+             getattr(user, 'services_region', None))
+    return hashlib.md5(force_bytes(repr(parts))).hexdigest()
+
+
+class _AccessCache(dict):
+    """The results of ``can_access`` for the components of one request."""
+
+    def __init__(self, token_id, cache_key):
+        super(_AccessCache, self).__init__()
+        self.token_id = token_id
+        self.cache_key = cache_key
+
+
+def _get_access_cache(request):
+    access = getattr(request, '_horizon_access', None)
+    token_id = _get_token_id(request)
+    if isinstance(access, _AccessCache) and access.token_id == token_id:
+        return access
+    nav_key = nav_cache_key(request)
+    cache_key = 'horizon:access:%s' % nav_key if nav_key else None
+    access = _AccessCache(token_id, cache_key)
+    if cache_key:
+        access.update(_get_cache().get(cache_key) or {})
+    request._horizon_access = access
+    return access
+
+
 def access_cached(func):
     def inner(self, context):
-        session = context['request'].session
-        try:
-            if session['allowed']['valid_for'] != session.get('token'):
-                raise KeyError()
-        except KeyError:
-            session['allowed'] = {"valid_for": session.get('token')}
-
+        access = _get_access_cache(context['request'])
         key = "%s.%s" % (self.__class__.__module__, self.__class__.__name__)
-        if key not in session['allowed']:
-            session['allowed'][key] = func(self, context)
-            session.modified = True
-        return session['allowed'][key]
+        if key not in access:
+            access[key] = func(self, context)
+            if access.cache_key:
+                _get_cache().set(access.cache_key, dict(access),
+                                 _get_cache_timeout())
+        return access[key]
     return inner
 
 
@@ -114,7 +173,8 @@ class HorizonComponent(object):
         """Return whether the user has role based access to this component.
 
         This method is not intended to be overridden.
-        The result of the method is stored in per-session cache.
+        The result of the method is cached per token, see
+        ``NAVIGATION_CACHE_TIMEOUT``.
         """
         return self.allowed(context)
 
@@ -287,6 +287,13 @@ HANDLE_EXC_METHODS = [
 ]
 
 
+def get_handled_count(request):
+    """Returns how many exceptions :func:`handle` was called with for
+    ``request`` so far.
+    """
+    return getattr(request, '_handled_exception_count', 0)
+
+
 def handle(request, message=None, redirect=None, ignore=False,
            escalate=False, log_level=None, force_log=None):
     """Centralized error handling for Horizon.
@@ -317,6 +324,8 @@ def handle(request, message=None, redirect=None, ignore=False,
     returned.
     """
     exc_type, exc_value, exc_traceback = sys.exc_info()
+    if request is not None:
+        request._handled_exception_count = get_handled_count(request) + 1
     log_method = getattr(LOG, log_level or "exception")
     force_log = force_log or os.environ.get("HORIZON_TEST_RUN", False)
     force_silence = getattr(exc_value, "silence_logging", False)
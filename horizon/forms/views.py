@@ -20,6 +20,7 @@ from django import http
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
+from horizon.tables import cache as table_cache
 from horizon import views
 
 
@@ -173,6 +174,9 @@ class ModalFormView(ModalBackdropMixin, ModalFormMixin, views.HorizonFormView):
             exceptions.handle(self.request)
 
         if handled:
+            # The form most likely changed resources listed by the page it
+            # redirects to.
+            table_cache.invalidate(self.request)
             if ADD_TO_FIELD_HEADER in self.request.META:
                 field_id = self.request.META[ADD_TO_FIELD_HEADER]
                 data = [self.get_object_id(handled),
@@ -6,6 +6,7 @@ horizon.membership = {
   roles: [],
   has_roles: [],
   default_role_id: [],
+  search_requests: {},
 
   /* Parses the form field selector's ID to get either the
    * role or user id (i.e. returns "id12345" when
@@ -434,6 +435,91 @@ horizon.membership = {
     });
   },
 
+  /*
+   * Loads the page of entities matching the available list filter which
+   * follows the marker, or the first page if there is no marker, from the
+   * search URL of the step.
+   **/
+  search_members: function(step_slug, search_url, marker) {
+    var params = {search: $("input[id='available_" + step_slug + "']").val()};
+    if (marker) {
+      params.marker = marker;
+    }
+    // Only the results of the latest search are displayed.
+    if (horizon.membership.search_requests[step_slug]) {
+      horizon.membership.search_requests[step_slug].abort();
+    }
+    horizon.membership.search_requests[step_slug] = $.ajax({
+      url: search_url,
+      data: params,
+      dataType: 'json',
+      success: function (result) {
+        horizon.membership.add_search_results(step_slug, result, !marker);
+      },
+      error: function (jqXHR, textStatus) {
+        if (textStatus !== 'abort') {
+          horizon.alert('error', gettext('Unable to retrieve the available list.'));
+        }
+      }
+    });
+  },
+
+  /*
+   * Adds the entities returned by the search URL to the available list, and
+   * as options of the hidden role lists so that they can be selected.
+   **/
+  add_search_results: function(step_slug, result, replace) {
+    var $available = $(".available_" + step_slug);
+    var $more = $(".more_available_" + step_slug);
+    var $role_elements = horizon.membership.get_role_element(step_slug, '');
+    var data = horizon.membership.data[step_slug];
+
+    if (replace) {
+      $available.empty();
+    }
+    $.each(result.items, function (index, item) {
+      if (!data.hasOwnProperty(item.id)) {
+        data[item.id] = item.name;
+        $role_elements.append($("<option>").val(item.id).text(item.name));
+      }
+      var member_selector = "li[data-" + step_slug + "-id='id_" + step_slug + "_" + item.id + "']";
+      if (!$("." + step_slug + "_members").find(member_selector).length) {
+        $available.append(horizon.membership.generate_member_element(step_slug, item.name, item.id, [], "+"));
+      }
+    });
+    $available.find(".role_options").hide();
+
+    if (result.has_more && result.items.length) {
+      $more.data('marker', result.items[result.items.length - 1].id).removeClass('hide');
+    } else {
+      $more.addClass('hide');
+    }
+    horizon.membership.list_filtering(step_slug);
+    horizon.membership.detect_no_results(step_slug);
+    horizon.membership.fix_stripes(step_slug);
+  },
+
+  /*
+   * Searches for the available entities as the user types in the available
+   * list filter, instead of filtering the entities listed in the form.
+   **/
+  init_search: function($form, step_slug, search_url) {
+    var timeout;
+    // The filter inputs get unbound when the lists are updated, so the
+    // handlers are bound to the form.
+    $form.on('keyup', "input[id='available_" + step_slug + "']", function () {
+      clearTimeout(timeout);
+      timeout = setTimeout(function () {
+        horizon.membership.search_members(step_slug, search_url);
+      }, 300);
+    });
+    $form.on('click', ".more_available_" + step_slug, function (evt) {
+      evt.preventDefault();
+      horizon.membership.search_members(step_slug, search_url, $(this).data('marker'));
+    });
+    horizon.membership.search_members(step_slug, search_url);
+  },
+
   /*
    * Calls set-up functions upon loading the workflow.
    **/
@@ -486,6 +572,11 @@ horizon.membership = {
         $(filter + ' .btn-group:even').addClass('dark_stripe');
         $(filter + ' .btn-group:last').addClass('last_stripe');
       });
+
+      var search_url = $form.find('div.' + step_slug + '_membership').data('search-url');
+      if (search_url) {
+        horizon.membership.init_search($form, step_slug, search_url);
+      }
     });
   }
 };
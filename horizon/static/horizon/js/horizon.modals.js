@@ -205,6 +205,9 @@ horizon.addInitFunction(horizon.modals.init = function() {
         return;
       } else {
         formData = new window.FormData(form);
+        // Lets the server check the token before receiving the files.
+        headers["X-CSRFToken"] = $form
+          .find("input[name=csrfmiddlewaretoken]").val();
       }
     } else {
       formData = $form.serialize();
@@ -123,16 +123,41 @@ horizon.network_topology = {
     if($('#networktopology').length === 0) {
       return;
     }
-    $.getJSON($('#networktopology').data('networktopology') + '?' + $.now(),
-      function(data) {
-        self.model = data;
-        self.data_convert();
+    var url = $('#networktopology').data('networktopology') + '?' + $.now();
+    // Once we have a model, only ask for the changes since its version.
+    if (self.model && self.model.version) {
+      url += '&since=' + self.model.version;
+    }
+    $.getJSON(url,
+      function(data, textStatus, jqXHR) {
+        // 304: nothing changed since the previous poll.
+        if (jqXHR.status !== 304 && data) {
+          self.model = data.delta ? self.apply_delta(data) : data;
+          self.data_convert();
+        }
         setTimeout(function(){
           self.load_network_info();
         }, self.reload_duration);
       }
     );
   },
+  apply_delta:function(delta) {
+    var self = this;
+    var model = {version: delta.version};
+    $.each(['servers', 'networks', 'ports', 'routers'], function(index, kind) {
+      var resources = {};
+      $.each(self.model[kind], function(index, resource) {
+        resources[resource.id] = resource;
+      });
+      $.each(delta[kind].changed, function(index, resource) {
+        resources[resource.id] = resource;
+      });
+      model[kind] = $.map(delta[kind].ids, function(id) {
+        return resources[id];
+      });
+    });
+    return model;
+  },
   select_draw_mode:function() {
     var self = this;
     var draw_mode = horizon.cookies.get('ntp_draw_mode');
@@ -22,38 +22,78 @@ horizon.datatables = {
         $table.removeAttr('decay_constant');
         return;
       }
+      var schedule_next_poll = function () {
+        // Revalidate the button check for the updated table
+        horizon.datatables.validate_button();
+        rows_to_update--;
+        // Schedule next poll when all the rows are updated
+        if ( rows_to_update === 0 ) {
+          // Set interval decay to this table, and increase if it already exist
+          if(decay_constant === undefined) {
+            decay_constant = 1;
+          } else {
+            decay_constant++;
+          }
+          $table.attr('decay_constant', decay_constant);
+          // Poll until there are no rows in an "unknown" state on the page.
+          var next_poll = interval * decay_constant;
+          // Limit the interval to 30 secs
+          if(next_poll > 30 * 1000) { next_poll = 30 * 1000; }
+          setTimeout(horizon.datatables.update, next_poll);
+        }
+      };
+
+      // Rows of tables which support it are polled with a single request
+      // per table, the others with a request per row.
+      $rows_to_update.closest('table.datatable').each(function () {
+        var $bulk_table = $(this),
+          url = $bulk_table.attr('data-rows-update-url'),
+          $rows = $bulk_table.find('tr.status_unknown.ajax-update');
+        if (!url) {
+          return;
+        }
+        $rows.each(function () {
+          url += '&obj_id=' + encodeURIComponent($(this).attr('data-object-id'));
+        });
+        horizon.ajax.queue({
+          url: url,
+          dataType: 'json',
+          error: function () {
+            console.log(gettext("An error occurred while updating."));
+            $rows.removeClass("ajax-update");
+            $rows.find("i.ajax-updating").remove();
+          },
+          success: function (data) {
+            $rows.each(function () {
+              var $row = $(this),
+                html = data.rows[$row.attr('data-object-id')];
+              if (html === undefined) {
+                horizon.datatables.remove_row($bulk_table, $row);
+              } else {
+                horizon.datatables.replace_row($bulk_table, $row, html);
+              }
+            });
+          },
+          complete: function () {
+            $rows.each(schedule_next_poll);
+          }
+        });
+      });
+
       // Trigger the update handlers.
       $rows_to_update.each(function() {
         var $row = $(this),
           $table = $row.closest('table.datatable');
+        if ($table.attr('data-rows-update-url')) {
+          return;
+        }
         horizon.ajax.queue({
           url: $row.attr('data-update-url'),
           error: function (jqXHR) {
             switch (jqXHR.status) {
               // A 404 indicates the object is gone, and should be removed from the table
               case 404:
-                // Update the footer count and reset to default empty row if needed
-                var row_count, colspan, template, params;
-
-                // existing count minus one for the row we're removing
-                row_count = horizon.datatables.update_footer_count($table, -1);
-
-                if(row_count === 0) {
-                  colspan = $table.find('th[colspan]').attr('colspan');
-                  template = horizon.templates.compiled_templates["#empty_row_template"];
-                  params = {
-                      "colspan": colspan,
-                      no_items_label: gettext("No items to display.")
-                  };
-                  var empty_row = template.render(params);
-                  $row.replaceWith(empty_row);
-                } else {
-                  $row.remove();
-                }
-                // Reset tablesorter's data cache.
-                $table.trigger("update");
-                // Enable launch action if quota is not exceeded
-                horizon.datatables.update_actions();
+                horizon.datatables.remove_row($table, $row);
                 break;
               default:
                 console.log(gettext("An error occurred while updating."));
@@ -63,63 +103,73 @@ horizon.datatables = {
             }
           },
           success: function (data) {
-            var $new_row = $(data);
-
-            if ($new_row.hasClass('status_unknown')) {
-              var spinner_elm = $new_row.find("td.status_unknown:last");
-              var imagePath = $new_row.find('.btn-action-required').length > 0 ?
-                "dashboard/img/action_required.png":
-                "dashboard/img/loading.gif";
-              imagePath = STATIC_URL + imagePath;
-              spinner_elm.prepend(
-                $("<div>")
-                  .addClass("loading_gif")
-                  .append($("<img>").attr("src", imagePath)));
-            }
-
-            // Only replace row if the html content has changed
-            if($new_row.html() !== $row.html()) {
-              if($row.find('.table-row-multi-select:checkbox').is(':checked')) {
-                // Preserve the checkbox if it's already clicked
-                $new_row.find('.table-row-multi-select:checkbox').prop('checked', true);
-              }
-              $row.replaceWith($new_row);
-              // Reset tablesorter's data cache.
-              $table.trigger("update");
-              // Reset decay constant.
-              $table.removeAttr('decay_constant');
-              // Check that quicksearch is enabled for this table
-              // Reset quicksearch's data cache.
-              if ($table.attr('id') in horizon.datatables.qs) {
-                horizon.datatables.qs[$table.attr('id')].cache();
-              }
-            }
+            horizon.datatables.replace_row($table, $row, data);
           },
-          complete: function () {
-            // Revalidate the button check for the updated table
-            horizon.datatables.validate_button();
-            rows_to_update--;
-            // Schedule next poll when all the rows are updated
-            if ( rows_to_update === 0 ) {
-              // Set interval decay to this table, and increase if it already exist
-              if(decay_constant === undefined) {
-                decay_constant = 1;
-              } else {
-                decay_constant++;
-              }
-              $table.attr('decay_constant', decay_constant);
-              // Poll until there are no rows in an "unknown" state on the page.
-              var next_poll = interval * decay_constant;
-              // Limit the interval to 30 secs
-              if(next_poll > 30 * 1000) { next_poll = 30 * 1000; }
-              setTimeout(horizon.datatables.update, next_poll);
-            }
-          }
+          complete: schedule_next_poll
         });
       });
     }
   },
 
+  remove_row: function ($table, $row) {
+    // Update the footer count and reset to default empty row if needed
+    var row_count, colspan, template, params;
+
+    // existing count minus one for the row we're removing
+    row_count = horizon.datatables.update_footer_count($table, -1);
+
+    if(row_count === 0) {
+      colspan = $table.find('th[colspan]').attr('colspan');
+      template = horizon.templates.compiled_templates["#empty_row_template"];
+      params = {
+          "colspan": colspan,
+          no_items_label: gettext("No items to display.")
+      };
+      var empty_row = template.render(params);
+      $row.replaceWith(empty_row);
+    } else {
+      $row.remove();
+    }
+    // Reset tablesorter's data cache.
+    $table.trigger("update");
+    // Enable launch action if quota is not exceeded
+    horizon.datatables.update_actions();
+  },
+
+  replace_row: function ($table, $row, html) {
+    var $new_row = $(html);
+
+    if ($new_row.hasClass('status_unknown')) {
+      var spinner_elm = $new_row.find("td.status_unknown:last");
+      var imagePath = $new_row.find('.btn-action-required').length > 0 ?
+        "dashboard/img/action_required.png":
+        "dashboard/img/loading.gif";
+      imagePath = STATIC_URL + imagePath;
+      spinner_elm.prepend(
+        $("<div>")
+          .addClass("loading_gif")
+          .append($("<img>").attr("src", imagePath)));
+    }
+
+    // Only replace row if the html content has changed
+    if($new_row.html() !== $row.html()) {
+      if($row.find('.table-row-multi-select:checkbox').is(':checked')) {
+        // Preserve the checkbox if it's already clicked
+        $new_row.find('.table-row-multi-select:checkbox').prop('checked', true);
+      }
+      $row.replaceWith($new_row);
+      // Reset tablesorter's data cache.
+      $table.trigger("update");
+      // Reset decay constant.
+      $table.removeAttr('decay_constant');
+      // Check that quicksearch is enabled for this table
+      // Reset quicksearch's data cache.
+      if ($table.attr('id') in horizon.datatables.qs) {
+        horizon.datatables.qs[$table.attr('id')].cache();
+      }
+    }
+  },
+
   update_actions: function() {
     var $actions_to_update = $('.btn-launch.ajax-update, .btn-create.ajax-update');
     $actions_to_update.each(function() {
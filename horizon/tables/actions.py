@@ -30,6 +30,7 @@ from django.utils.translation import ungettext_lazy
 import six
 
 from horizon import messages
+from horizon.tables import cache
 from horizon.utils import functions
 from horizon.utils import html
 
@@ -841,6 +842,7 @@ class BatchAction(Action):
             messages.error(request, msg % params)
             success_message_level = messages.info
         if action_success:
+            cache.invalidate(request)
             msg = _('%(action)s: %(objs)s')
             params = {"action":
                       self._get_action_name(action_success, past=True),
@@ -41,6 +41,8 @@ from horizon import exceptions
 from horizon import messages
 from horizon.tables.actions import FilterAction  # noqa
 from horizon.tables.actions import LinkAction  # noqa
+from horizon.tables import cache
+from horizon.utils import functions
 from horizon.utils import html
 
 
@@ -70,7 +72,8 @@ class Column(html.HTMLElement):
     .. attribute:: sortable
 
         Boolean to determine whether this column should be sortable or not.
-        Defaults to ``True``.
+        On tables with the ``paginate`` option set the column is sorted on
+        the server instead of in the browser. Defaults to ``True``.
 
     .. attribute:: hidden
 
@@ -341,6 +344,16 @@ class Column(html.HTMLElement):
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self.name)
 
+    def get_sort_string(self):
+        """Returns the query parameter string which sorts the table by this
+        column, in descending order if it is already sorted ascending by it.
+        """
+        sort = self.name
+        if self.table.get_sort() == self.name:
+            sort = "-%s" % self.name
+        return self.table.get_query_string(**{self.table._meta.sort_param:
+                                              sort})
+
     def get_raw_data(self, datum):
         """Returns the raw data for this column, before any filters or
         formatting are applied to it. This is useful when doing calculations
@@ -466,6 +479,11 @@ class Row(html.HTMLElement):
     object appropriate for consumption by the table (effectively the "get"
     lookup versus the table's "list" lookup).
 
+    All of the rows of a table which are waiting for an update are polled
+    with a single request, which is answered by ``get_data_bulk``. By
+    default it calls ``get_data`` for each row, subclasses can override it
+    to fetch the objects with fewer API calls.
+
     The automatic update interval is configurable by setting the key
     ``ajax_poll_interval`` in the ``HORIZON_CONFIG`` dictionary.
     Default: ``2500`` (measured in milliseconds).
@@ -514,10 +532,17 @@ class Row(html.HTMLElement):
         updates of cell. Generally you won't need to change this value.
         It is also used for inline edit of the cell.
         Default: ``"cell_update"``.
+
+    .. attribute:: ajax_bulk_action_name
+
+        String that is used for the query parameter key to request AJAX
+        updates of several rows at once. Generally you won't need to change
+        this value. Default: ``"rows_update"``.
     """
     ajax = False
     ajax_action_name = "row_update"
     ajax_cell_action_name = "cell_update"
+    ajax_bulk_action_name = "rows_update"
 
     def __init__(self, table, datum=None):
         super(Row, self).__init__()
@@ -627,6 +652,21 @@ class Row(html.HTMLElement):
         """
         return {}
 
+    def get_data_bulk(self, request, obj_ids):
+        """Fetches the updated data for several rows based on the object ids
+        passed in. Returns a dictionary mapping the ids to their data; ids
+        missing from it are considered deleted.
+
+        By default this calls :meth:`get_data` for each id.
+        """
+        data = {}
+        for obj_id in obj_ids:
+            try:
+                data[obj_id] = self.get_data(request, obj_id)
+            except exceptions.NOT_FOUND:
+                pass
+        return data
+
 
 class Cell(html.HTMLElement):
     """Represents a single cell in the table."""
@@ -899,6 +939,22 @@ class DataTableOptions(object):
         single view this will need to be changed to differentiate between the
         tables. Default: ``"marker"``.
 
+    .. attribute:: paginate
+
+        Boolean to enable paging and sorting of the table data on the server.
+        Only one page of the (filtered) data is turned into rows, the page
+        size being the user's "Items Per Page" setting. Useful for tables
+        whose data source returns everything in a single call. Tables that
+        already page through their API (see
+        :meth:`~horizon.tables.DataTableView.has_more_data`) should leave it
+        off. Default: ``False``.
+
+    .. attribute:: sort_param
+
+        The name of the query string parameter which will be used to sort
+        a paginated table. Its value is a column name, prefixed by ``-`` for
+        descending order. Default: ``"sort"``.
+
     .. attribute:: status_columns
 
         A list or tuple of column names which represents the "state"
@@ -982,6 +1038,8 @@ class DataTableOptions(object):
                                              'prev_pagination_param',
                                              'prev_marker')
         self.pagination_param = getattr(options, 'pagination_param', 'marker')
+        self.paginate = getattr(options, 'paginate', False)
+        self.sort_param = getattr(options, 'sort_param', 'sort')
         self.browser_table = getattr(options, 'browser_table', None)
         self.footer = getattr(options, 'footer', True)
         self.hidden_title = getattr(options, 'hidden_title', True)
@@ -1161,6 +1219,10 @@ class DataTable(object):
         for key, _column in self._columns.items():
             column = copy.copy(_column)
             column.table = self
+            if self._meta.paginate:
+                # Sorting a single page in the browser would be misleading.
+                column.classes = [cls for cls in column.classes
+                                  if cls != "sortable"]
             columns.append((key, column))
         self.columns = SortedDict(columns)
         self._populate_data_cache()
@@ -1190,6 +1252,10 @@ class DataTable(object):
     def multi_select(self):
         return self._meta.multi_select
 
+    @property
+    def paginate(self):
+        return self._meta.paginate
+
     @property
     def filtered_data(self):
         # This function should be using django.utils.functional.cached_property
@@ -1219,19 +1285,104 @@ class DataTable(object):
                             self, self.data, filter_string)
         return self._filtered_data
 
+    @property
+    def paginated_data(self):
+        """The page of :attr:`filtered_data` which is rendered as rows.
+
+        For tables without the ``paginate`` option this is the whole of
+        :attr:`filtered_data`.
+        """
+        if not self._meta.paginate:
+            return self.filtered_data or []
+        return self._get_page()[0]
+
+    def get_sort(self):
+        """Returns the requested sort column name, prefixed by ``-`` for
+        descending order, or ``None`` if the table is not sorted.
+        """
+        sort = self.request.GET.get(self._meta.sort_param)
+        if not sort:
+            return None
+        column = self.columns.get(sort.lstrip('-'))
+        if column is None or not column.sortable or column.auto:
+            return None
+        return sort
+
+    def _sort(self, data):
+        sort = self.get_sort()
+        if sort is None:
+            return data
+        column = self.columns[sort.lstrip('-')]
+
+        def key(datum):
+            value = column.get_raw_data(datum)
+            if isinstance(value, six.string_types):
+                value = value.lower()
+            # Keeps empty values together at the end of ascending order.
+            return (value is None, value)
+
+        return sorted(data, key=key, reverse=sort.startswith('-'))
+
+    def _get_page(self):
+        # Returns the current page of data along with whether there are
+        # previous and next pages.
+        if not hasattr(self, '_page'):
+            self._page = self._paginate(self._sort(self.filtered_data or []))
+        return self._page
+
+    def _paginate(self, data):
+        page_size = functions.get_page_size(self.request)
+        ids = [six.text_type(self.get_object_id(datum)) for datum in data]
+        marker = self.request.GET.get(self._meta.pagination_param)
+        prev_marker = self.request.GET.get(self._meta.prev_pagination_param)
+        if marker in ids:
+            # Nothing is left after the last row, e.g. once the rows of the
+            # last page were deleted, the last page is shown instead.
+            start = min(ids.index(marker) + 1,
+                        max(len(ids) - page_size, 0))
+            end = start + page_size
+        elif prev_marker in ids:
+            # Likewise, the first page is shown before the first row.
+            end = max(ids.index(prev_marker), min(page_size, len(ids)))
+            start = max(end - page_size, 0)
+        else:
+            start, end = 0, page_size
+        return data[start:end], start > 0, end < len(data)
+
+    def get_query_string(self, **params):
+        """Returns a query parameter string which keeps the current sort
+        order and query filter of a paginated table, updated with the
+        given ``params``.
+        """
+        query = {}
+        sort = self.get_sort()
+        if sort:
+            query[self._meta.sort_param] = sort
+        filter_action = self._meta._filter_action
+        if self._meta.filter and filter_action \
+                and filter_action.filter_type == 'query':
+            filter_string = self.get_filter_string()
+            if filter_string:
+                query[filter_action.get_param_name()] = filter_string
+        query.update(params)
+        return urlencode(sorted(query.items()))
+
     def slugify_name(self):
         return str(slugify(self._meta.name))
 
     def get_filter_string(self):
         """Get the filter string value. For 'server' type filters this is
         saved in the session so that it gets persisted across table loads.
-        For other filter types this is obtained from the POST dict.
+        For other filter types this is obtained from the POST dict, or from
+        the query string when paging through a paginated table.
         """
         filter_action = self._meta._filter_action
         param_name = filter_action.get_param_name()
         filter_string = ''
         if filter_action.filter_type == 'server':
             filter_string = self.request.session.get(param_name, '')
+        elif self._meta.paginate and param_name not in self.request.POST:
+            filter_string = self.request.GET.get(param_name, '')
         else:
             filter_string = self.request.POST.get(param_name, '')
         return filter_string
@@ -1405,7 +1556,11 @@ class DataTable(object):
                          "table_actions_menu": []}
         if self._meta.filter and (
                 self._filter_action(self._meta._filter_action, self.request)):
-            extra_context["filter"] = self._meta._filter_action
+            filter_action = self._meta._filter_action
+            if self._meta.paginate and filter_action.filter_type == 'query':
+                # Keep the query visible while paging through its results.
+                filter_action.filter_string = self.get_filter_string()
+            extra_context["filter"] = filter_action
         for action in bound_actions:
             if action.__class__ in self._meta.table_actions_menu:
                 extra_context['table_actions_menu'].append(action)
@@ -1526,6 +1681,9 @@ class DataTable(object):
                         return HttpResponse(new_row.render())
                     else:
                         return HttpResponse(status=error.status_code)
+            elif new_row.ajax and new_row.ajax_bulk_action_name == action_name:
+                if request.is_ajax():
+                    return self.rows_update_handle(request, new_row)
             elif new_row.ajax_cell_action_name == action_name:
                 # inline edit of the cell actions
                 return self.inline_edit_handle(request, table_name,
@@ -1542,6 +1700,43 @@ class DataTable(object):
                             return handled
         return None
 
+    def rows_update_handle(self, request, row):
+        """AJAX update handler for all of the rows whose ids are given as
+        ``obj_id`` query parameters.
+
+        Responds with a JSON object mapping the ids of the rows which still
+        exist to their rendered HTML, under the ``rows`` key.
+        """
+        obj_ids = request.GET.getlist('obj_id')
+        try:
+            data = row.get_data_bulk(request, obj_ids)
+        except Exception:
+            error = exceptions.handle(request, ignore=True)
+            return HttpResponse(status=error.status_code)
+        rows = {}
+        for obj_id, datum in data.items():
+            new_row = self._meta.row_class(self)
+            if self.get_object_id(datum) == self.current_item_id:
+                self.selected = True
+                new_row.classes.append('current_selected')
+            new_row.load_cells(datum)
+            rows[obj_id] = new_row.render()
+        return HttpResponse(json.dumps({'rows': rows}),
+                            content_type="application/json")
+
+    def get_rows_update_url(self):
+        """Returns the URL used to poll the rows of this table waiting for an
+        update, or ``None`` if its rows are not updated with AJAX.
+        """
+        row_class = self._meta.row_class
+        if not row_class.ajax:
+            return None
+        params = urlencode(SortedDict([
+            ("action", row_class.ajax_bulk_action_name),
+            ("table", self.name)
+        ]))
+        return "%s?%s" % (self.get_absolute_url(), params)
+
     def inline_edit_handle(self, request, table_name, action_name, obj_id,
                            new_row):
         """Inline edit handler.
@@ -1604,6 +1799,7 @@ class DataTable(object):
                         new_cell_value))
                 cell.update_action.action(
                     self.request, datum, obj_id, cell_name, new_cell_value)
+                cache.invalidate(self.request)
                 response = {
                     'status': 'updated',
                     'message': ''
@@ -1676,6 +1872,8 @@ class DataTable(object):
         The method is largely meant for internal use, but if you want to
         override it to provide custom behavior you can do so at your own risk.
         """
+        if self._meta.paginate:
+            return self._get_page()[1]
         return self._meta.has_prev_data
 
     def has_more_data(self):
@@ -1685,26 +1883,34 @@ class DataTable(object):
         The method is largely meant for internal use, but if you want to
         override it to provide custom behavior you can do so at your own risk.
         """
+        if self._meta.paginate:
+            return self._get_page()[2]
         return self._meta.has_more_data
 
     def get_prev_marker(self):
         """Returns the identifier for the first object in the current data set
         for APIs that use marker/limit-based paging.
         """
-        return http.urlquote_plus(self.get_object_id(self.data[0])) \
-            if self.data else ''
+        data = self.paginated_data if self._meta.paginate else self.data
+        return http.urlquote_plus(self.get_object_id(data[0])) \
+            if data else ''
 
     def get_marker(self):
         """Returns the identifier for the last object in the current data set
         for APIs that use marker/limit-based paging.
         """
-        return http.urlquote_plus(self.get_object_id(self.data[-1])) \
-            if self.data else ''
+        data = self.paginated_data if self._meta.paginate else self.data
+        return http.urlquote_plus(self.get_object_id(data[-1])) \
+            if data else ''
 
     def get_prev_pagination_string(self):
         """Returns the query parameter string to paginate this table
         to the previous page.
         """
+        if self._meta.paginate:
+            return self.get_query_string(**{
+                self._meta.prev_pagination_param:
+                    self.get_object_id(self.paginated_data[0])})
         return "=".join([self._meta.prev_pagination_param,
                          self.get_prev_marker()])
 
@@ -1712,6 +1918,10 @@ class DataTable(object):
         """Returns the query parameter string to paginate this table
         to the next page.
         """
+        if self._meta.paginate:
+            return self.get_query_string(**{
+                self._meta.pagination_param:
+                    self.get_object_id(self.paginated_data[-1])})
         return "=".join([self._meta.pagination_param, self.get_marker()])
 
     def calculate_row_status(self, statuses):
@@ -1757,10 +1967,14 @@ class DataTable(object):
         return self.columns.values()
 
     def get_rows(self):
-        """Return the row data for this table broken out by columns."""
+        """Return the row data for this table broken out by columns.
+
+        Rows are only built for :attr:`paginated_data`, i.e. the current page
+        of paginated tables.
+        """
         rows = []
         try:
-            for datum in self.filtered_data:
+            for datum in self.paginated_data:
                 row = self._meta.row_class(self, datum)
                 if self.get_object_id(datum) == self.current_item_id:
                     self.selected = True
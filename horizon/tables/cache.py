@@ -0,0 +1,180 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""A short-lived, per-process cache for the data displayed in tables.
+
+Views and tabs which set ``cache_data = True`` load their table data
+through :func:`get_data`. Recent data is served straight from the cache;
+data past its ``timeout`` but still within its ``stale_timeout`` is served
+as well while a background thread fetches a fresh copy. Anything older is
+loaded again before the page is rendered.
+
+The data objects returned by the API wrappers are not necessarily
+picklable, so they are kept in the memory of the current process. Objects
+referencing the request they were loaded for, such as ``api.nova.Server``,
+are stored as copies referencing none and handed out as copies referencing
+the current request. Data loaded while an API error was handled, e.g. the
+empty list a view returns when the listing failed, is never stored. Every
+entry is tagged with a per-project generation token which is kept in the
+Django cache; :func:`invalidate` replaces the token, so a successful table
+action makes the data cached by every process outdated at once.
+"""
+
+import collections
+import copy
+import logging
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from horizon import exceptions
+
+LOG = logging.getLogger(__name__)
+
+_entries = collections.OrderedDict()
+_refreshing = set()
+_lock = threading.Lock()
+
+
+class UncacheableData(Exception):
+    """Raised by a loader whose data must not be stored.
+
+    ``value`` is still returned to the request which loaded it.
+    """
+    def __init__(self, value):
+        super(UncacheableData, self).__init__(value)
+        self.value = value
+
+
+def _get_config():
+    config = {'timeout': 10, 'stale_timeout': 60, 'max_entries': 200}
+    config.update(getattr(settings, 'TABLE_DATA_CACHE', {}))
+    return config
+
+
+def _generation_key(request):
+    project_id = getattr(request.user, 'tenant_id', None) or ''
+    return 'horizon:table_data:generation:%s' % project_id
+
+
+def _store(key, value, max_entries):
+    with _lock:
+        _entries.pop(key, None)
+        _entries[key] = (time.time(), value)
+        while len(_entries) > max_entries:
+            _entries.popitem(last=False)
+
+
+def _refresh(key, loader, max_entries):
+    with _lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def run():
+        try:
+            _store(key, loader(), max_entries)
+        except UncacheableData:
+            LOG.info("Discarded the table data refreshed in the background, "
+                     "an error occurred while loading it.")
+        except Exception:
+            LOG.warning("Unable to refresh cached table data.",
+                        exc_info=True)
+        finally:
+            with _lock:
+                _refreshing.discard(key)
+
+    thread = threading.Thread(target=run)
+    thread.daemon = True
+    thread.start()
+
+
+def get_data(request, key, loader):
+    """Returns the result of calling ``loader``, cached under ``key``.
+
+    ``key`` must be a hashable value identifying the data, e.g. the view,
+    the table and the query parameters it was requested with. The user and
+    project of ``request`` are added to it. ``loader`` may raise
+    :class:`UncacheableData` to have its value returned without storing it.
+    """
+    config = _get_config()
+    if config['timeout'] <= 0:
+        return _load(loader)[0]
+    key = (key,
+           getattr(request.user, 'id', None),
+           getattr(request.user, 'tenant_id', None),
+           cache.get(_generation_key(request)))
+    with _lock:
+        entry = _entries.get(key)
+    if entry is not None:
+        age = time.time() - entry[0]
+        if age < config['timeout']:
+            return entry[1]
+        if age < config['timeout'] + config['stale_timeout']:
+            _refresh(key, loader, config['max_entries'])
+            return entry[1]
+    value, cacheable = _load(loader)
+    if cacheable:
+        _store(key, value, config['max_entries'])
+    return value
+
+
+def _load(loader):
+    try:
+        return loader(), True
+    except UncacheableData as e:
+        return e.value, False
+
+
+def _bind(data, request):
+    bound = []
+    for datum in data:
+        if 'request' in getattr(datum, '__dict__', {}):
+            datum = copy.copy(datum)
+            datum.request = request
+        bound.append(datum)
+    return bound
+
+
+def get_table_data(request, key, loader):
+    """Returns the table data and paging flags returned by ``loader``.
+
+    ``loader`` must return a ``(data, has_prev_data, has_more_data)``
+    tuple. It is cached as with :func:`get_data`, unless an exception was
+    handled through :func:`horizon.exceptions.handle` while loading it.
+    """
+    def load():
+        handled = exceptions.get_handled_count(request)
+        data, has_prev, has_more = loader()
+        value = (_bind(data, None), has_prev, has_more)
+        if exceptions.get_handled_count(request) != handled:
+            raise UncacheableData(value)
+        return value
+
+    data, has_prev, has_more = get_data(request, key, load)
+    return _bind(data, request), has_prev, has_more
+
+
+def invalidate(request):
+    """Makes the cached table data of the request's project outdated."""
+    if _get_config()['timeout'] <= 0:
+        return
+    cache.set(_generation_key(request), uuid.uuid4().hex, None)
+
+
+def clear():
+    """Drops all of the table data cached by this process."""
+    with _lock:
+        _entries.clear()
@@ -16,19 +16,33 @@ from collections import defaultdict
 
 from django import shortcuts
 
+from horizon.tables import cache
 from horizon import views
 
 from horizon.templatetags.horizon import has_permissions  # noqa
 
 
 class MultiTableMixin(object):
-    """A generic mixin which provides methods for handling DataTables."""
+    """A generic mixin which provides methods for handling DataTables.
+
+    .. attribute:: cache_data
+
+        Boolean to serve the table data from a short-lived cache, keyed on
+        the user, project, view arguments, query string and server side
+        filter. Outdated data is served while it is refreshed in the
+        background, see the ``TABLE_DATA_CACHE`` setting. Only suitable for
+        views whose ``get_*_data`` methods have no other side effects than
+        those needed by ``has_more_data`` and ``has_prev_data``.
+        Default: ``False``.
+    """
     data_method_pattern = "get_%s_data"
+    cache_data = False
 
     def __init__(self, *args, **kwargs):
         super(MultiTableMixin, self).__init__(*args, **kwargs)
         self.table_classes = getattr(self, "table_classes", [])
         self._data = {}
+        self._data_pages = {}
         self._tables = {}
 
         self._data_methods = defaultdict(list)
@@ -37,14 +51,48 @@ class MultiTableMixin(object):
     def _get_data_dict(self):
         if not self._data:
             for table in self.table_classes:
-                data = []
                 name = table._meta.name
                 func_list = self._data_methods.get(name, [])
-                for func in func_list:
-                    data.extend(func())
-                self._data[name] = data
+
+                def load(func_list=func_list):
+                    data = []
+                    for func in func_list:
+                        data.extend(func())
+                    return data
+                self._data[name] = self._load_table_data(name, load)
         return self._data
 
+    def _get_data_cache_key(self, name):
+        prefix = "%s__" % name
+        session_filters = sorted((key, value) for key, value
+                                 in self.request.session.items()
+                                 if key.startswith(prefix))
+        return (self.__class__.__module__,
+                self.__class__.__name__,
+                name,
+                tuple(sorted(self.kwargs.items())),
+                self.request.GET.urlencode(),
+                tuple(session_filters))
+
+    def _load_table_data(self, name, loader):
+        """Returns the data returned by ``loader`` for the table ``name``,
+        going through the table data cache if ``cache_data`` is set.
+        """
+        if not self.cache_data:
+            return loader()
+
+        def load():
+            data = loader()
+            table = self.get_tables().get(name)
+            return (data,
+                    self.has_prev_data(table),
+                    self.has_more_data(table))
+
+        data, has_prev, has_more = cache.get_table_data(
+            self.request, self._get_data_cache_key(name), load)
+        self._data_pages[name] = (has_prev, has_more)
+        return data
+
     def get_data_methods(self, table_classes, methods):
         for table in table_classes:
             name = table._meta.name
@@ -120,8 +168,13 @@ class MultiTableMixin(object):
         name = table.name
         data = self._get_data_dict()
         self._tables[name].data = data[table._meta.name]
-        self._tables[name]._meta.has_more_data = self.has_more_data(table)
-        self._tables[name]._meta.has_prev_data = self.has_prev_data(table)
+        if table._meta.name in self._data_pages:
+            has_prev, has_more = self._data_pages[table._meta.name]
+        else:
+            has_prev = self.has_prev_data(table)
+            has_more = self.has_more_data(table)
+        self._tables[name]._meta.has_more_data = has_more
+        self._tables[name]._meta.has_prev_data = has_prev
         handled = self._tables[name].maybe_handle()
         return handled
 
@@ -184,7 +237,8 @@ class DataTableView(MultiTableView):
     def _get_data_dict(self):
         if not self._data:
             self.update_server_filter_action()
-            self._data = {self.table_class._meta.name: self.get_data()}
+            name = self.table_class._meta.name
+            self._data = {name: self._load_table_data(name, self.get_data)}
         return self._data
 
     def get_data(self):
@@ -272,6 +326,19 @@ class DataTableView(MultiTableView):
             if filter_info['field_param']:
                 setattr(action, 'filter_field', filter_info['field'])
 
+    def get_api_filters(self):
+        """Returns the API filter selected in the server filter of the
+        table, as a dict, or ``None`` if there is none.
+        """
+        table = self.get_table()
+        filter_field = table.get_filter_field()
+        filter_string = table.get_filter_string()
+        filter_action = table._meta._filter_action
+        if filter_field and filter_string and (
+                filter_action.is_api_filter(filter_field)):
+            return {filter_field: filter_string}
+        return None
+
 
 class MixedDataTableView(DataTableView):
     """A class-based generic view to handle DataTable with mixed data
@@ -295,18 +362,23 @@ class MixedDataTableView(DataTableView):
     def _get_data_dict(self):
         if not self._data:
             table = self.table_class
-            self._data = {table._meta.name: []}
-            for data_type in table.data_types:
-                func_name = "get_%s_data" % data_type
-                data_func = getattr(self, func_name, None)
-                if data_func is None:
-                    cls_name = self.__class__.__name__
-                    raise NotImplementedError("You must define a %s method "
-                                              "for %s data type in %s." %
-                                              (func_name, data_type, cls_name))
-                data = data_func()
-                self.assign_type_string(data, data_type)
-                self._data[table._meta.name].extend(data)
+
+            def load():
+                data = []
+                for data_type in table.data_types:
+                    func_name = "get_%s_data" % data_type
+                    data_func = getattr(self, func_name, None)
+                    if data_func is None:
+                        cls_name = self.__class__.__name__
+                        raise NotImplementedError(
+                            "You must define a %s method for %s data type "
+                            "in %s." % (func_name, data_type, cls_name))
+                    type_data = data_func()
+                    self.assign_type_string(type_data, data_type)
+                    data.extend(type_data)
+                return data
+            name = table._meta.name
+            self._data = {name: self._load_table_data(name, load)}
         return self._data
 
     def assign_type_string(self, data, type_string):
@@ -12,6 +12,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import functools
 import sys
 
 import six
@@ -21,6 +22,7 @@ from django.template import TemplateSyntaxError  # noqa
 from django.utils.datastructures import SortedDict
 
 from horizon import exceptions
+from horizon.tables import cache
 from horizon.utils import html
 
 SEPARATOR = "__"
@@ -415,8 +417,15 @@ class TableTab(Tab):
         :class:`~horizon.tables.MultiTableView`. For each table class you
         need to define a corresponding ``get_{{ table_name }}_data`` method
         as with :class:`~horizon.tables.MultiTableView`.
+
+    .. attribute:: cache_data
+
+        Boolean to serve the table data from a short-lived cache. Equivalent
+        to the :attr:`~horizon.tables.MultiTableView.cache_data` attribute
+        on :class:`~horizon.tables.MultiTableView`. Default: ``False``.
     """
     table_classes = None
+    cache_data = False
 
     def __init__(self, tab_group, request):
         super(TableTab, self).__init__(tab_group, request)
@@ -446,12 +455,36 @@ class TableTab(Tab):
                     raise NotImplementedError("You must define a %s method "
                                               "on %s." % (func_name, cls_name))
                 # Load the data.
-                table.data = data_func()
-                table._meta.has_prev_data = self.has_prev_data(table)
-                table._meta.has_more_data = self.has_more_data(table)
+                if self.cache_data:
+                    data, has_prev, has_more = cache.get_table_data(
+                        self.request,
+                        self._get_data_cache_key(table_name),
+                        functools.partial(self._load_data, table, data_func))
+                else:
+                    data, has_prev, has_more = self._load_data(table,
+                                                               data_func)
+                table.data = data
+                table._meta.has_prev_data = has_prev
+                table._meta.has_more_data = has_more
             # Mark our data as loaded so we don't run the loaders again.
             self._table_data_loaded = True
 
+    def _load_data(self, table, data_func):
+        data = data_func()
+        return data, self.has_prev_data(table), self.has_more_data(table)
+
+    def _get_data_cache_key(self, table_name):
+        prefix = "%s__" % table_name
+        session_filters = sorted((key, value) for key, value
+                                 in self.request.session.items()
+                                 if key.startswith(prefix))
+        return (self.__class__.__module__,
+                self.__class__.__name__,
+                table_name,
+                tuple(sorted(self.tab_group.kwargs.items())),
+                self.request.GET.urlencode(),
+                tuple(session_filters))
+
     def get_context_data(self, request, **kwargs):
         """Adds a ``{{ table_name }}_table`` item to the context for each table
         in the :attr:`~horizon.tabs.TableTab.table_classes` attribute.
@@ -14,15 +14,22 @@
 
 from __future__ import absolute_import
 
+import hashlib
+
 from horizon.contrib import bootstrap_datepicker
 
 from django.conf import settings
+from django.core.cache import cache
 from django import template
+from django.template.loader import render_to_string
 from django.utils.datastructures import SortedDict
+from django.utils.encoding import force_bytes
 from django.utils.encoding import force_text
+from django.utils.safestring import mark_safe
 from django.utils import translation
 from django.utils.translation import ugettext_lazy as _
 
+from horizon import base
 from horizon.base import Horizon  # noqa
 from horizon import conf
 
@@ -44,42 +51,99 @@ def has_permissions_on_list(components, user):
             in components if has_permissions(user, component)]
 
 
-@register.inclusion_tag('horizon/_accordion_nav.html', takes_context=True)
+def _is_visible(component, context):
+    if callable(component.nav):
+        return component.nav(context) and component.can_access(context)
+    return component.nav and component.can_access(context)
+
+
+def _build_nav_tree(context):
+    """Returns the slugs of the dashboards, panel groups and panels shown."""
+    tree = []
+    for dash in Horizon.get_dashboards():
+        groups = []
+        for group in dash.get_panel_groups().values():
+            panels = [panel.slug for panel in group
+                      if _is_visible(panel, context)]
+            if panels:
+                groups.append((group.slug, panels))
+        if _is_visible(dash, context):
+            tree.append((dash.slug, groups))
+    return tree
+
+
+def _get_registry_signature():
+    return tuple((dash.slug,
+                  tuple((group.slug, tuple(panel.slug for panel in group))
+                        for group in dash.get_panel_groups().values()))
+                 for dash in Horizon.get_dashboards())
+
+
+def _get_nav_tree(context, cache_key):
+    if cache_key is None:
+        return _build_nav_tree(context)
+    tree = cache.get(cache_key)
+    if tree is None:
+        tree = _build_nav_tree(context)
+        cache.set(cache_key, tree,
+                  getattr(settings, 'NAVIGATION_CACHE_TIMEOUT', 600))
+    return tree
+
+
+@register.simple_tag(takes_context=True)
 def horizon_nav(context):
+    """Renders the accordion navigation of all the dashboards.
+
+    Computing which dashboards and panels a user may see is expensive, so
+    both the resulting structure and the rendered fragment are kept in the
+    Django cache, see ``NAVIGATION_CACHE_TIMEOUT``.
+    """
     if 'request' not in context:
-        return {}
-    current_dashboard = context['request'].horizon.get('dashboard', None)
-    current_panel_group = None
-    current_panel = context['request'].horizon.get('panel', None)
+        return ''
+    request = context['request']
+    current_dashboard = request.horizon.get('dashboard', None)
+    current_panel = request.horizon.get('panel', None)
+    nav_key = base.nav_cache_key(request)
+    tree_key = fragment_key = None
+    if nav_key:
+        # The navigation of a dashboard may depend on whether it is the
+        # current one, e.g. the Settings dashboard is only shown in itself.
+        tree_key = 'horizon:nav_tree:%s' % hashlib.md5(force_bytes(repr((
+            nav_key,
+            _get_registry_signature(),
+            getattr(current_dashboard, 'slug', None))))).hexdigest()
+        fragment_key = 'horizon:nav_html:%s' % hashlib.md5(force_bytes(repr((
+            tree_key,
+            getattr(current_panel, 'slug', None),
+            translation.get_language())))).hexdigest()
+        html = cache.get(fragment_key)
+        if html is not None:
+            return mark_safe(html)
+
     dashboards = []
-    for dash in Horizon.get_dashboards():
+    for dash_slug, groups in _get_nav_tree(context, tree_key):
+        dash = Horizon.get_dashboard(dash_slug)
         panel_groups = dash.get_panel_groups()
-        non_empty_groups = []
-        for group in panel_groups.values():
-            allowed_panels = []
-            for panel in group:
-                if (callable(panel.nav) and panel.nav(context) and
-                        panel.can_access(context)):
-                    allowed_panels.append(panel)
-                elif (not callable(panel.nav) and panel.nav and
-                        panel.can_access(context)):
-                    allowed_panels.append(panel)
-                if panel == current_panel:
-                    current_panel_group = group.name
-            if allowed_panels:
-                non_empty_groups.append((group.name, allowed_panels))
-        if (callable(dash.nav) and dash.nav(context) and
-                dash.can_access(context)):
-            dashboards.append((dash, SortedDict(non_empty_groups)))
-        elif (not callable(dash.nav) and dash.nav and
-                dash.can_access(context)):
-            dashboards.append((dash, SortedDict(non_empty_groups)))
-    return {'components': dashboards,
-            'user': context['request'].user,
-            'current': current_dashboard,
-            'current_panel_group': current_panel_group,
-            'current_panel': current_panel.slug if current_panel else '',
-            'request': context['request']}
+        dashboards.append((dash, SortedDict(
+            (panel_groups[group_slug].name,
+             [dash.get_panel(panel_slug) for panel_slug in panels])
+            for group_slug, panels in groups)))
+    current_panel_group = None
+    if current_dashboard is not None:
+        for group in current_dashboard.get_panel_groups().values():
+            if current_panel in group:
+                current_panel_group = group.name
+    html = render_to_string('horizon/_accordion_nav.html', {
+        'components': dashboards,
+        'user': request.user,
+        'current': current_dashboard,
+        'current_panel_group': current_panel_group,
+        'current_panel': current_panel.slug if current_panel else '',
+        'request': request})
+    if fragment_key:
+        cache.set(fragment_key, html,
+                  getattr(settings, 'NAVIGATION_CACHE_TIMEOUT', 600))
+    return mark_safe(html)
 
 
 @register.inclusion_tag('horizon/_nav_list.html', takes_context=True)
@@ -13,15 +13,21 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+import time
+
 from django.core.urlresolvers import reverse
 from django import forms
 from django import http
 from django import shortcuts
 from django.template import defaultfilters
+from django.test.utils import override_settings
 
 from mox import IsA  # noqa
 
+from horizon import exceptions
 from horizon import tables
+from horizon.tables import cache as table_cache
 from horizon.tables import formset as table_formset
 from horizon.tables import views as table_views
 from horizon.test import helpers as test
@@ -309,6 +315,14 @@ class NoActionsTable(tables.DataTable):
         row_actions = ()
 
 
+class MyPaginatedTable(MyTable):
+    class Meta(object):
+        name = "my_table"
+        columns = ('id', 'name', 'value', 'status')
+        table_actions = (MyFilterAction,)
+        paginate = True
+
+
 class DisabledActionsTable(tables.DataTable):
     id = tables.Column('id')
 
@@ -608,6 +622,8 @@ class DataTableTests(test.TestCase):
         update_string = "action=row_update&amp;table=my_table&amp;obj_id="
         self.assertContains(resp, update_string, 3)
         self.assertContains(resp, "data-update-interval", 3)
+        self.assertContains(resp, 'data-rows-update-url="?action=rows_update'
+                                  '&amp;table=my_table"', 1)
         # Verify no table heading
         self.assertNotContains(resp, "<h3 class='table_title'")
         # Verify our XSS protection
@@ -959,6 +975,21 @@ class DataTableTests(test.TestCase):
         self.assertContains(resp, "my_table__row__1")
         self.assertContains(resp, "status_down")
 
+        # Updating several rows at once
+        params = {"table": "my_table", "action": "rows_update",
+                  "obj_id": ["1", "2"]}
+        req = self.factory.get('/my_url/',
+                               params,
+                               HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.table = MyTable(req)
+        resp = self.table.maybe_preempt()
+        self.assertEqual(200, resp.status_code)
+        rows = json.loads(resp.content)['rows']
+        self.assertEqual(['1', '2'], sorted(rows.keys()))
+        self.assertIn("status_down", rows['1'])
+        self.assertEqual('/my_url/?action=rows_update&table=my_table',
+                         self.table.get_rows_update_url())
+
         # Verify that we don't get a response for a valid action with the
         # wrong method.
         params = {"table": "my_table", "action": "delete", "obj_id": "1"}
@@ -1304,6 +1335,90 @@ class DataTableTests(test.TestCase):
         resp = http.HttpResponse(table.render())
         self.assertContains(resp, value)
 
+    def _paginated_table(self, query=''):
+        req = self.factory.get('/my_url/' + query)
+        req.session['horizon_pagesize'] = 2
+        return MyPaginatedTable(req, TEST_DATA)
+
+    def test_pagination(self):
+        table = self._paginated_table()
+        self.assertQuerysetEqual(table.paginated_data,
+                                 ['<FakeObject: object_1>',
+                                  '<FakeObject: object_2>'])
+        self.assertEqual(2, len(table.get_rows()))
+        self.assertFalse(table.has_prev_data())
+        self.assertTrue(table.has_more_data())
+        self.assertEqual('marker=2', table.get_pagination_string())
+
+        table = self._paginated_table('?marker=2')
+        self.assertQuerysetEqual(table.paginated_data,
+                                 ['<FakeObject: object_3>'])
+        self.assertTrue(table.has_prev_data())
+        self.assertFalse(table.has_more_data())
+        self.assertEqual('prev_marker=3', table.get_prev_pagination_string())
+
+        table = self._paginated_table('?prev_marker=3')
+        self.assertQuerysetEqual(table.paginated_data,
+                                 ['<FakeObject: object_1>',
+                                  '<FakeObject: object_2>'])
+
+        # Markers at either end show the last or the first page, e.g. once
+        # the rows after the marker were deleted.
+        table = self._paginated_table('?marker=3')
+        self.assertQuerysetEqual(table.paginated_data,
+                                 ['<FakeObject: object_2>',
+                                  '<FakeObject: object_3>'])
+        self.assertTrue(table.has_prev_data())
+        self.assertFalse(table.has_more_data())
+        self.assertEqual('prev_marker=2', table.get_prev_pagination_string())
+        resp = http.HttpResponse(table.render())
+        self.assertContains(resp, 'prev_marker=2')
+        table = self._paginated_table('?prev_marker=1')
+        self.assertQuerysetEqual(table.paginated_data,
+                                 ['<FakeObject: object_1>',
+                                  '<FakeObject: object_2>'])
+        self.assertFalse(table.has_prev_data())
+        self.assertEqual('marker=2', table.get_pagination_string())
+
+        # Unknown markers go back to the first page.
+        table = self._paginated_table('?marker=unknown')
+        self.assertQuerysetEqual(table.paginated_data,
+                                 ['<FakeObject: object_1>',
+                                  '<FakeObject: object_2>'])
+
+    def test_pagination_sorting(self):
+        table = self._paginated_table('?sort=-value')
+        self.assertEqual('-value', table.get_sort())
+        self.assertQuerysetEqual(table.paginated_data,
+                                 ['<FakeObject: object_3>',
+                                  '<FakeObject: object_1>'])
+        self.assertEqual('marker=1&sort=-value',
+                         table.get_pagination_string())
+        self.assertEqual('sort=value',
+                         table.columns['value'].get_sort_string())
+        self.assertEqual('sort=name',
+                         table.columns['name'].get_sort_string())
+        self.assertNotIn('sortable', table.columns['value'].classes)
+
+        # Columns which are not sortable are ignored.
+        table = self._paginated_table('?sort=id')
+        self.assertIsNone(table.get_sort())
+
+    def test_pagination_query_filter(self):
+        filter_param = "my_table__filter__q"
+        table = self._paginated_table('?%s=object' % filter_param)
+        self.assertEqual(3, len(table.filtered_data))
+        self.assertEqual('marker=2&%s=object' % filter_param,
+                         table.get_pagination_string())
+
+        table = self._paginated_table('?%s=3' % filter_param)
+        self.assertQuerysetEqual(table.paginated_data,
+                                 ['<FakeObject: object_3>'])
+        self.assertFalse(table.has_more_data())
+        resp = http.HttpResponse(table.render())
+        self.assertNotContains(resp, 'table_search client')
+        self.assertContains(resp, 'sort=value"')
+
 
 class SingleTableView(table_views.DataTableView):
     table_class = MyTable
@@ -1319,6 +1434,37 @@ class APIFilterTableView(SingleTableView):
     table_class = MyServerFilterTable
 
 
+class CachedTableView(SingleTableView):
+    cache_data = True
+    loaded = None
+
+    def get_data(self):
+        self.loaded.append(self.request.GET.get('marker'))
+        if len(self.loaded) > 1:
+            return TEST_DATA_2
+        return TEST_DATA
+
+    def has_more_data(self, table):
+        return len(self.loaded) == 1
+
+
+class CachedErrorTableView(CachedTableView):
+    def get_data(self):
+        self.loaded.append(self.request.GET.get('marker'))
+        if len(self.loaded) == 1:
+            try:
+                raise exceptions.NotAvailable('data')
+            except Exception:
+                exceptions.handle(self.request, ignore=True)
+            return []
+        return TEST_DATA
+
+
+class RequestBoundObject(object):
+    def __init__(self, request):
+        self.request = request
+
+
 class TableWithPermissions(tables.DataTable):
     id = tables.Column('id')
 
@@ -1384,6 +1530,95 @@ class DataTableViewTests(test.TestCase):
         self.assertEqual(TableWithPermissions,
                          context['table_with_permissions_table'].__class__)
 
+    def _load_cached_view(self, query='', view_class=CachedTableView):
+        view = self._prepare_view(view_class)
+        view.request.GET = http.QueryDict(query)
+        view.loaded = self.loaded
+        view.construct_tables()
+        return view.get_table()
+
+    def test_cached_data_table_view(self):
+        self.loaded = []
+        table_cache.clear()
+        self.addCleanup(table_cache.clear)
+
+        table = self._load_cached_view()
+        self.assertEqual(TEST_DATA, tuple(table.data))
+        self.assertTrue(table.has_more_data())
+        # The data and the paging information come from the cache.
+        table = self._load_cached_view()
+        self.assertEqual(TEST_DATA, tuple(table.data))
+        self.assertTrue(table.has_more_data())
+        self.assertEqual([None], self.loaded)
+        # Other pages are cached separately.
+        self._load_cached_view('marker=3')
+        self.assertEqual([None, '3'], self.loaded)
+
+        table_cache.invalidate(self.request)
+        table = self._load_cached_view()
+        self.assertEqual(TEST_DATA_2, tuple(table.data))
+        self.assertFalse(table.has_more_data())
+        self.assertEqual([None, '3', None], self.loaded)
+
+    def test_cached_data_table_view_stale(self):
+        self.loaded = []
+        table_cache.clear()
+        self.addCleanup(table_cache.clear)
+
+        self._load_cached_view()
+        for key, (timestamp, value) in table_cache._entries.items():
+            table_cache._entries[key] = (timestamp - 30, value)
+        # Outdated data is served while it is refreshed in the background.
+        table = self._load_cached_view()
+        self.assertEqual(TEST_DATA, tuple(table.data))
+        for i in range(100):
+            if not table_cache._refreshing:
+                break
+            time.sleep(0.01)
+        self.assertEqual([None, None], self.loaded)
+        table = self._load_cached_view()
+        self.assertEqual(TEST_DATA_2, tuple(table.data))
+
+    def test_cached_data_table_view_error(self):
+        self.loaded = []
+        table_cache.clear()
+        self.addCleanup(table_cache.clear)
+
+        # Data loaded while an error was handled is not cached.
+        table = self._load_cached_view(view_class=CachedErrorTableView)
+        self.assertEqual([], list(table.data))
+        table = self._load_cached_view(view_class=CachedErrorTableView)
+        self.assertEqual(TEST_DATA, tuple(table.data))
+        table = self._load_cached_view(view_class=CachedErrorTableView)
+        self.assertEqual(TEST_DATA, tuple(table.data))
+        self.assertEqual([None, None], self.loaded)
+
+    def test_cached_table_data_request(self):
+        table_cache.clear()
+        self.addCleanup(table_cache.clear)
+        request = self.factory.get('/my_url/')
+        request.user = self.user
+        other_request = self.factory.get('/my_url/')
+        other_request.user = self.user
+
+        def loader():
+            return [RequestBoundObject(request)], False, False
+
+        data = table_cache.get_table_data(request, 'key', loader)[0]
+        self.assertIs(request, data[0].request)
+        # The cached objects do not keep the request they were loaded for.
+        for timestamp, value in table_cache._entries.values():
+            self.assertIsNone(value[0][0].request)
+        data = table_cache.get_table_data(other_request, 'key', loader)[0]
+        self.assertIs(other_request, data[0].request)
+
+    @override_settings(TABLE_DATA_CACHE={'timeout': 0})
+    def test_cached_data_table_view_disabled(self):
+        self.loaded = []
+        self._load_cached_view()
+        self._load_cached_view()
+        self.assertEqual([None, None], self.loaded)
+
     fil_value_param = "my_table__filter__q"
     fil_field_param = '%s_field' % fil_value_param
 
@@ -1409,6 +1644,17 @@ class DataTableViewTests(test.TestCase):
         self.assertEqual(req.session.get(self.fil_value_param), 'up')
         self.assertEqual(req.session.get(self.fil_field_param), 'status')
 
+    def test_api_filter_table_view_api_filters(self):
+        req = self.factory.post('/my_url/', {self.fil_value_param: 'up',
+                                             self.fil_field_param: 'status'})
+        req.user = self.user
+        view = self._test_filter_setup_view(req)
+        self.assertEqual({'status': 'up'}, view.get_api_filters())
+
+        # The name choice is not an API filter.
+        req.session[self.fil_field_param] = 'name'
+        self.assertIsNone(view.get_api_filters())
+
     def test_filter_changed_deleted(self):
         req = self.factory.post('/my_url/', {self.fil_value_param: '',
                                              self.fil_field_param: 'status'})
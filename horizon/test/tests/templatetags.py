@@ -19,10 +19,13 @@
 import re
 
 from django.conf import settings
+from django.core.cache import cache
 from django.template import Context  # noqa
 from django.template import Template  # noqa
 from django.utils.text import normalize_newlines  # noqa
 
+from horizon import base
+from horizon.templatetags import horizon as horizon_tags
 from horizon.test import helpers as test
 from horizon.test.test_dashboards.cats.dashboard import Cats  # noqa
 from horizon.test.test_dashboards.cats.kittens.panel import Kittens  # noqa
@@ -128,3 +131,34 @@ class TemplateTagTests(test.TestCase):
                                             template_text=text,
                                             context={'request': self.request})
         self.assertEqual(single_line(rendered_str), single_line(expected))
+
+    def test_horizon_nav_cached(self):
+        cache.clear()
+        self.set_permissions(permissions=['test'])
+        cats = horizon_tags.Horizon.get_dashboard('cats')
+        self.request.session['token'] = 'token'
+        self.request.horizon['dashboard'] = cats
+        self.request.horizon['panel'] = cats.get_panel('kittens')
+        text = "{% horizon_nav %}"
+        rendered_str = self.render_template(tag_require='horizon',
+                                            template_text=text,
+                                            context={'request': self.request})
+        self.assertIn('href="/cats/" class="active"', rendered_str)
+        self.assertIn('href="/cats/tigers/" ', rendered_str)
+        self.assertIn('href="/dogs/" ', rendered_str)
+        self.assertNotIn('allowed', self.request.session)
+
+        # The access checks are neither repeated for another request with
+        # the same token nor for another panel of the same dashboard.
+        self.mox.StubOutWithMock(base.HorizonComponent, 'allowed')
+        self.mox.ReplayAll()
+        self._setup_request()
+        self.request.user = self.user
+        self.request.session['token'] = 'token'
+        self.request.horizon = {'dashboard': cats,
+                                'panel': cats.get_panel('tigers')}
+        rendered_str = self.render_template(tag_require='horizon',
+                                            template_text=text,
+                                            context={'request': self.request})
+        self.assertIn('href="/cats/tigers/" class="active"', rendered_str)
+        self.assertNotIn('href="/cats/" class="active"', rendered_str)
@@ -104,40 +104,64 @@ if VERSION >= (1, 5, 0):
     class BaseCsvStreamingResponse(CsvDataMixin, StreamingHttpResponse):
 
         """Base CSV Streaming class. Provides streaming response for CSV data.
+
+        .. attribute:: chunk_size
+
+            The number of rows sent to the client at once. It can also be
+            given as the ``chunk_size`` keyword argument. Defaults to 100.
+
+        The header template and the rows are only rendered once the
+        response is streamed; :meth:`load_data` is called before, so that
+        loading the data does not delay the response headers.
         """
 
+        chunk_size = 100
+
         def __init__(self, request, template, context, content_type, **kwargs):
             super(BaseCsvStreamingResponse, self).__init__()
             self['Content-Disposition'] = 'attachment; filename="%s"' % (
                 kwargs.get("filename", "export.csv"),)
             self['Content-Type'] = content_type
+            self.chunk_size = kwargs.get("chunk_size", self.chunk_size)
             self.context = context
             self.header = None
-            if template:
-                # Display some header info if provided as a template
-                header_template = django_template.loader.get_template(template)
-                context = django_template.RequestContext(request, self.context)
-                self.header = header_template.render(context)
 
             self._closable_objects.append(self.out)
 
-            self.streaming_content = self.get_content()
+            self.streaming_content = self.get_content(request, template,
+                                                      context)
 
         def buffer(self):
             buf = self.out.getvalue()
-            self.out.truncate(0)
+            self.out.seek(0)
+            self.out.truncate()
             return buf
 
-        def get_content(self):
+        def load_data(self):
+            pass
+
+        def get_content(self, request, template, context):
+            # Test clients replace the context attribute of the response
+            # before the content is consumed.
+            self.context = context
+            self.load_data()
+            if template:
+                # Display some header info if provided as a template
+                header_template = django_template.loader.get_template(template)
+                context = django_template.RequestContext(request, self.context)
+                self.header = header_template.render(context)
             if self.header:
                 self.out.write(self.encode(self.header))
 
             self.write_csv_header()
-            yield self.buffer()
 
+            rows = 0
             for row in self.get_row_data():
                 self.write_csv_row(row)
-                yield self.buffer()
+                rows += 1
+                if rows % self.chunk_size == 0:
+                    yield self.buffer()
+            yield self.buffer()
 
         def get_row_data(self):
             return []
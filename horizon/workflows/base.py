@@ -469,9 +469,19 @@ class UpdateMembersStep(Step):
 
         The placeholder text used when the members list is empty.
 
+    .. attribute:: search_url
+
+        The URL of a view returning, as JSON, a page of the entities which
+        match the ``search`` query parameter, after the ``marker`` one:
+        ``{"items": [{"id": ..., "name": ...}], "has_more": ...}``. When
+        set, the available list is loaded from it as the user types in its
+        filter, so that the choices of the form fields only need to hold
+        the current members. Defaults to ``None``.
+
     """
     template_name = "horizon/common/_workflow_step_update_members.html"
     show_roles = True
+    search_url = None
     available_list_title = _("All available")
     members_list_title = _("Members")
     no_available_text = _("None available.")
@@ -26,6 +26,7 @@ from horizon import exceptions
 from horizon.forms import views as hz_views
 from horizon.forms.views import ADD_TO_FIELD_HEADER  # noqa
 from horizon import messages
+from horizon.tables import cache as table_cache
 
 
 class WorkflowView(hz_views.ModalBackdropMixin, generic.TemplateView):
@@ -196,6 +197,7 @@ class WorkflowView(hz_views.ModalBackdropMixin, generic.TemplateView):
             success = False
             exceptions.handle(request)
         if success:
+            table_cache.invalidate(request)
             msg = workflow.format_status_message(workflow.success_message)
             messages.success(request, msg)
         else:
@@ -17,6 +17,9 @@
 #    under the License.
 
 from collections import Sequence  # noqa
+import copy
+import functools
+import hashlib
 import logging
 
 from django.conf import settings
@@ -26,6 +29,16 @@ from horizon import exceptions
 import six
 
 
+try:
+    from django.core.cache import caches
+
+    def _get_cache(alias):
+        return caches[alias]
+except ImportError:
+    # Django < 1.7
+    from django.core.cache import get_cache as _get_cache  # noqa
+
+
 __all__ = ('APIResourceWrapper', 'APIDictWrapper',
            'get_service_from_catalog', 'url_for',)
 
@@ -343,6 +356,93 @@ def is_service_enabled(request, service_type, service_name=None):
     return False
 
 
+def capability_cached(*service_types):
+    """Decorator caching a service capability lookup across requests.
+
+    Extension listings and similar capability checks only change when the
+    service itself is reconfigured, so there is no point in asking for them
+    on every page view. The decorated function must take the request as its
+    first argument and return a picklable value. The result is stored in the
+    Django cache configured by ``OPENSTACK_CAPABILITY_CACHE``, keyed on the
+    function, its remaining arguments and the endpoint URL (of the first of
+    ``service_types`` found in the catalog) and region of the request.
+    """
+    def decorator(func):
+        name = '%s.%s' % (func.__module__, func.__name__)
+
+        def get_endpoint(request):
+            for service_type in service_types:
+                try:
+                    return url_for(request, service_type)
+                except exceptions.ServiceCatalogException:
+                    continue
+            return None
+
+        @functools.wraps(func)
+        def wrapped(request, *args, **kwargs):
+            config = getattr(settings, 'OPENSTACK_CAPABILITY_CACHE', {})
+            timeout = config.get('timeout', 3600)
+            endpoint = get_endpoint(request) if timeout else None
+            if endpoint is None:
+                return func(request, *args, **kwargs)
+            region = request.user.services_region
+            key = repr((name, endpoint, region, args,
+                        sorted(six.iteritems(kwargs))))
+            # Memcached keys may not contain whitespace and are limited in
+            # length, so use a digest of the actual key.
+            key = 'capability:%s' % hashlib.sha1(
+                key.encode('utf-8')).hexdigest()
+            cache = _get_cache(config.get('backend', 'default'))
+            value = cache.get(key)
+            if value is None:
+                value = func(request, *args, **kwargs)
+                cache.set(key, value, timeout)
+            return value
+        return wrapped
+    return decorator
+
+
+def build_resources(manager, infos):
+    """Builds resources of ``manager`` from their cached ``_info`` dicts.
+
+    The resources are built from deep copies of the dicts, so that changing
+    a resource, or a nested value such as its ``properties``, does not
+    change the cached copy shared with other requests.
+    """
+    return [manager.resource_class(manager, copy.deepcopy(info), loaded=True)
+            for info in infos]
+
+
+def resource_list_cached(request, name, service_type, fetch, get_manager,
+                         per_project=False):
+    """Returns the resources listed by ``fetch()``, cached across requests.
+
+    Read-only catalogs such as flavors or availability zones change rarely,
+    yet they are listed every time a form offering them is displayed. Their
+    ``_info`` dicts are kept for ``timeout`` seconds in the Django cache
+    configured by ``RESOURCE_LIST_CACHE``, keyed on ``name``, the endpoint
+    URL of ``service_type`` and the region of the request and, with
+    ``per_project``, its project. The resources are rebuilt from them with
+    the resource class of the manager returned by ``get_manager()``.
+    """
+    config = {'backend': 'default', 'timeout': 30}
+    config.update(getattr(settings, 'RESOURCE_LIST_CACHE', {}))
+    if not config['timeout']:
+        return fetch()
+    key = repr((name, url_for(request, service_type),
+                request.user.services_region,
+                request.user.project_id if per_project else None))
+    key = 'resource_list:%s' % hashlib.sha1(key.encode('utf-8')).hexdigest()
+    cache = _get_cache(config['backend'])
+    infos = cache.get(key)
+    if infos is None:
+        resources = fetch()
+        cache.set(key, [resource._info for resource in resources],
+                  config['timeout'])
+        return resources
+    return build_resources(get_manager(), infos)
+
+
 def _get_endpoint_region(endpoint):
     """Common function for getting the region from endpoint.
 
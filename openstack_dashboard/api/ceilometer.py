@@ -10,12 +10,15 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import datetime
+import hashlib
 import logging
-import threading
 
 from ceilometerclient import client as ceilometer_client
+from ceilometerclient.v2 import statistics as ceilometer_statistics
 from django.conf import settings
 from django.utils import datastructures
+from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
@@ -24,6 +27,7 @@ from horizon.utils.memoized import memoized  # noqa
 from openstack_dashboard.api import base
 from openstack_dashboard.api import keystone
 from openstack_dashboard.api import nova
+from openstack_dashboard.utils import concurrency
 
 LOG = logging.getLogger(__name__)
 
@@ -309,19 +313,94 @@ def statistic_list(request, meter_name, query=None, period=None):
     return [Statistic(s) for s in statistics]
 
 
-class ThreadedUpdateResourceWithStatistics(threading.Thread):
-    """Multithread wrapper for update_with_statistics method of
+DAY = 3600 * 24
+
+
+def _day_start(date):
+    return date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def statistic_list_daily(request, meter_name, query, date_from, date_to):
+    """List of daily statistics between date_from and date_to.
+
+    The periods are aligned to midnight UTC, so the statistics of a day
+    are the same whatever the requested range is. The statistics of days
+    which are over, by more than ``settle_time`` seconds, are kept in the
+    Django cache configured by ``CEILOMETER_STATISTICS_CACHE`` and shared
+    by all the requests for the same meter and query. Only the days which
+    are not cached, typically just the current one, are fetched, with a
+    single statistics call.
+    """
+    config = {'backend': 'default', 'timeout': DAY * 30, 'settle_time': 3600}
+    config.update(getattr(settings, 'CEILOMETER_STATISTICS_CACHE', {}))
+    query = list(query or [])
+    if not config['timeout'] or not date_from or not date_to:
+        if date_from:
+            query.append({'field': 'timestamp', 'op': 'ge',
+                          'value': date_from})
+        if date_to:
+            query.append({'field': 'timestamp', 'op': 'le',
+                          'value': date_to})
+        return statistic_list(request, meter_name, query=query, period=DAY)
+
+    days = [_day_start(date_from)]
+    while days[-1] + datetime.timedelta(days=1) <= date_to:
+        days.append(days[-1] + datetime.timedelta(days=1))
+    closed_before = min(timezone.now() -
+                        datetime.timedelta(seconds=config['settle_time']),
+                        date_to + datetime.timedelta(seconds=1))
+    prefix = repr((base.url_for(request, 'metering'), meter_name,
+                   sorted(repr(condition) for condition in query)))
+    keys = dict((day, 'ceilometer_statistics:%s' % hashlib.sha1(
+        (prefix + day.isoformat()).encode('utf-8')).hexdigest())
+        for day in days)
+    cache = base._get_cache(config['backend'])
+    cached = cache.get_many([keys[day] for day in days
+                             if day + datetime.timedelta(days=1) <=
+                             closed_before])
+
+    by_day = {}
+    missing = [day for day in days if keys[day] not in cached]
+    if missing:
+        fetch_query = query + [
+            {'field': 'timestamp', 'op': 'ge', 'value': missing[0]},
+            {'field': 'timestamp', 'op': 'le', 'value': date_to}]
+        for statistic in statistic_list(request, meter_name,
+                                        query=fetch_query, period=DAY):
+            info = statistic._apiresource.to_dict()
+            by_day.setdefault(info['period_start'][:10], []).append(info)
+        for day in missing:
+            if day + datetime.timedelta(days=1) <= closed_before:
+                # Days without any samples are cached too, so that they
+                # are not asked for again.
+                cache.set(keys[day], by_day.get(day.strftime('%Y-%m-%d'), []),
+                          config['timeout'])
+
+    result = []
+    for day in days:
+        infos = cached.get(keys[day])
+        if infos is None:
+            infos = by_day.get(day.strftime('%Y-%m-%d'), [])
+        result.extend(Statistic(ceilometer_statistics.Statistics(
+            None, info, loaded=True)) for info in infos)
+    return result
+
+
+class ThreadedUpdateResourceWithStatistics(object):
+    """Concurrent wrapper for update_with_statistics method of
     resource_usage.
 
-    A join logic is placed in process_list class method. All resources
-    will have its statistics attribute filled in separate threads.
+    The process_list class method fills the statistics attribute of all
+    resources using the shared worker pool of
+    :mod:`openstack_dashboard.utils.concurrency`. At most
+    ``API_CONCURRENCY_PER_REQUEST`` resources are processed at once for one
+    request, and the remaining ones are cancelled as soon as one of them
+    fails.
 
-    The resource_usage object is shared between threads. Each thread is
+    The resource_usage object is shared between the calls. Each call is
     updating one Resource.
 
     :Parameters:
-      - `resource`: Resource or ResourceAggregate object, that will
-                    be filled by statistic data.
       - `resources`: List of Resource or ResourceAggregate object,
                      that will be filled by statistic data.
       - `resource_usage`: Wrapping resource usage object, that holds
@@ -332,49 +411,28 @@ class ThreadedUpdateResourceWithStatistics(threading.Thread):
                   returned, divided into given periods. Periods with no
                   data are ignored.
       - `stats_attr`: String representing the attribute name of the stats.
-                      E.g. (avg, max, min...) If None is given, whole
-                      statistic object is returned,
+                      E.g. (avg, max, min...) If None is given,
+                      whole statistic object is returned,
       - `additional_query`: Additional query for the statistics.
                             E.g. timespan, etc.
+      - `date_range`: Tuple of the first and last date of daily
+                      statistics, see `statistic_list_daily`.
     """
     # TODO(lsmola) Can be removed once Ceilometer supports sample-api
     # and group-by, so all of this optimization will not be necessary.
     # It is planned somewhere to I.
 
-    def __init__(self, resource_usage, resource, meter_names=None,
-                 period=None, filter_func=None, stats_attr=None,
-                 additional_query=None):
-        super(ThreadedUpdateResourceWithStatistics, self).__init__()
-        self.resource_usage = resource_usage
-        self.resource = resource
-        self.meter_names = meter_names
-        self.period = period
-        self.stats_attr = stats_attr
-        self.additional_query = additional_query
-
-    def run(self):
-        # Run the job
-        self.resource_usage.update_with_statistics(
-            self.resource,
-            meter_names=self.meter_names, period=self.period,
-            stats_attr=self.stats_attr, additional_query=self.additional_query)
-
     @classmethod
     def process_list(cls, resource_usage, resources, meter_names=None,
                      period=None, filter_func=None, stats_attr=None,
-                     additional_query=None):
-        threads = []
+                     additional_query=None, date_range=None):
+        def update(resource):
+            return resource_usage.update_with_statistics(
+                resource, meter_names=meter_names, period=period,
+                stats_attr=stats_attr, additional_query=additional_query,
+                date_range=date_range)
 
-        for resource in resources:
-            # add statistics data into resource
-            thread = cls(resource_usage, resource, meter_names=meter_names,
-                         period=period, stats_attr=stats_attr,
-                         additional_query=additional_query)
-            thread.start()
-            threads.append(thread)
-
-        for thread in threads:
-            thread.join()
+        concurrency.run_bounded(resource_usage._request, update, resources)
 
 
 class CeilometerUsage(object):
@@ -533,7 +591,8 @@ class CeilometerUsage(object):
                           resource_id=resource_id)
 
     def update_with_statistics(self, resource, meter_names=None, period=None,
-                               stats_attr=None, additional_query=None):
+                               stats_attr=None, additional_query=None,
+                               date_range=None):
         """Adding statistical data into one Resource or ResourceAggregate.
 
         It adds each statistic of each meter_names into the resource
@@ -555,6 +614,11 @@ class CeilometerUsage(object):
                           object.
           - `additional_query`: Additional query for the statistics.
                                 E.g. timespan, etc.
+          - `date_range`: Tuple of the first and last date of the
+                          statistics. If given, daily statistics are
+                          returned through `statistic_list_daily`, which
+                          caches the days that are over, and `period` is
+                          ignored.
         """
 
         if not meter_names:
@@ -569,14 +633,13 @@ class CeilometerUsage(object):
                                  " conditions. See the docs for format.")
             query = query + additional_query
 
-        # TODO(lsmola) thread for each meter will be probably overkill
-        # but I should test lets say thread pool with 100 of threads
-        # and apply it only to this code.
-        # Though I do expect Ceilometer will support bulk requests,
-        # so all of this optimization will not be necessary.
         for meter in meter_names:
-            statistics = statistic_list(self._request, meter,
-                                        query=query, period=period)
+            if date_range:
+                statistics = statistic_list_daily(self._request, meter,
+                                                  query, *date_range)
+            else:
+                statistics = statistic_list(self._request, meter,
+                                            query=query, period=period)
             meter = meter.replace(".", "_")
             if statistics:
                 if stats_attr:
@@ -622,7 +685,8 @@ class CeilometerUsage(object):
     def resources_with_statistics(self, query=None, meter_names=None,
                                   period=None, filter_func=None,
                                   stats_attr=None, additional_query=None,
-                                  with_users_and_tenants=False):
+                                  with_users_and_tenants=False,
+                                  date_range=None):
         """Obtaining resources with statistics data inside.
 
         :Parameters:
@@ -644,6 +708,8 @@ class CeilometerUsage(object):
                                 E.g. timespan, etc.
           - `with_users_and_tenants`: If true a user and a tenant object will
                                       be added to each resource object.
+          - `date_range`: Tuple of the first and last date of daily
+                          statistics, see `update_with_statistics`.
         """
 
         resources = self.resources(
@@ -653,7 +719,7 @@ class CeilometerUsage(object):
         ThreadedUpdateResourceWithStatistics.process_list(
             self, resources,
             meter_names=meter_names, period=period, stats_attr=stats_attr,
-            additional_query=additional_query)
+            additional_query=additional_query, date_range=date_range)
 
         return resources
 
@@ -677,7 +743,8 @@ class CeilometerUsage(object):
     def resource_aggregates_with_statistics(self, queries=None,
                                             meter_names=None, period=None,
                                             filter_func=None, stats_attr=None,
-                                            additional_query=None):
+                                            additional_query=None,
+                                            date_range=None):
         """Obtaining resource aggregates with statistics data inside.
 
         :Parameters:
@@ -696,13 +763,16 @@ class CeilometerUsage(object):
                           object.
           - `additional_query`: Additional query for the statistics.
                                 E.g. timespan, etc.
+          - `date_range`: Tuple of the first and last date of daily
+                          statistics, see `update_with_statistics`.
         """
         resource_aggregates = self.resource_aggregates(queries)
 
         ThreadedUpdateResourceWithStatistics.process_list(
             self,
             resource_aggregates, meter_names=meter_names, period=period,
-            stats_attr=stats_attr, additional_query=additional_query)
+            stats_attr=stats_attr, additional_query=additional_query,
+            date_range=date_range)
 
         return resource_aggregates
 
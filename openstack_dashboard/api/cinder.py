@@ -585,15 +585,17 @@ def list_extensions(request):
         .show_all()
 
 
+@memoized
+@base.capability_cached('volume', 'volumev2')
+def _list_extension_names(request):
+    return [extension.name for extension in list_extensions(request)]
+
+
 @memoized
 def extension_supported(request, extension_name):
     """This method will determine if Cinder supports a given extension name.
     """
-    extensions = list_extensions(request)
-    for extension in extensions:
-        if extension.name == extension_name:
-            return True
-    return False
+    return extension_name in _list_extension_names(request)
 
 
 def transfer_list(request, detailed=True, search_opts=None):
@@ -23,33 +23,47 @@ import itertools
 import json
 import logging
 import os
+import threading
+import time
 
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import InMemoryUploadedFile
-from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.files.uploadedfile import TemporaryUploadedFile
 
 
 import glanceclient as glance_client
-from six.moves import _thread as thread
+import six
 
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
 from openstack_dashboard.api import base
+from openstack_dashboard.utils import concurrency
+from openstack_dashboard.utils import http_pool
 
 
 LOG = logging.getLogger(__name__)
 VERSIONS = base.APIVersionManager("image", preferred_version=2)
 
+# How often, in seconds, the progress of an upload is published.
+UPLOAD_PROGRESS_INTERVAL = 1
+UPLOAD_PROGRESS_TIMEOUT = 3600 * 24
+
+_upload_pool = None
+_upload_pool_lock = threading.Lock()
+
 
 @memoized
 def glanceclient(request, version='1'):
     url = base.url_for(request, 'image')
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
-    return glance_client.Client(version, url, token=request.user.token.id,
-                                insecure=insecure, cacert=cacert)
+    client = glance_client.Client(version, url, token=request.user.token.id,
+                                  insecure=insecure, cacert=cacert)
+    session = client.http_client.session
+    http_pool.mount(session, url, verify=session.verify, cert=session.cert)
+    return client
 
 
 def image_delete(request, image_id):
@@ -125,6 +139,113 @@ def image_update(request, image_id, **kwargs):
                 LOG.warn(msg)
 
 
+class ImageUploadStream(object):
+    """A file-like object reading an image file while it is uploaded.
+
+    glanceclient reads the data in chunks of 64kB and sends each of them
+    straight away, so the image is never held in memory as a whole. The
+    number of bytes read is published as the progress of the upload of
+    ``image_id``, see :func:`image_upload_progress`.
+    """
+
+    def __init__(self, image_id, file_obj, size=None):
+        self.image_id = image_id
+        self.file = file_obj
+        self.size = size
+        self.uploaded = 0
+        self._published = 0
+
+    def read(self, size=-1):
+        chunk = self.file.read(size)
+        self.uploaded += len(chunk)
+        if time.time() - self._published >= UPLOAD_PROGRESS_INTERVAL:
+            self.publish('uploading')
+        return chunk
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self.file.seek(offset, whence)
+
+    def tell(self):
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+    def publish(self, status):
+        self._published = time.time()
+        cache.set(_upload_progress_key(self.image_id),
+                  {'status': status,
+                   'size': self.size,
+                   'uploaded': self.uploaded},
+                  UPLOAD_PROGRESS_TIMEOUT)
+
+
+def _upload_progress_key(image_id):
+    return 'glance:upload_progress:%s' % image_id
+
+
+def image_upload_progress(request, image_id):
+    """Returns the progress of the upload of an image by this dashboard.
+
+    The progress is a dict with the ``status`` of the upload, one of
+    ``queued``, ``uploading``, ``done`` or ``failed``, the ``size`` of the
+    image file and the number of bytes ``uploaded`` so far. ``None`` is
+    returned if the image was not uploaded through the dashboard.
+    """
+    return cache.get(_upload_progress_key(image_id))
+
+
+def get_upload_pool():
+    """Returns the worker pool the image data is uploaded with.
+
+    Its size is taken from the ``IMAGE_UPLOAD_WORKERS`` setting. Uploads
+    beyond it wait for one of the running ones to finish.
+    """
+    global _upload_pool
+    if _upload_pool is None:
+        with _upload_pool_lock:
+            if _upload_pool is None:
+                _upload_pool = concurrency.WorkerPool(
+                    getattr(settings, 'IMAGE_UPLOAD_WORKERS', 4))
+    return _upload_pool
+
+
+def _open_upload(data):
+    if isinstance(data, TemporaryUploadedFile):
+        # Django removes the temporary file once the request is finished,
+        # the file opened again stays readable until it is closed.
+        return open(data.temporary_file_path(), 'rb'), data.size
+    if isinstance(data, InMemoryUploadedFile):
+        # Take the buffer over instead of copying it, Django closes an
+        # empty one once the request is finished.
+        buf, data.file = data.file, six.BytesIO()
+        buf.seek(0)
+        return buf, data.size
+    return data, getattr(data, 'size', None)
+
+
+def _upload_data(request, stream):
+    stream.publish('uploading')
+    try:
+        glanceclient(request).images.update(stream.image_id, data=stream,
+                                            purge_props=False)
+    except Exception:
+        stream.publish('failed')
+        LOG.exception("Failed to upload the data of image %s.",
+                      stream.image_id)
+    else:
+        stream.publish('done')
+    finally:
+        stream.close()
+
+
+def _update_source(request, image_id, **kwargs):
+    try:
+        image_update(request, image_id, purge_props=False, **kwargs)
+    except Exception:
+        LOG.exception("Failed to set the source of image %s.", image_id)
+
+
 def image_create(request, **kwargs):
     copy_from = kwargs.pop('copy_from', None)
     data = kwargs.pop('data', None)
@@ -133,29 +254,15 @@ def image_create(request, **kwargs):
     image = glanceclient(request).images.create(**kwargs)
 
     if data:
-        if isinstance(data, TemporaryUploadedFile):
-            # Hack to fool Django, so we can keep file open in the new thread.
-            data.file.close_called = True
-        if isinstance(data, InMemoryUploadedFile):
-            # Clone a new file for InMemeoryUploadedFile.
-            # Because the old one will be closed by Django.
-            data = SimpleUploadedFile(data.name,
-                                      data.read(),
-                                      data.content_type)
-        thread.start_new_thread(image_update,
-                                (request, image.id),
-                                {'data': data,
-                                 'purge_props': False})
+        stream = ImageUploadStream(image.id, *_open_upload(data))
+        stream.publish('queued')
+        get_upload_pool().submit(_upload_data, request, stream)
     elif copy_from:
-        thread.start_new_thread(image_update,
-                                (request, image.id),
-                                {'copy_from': copy_from,
-                                 'purge_props': False})
+        get_upload_pool().submit(_update_source, request, image.id,
+                                 copy_from=copy_from)
     elif location:
-        thread.start_new_thread(image_update,
-                                (request, image.id),
-                                {'location': location,
-                                 'purge_props': False})
+        get_upload_pool().submit(_update_source, request, image.id,
+                                 location=location)
 
     return image
 
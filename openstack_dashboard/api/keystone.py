@@ -18,7 +18,10 @@
 #    under the License.
 
 import collections
+import hashlib
+import itertools
 import logging
+import uuid
 
 from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
@@ -35,6 +38,8 @@ from horizon.utils import functions as utils
 
 from openstack_dashboard.api import base
 from openstack_dashboard import policy
+from openstack_dashboard.utils import concurrency
+from openstack_dashboard.utils import http_pool
 
 
 LOG = logging.getLogger(__name__)
@@ -175,6 +180,11 @@ def keystoneclient(request, admin=False):
                                             cacert=cacert,
                                             auth_url=endpoint,
                                             debug=settings.DEBUG)
+        # The HTTP session of keystoneclient wraps a requests session.
+        session = getattr(conn, 'session', None)
+        if getattr(session, 'session', None) is not None:
+            http_pool.mount(session.session, endpoint,
+                            verify=session.verify, cert=session.cert)
         setattr(request, cache_attr, conn)
     return conn
 
@@ -211,11 +221,13 @@ def tenant_create(request, name, description=None, enabled=None,
                   domain=None, **kwargs):
     manager = VERSIONS.get_project_manager(request, admin=True)
     if VERSIONS.active < 3:
-        return manager.create(name, description, enabled, **kwargs)
+        project = manager.create(name, description, enabled, **kwargs)
     else:
-        return manager.create(name, domain,
-                              description=description,
-                              enabled=enabled, **kwargs)
+        project = manager.create(name, domain,
+                                 description=description,
+                                 enabled=enabled, **kwargs)
+    _invalidate_list_index('projects')
+    return project
 
 
 def get_default_domain(request):
@@ -251,7 +263,196 @@ def tenant_get(request, project, admin=True):
 
 def tenant_delete(request, project):
     manager = VERSIONS.get_project_manager(request, admin=True)
-    return manager.delete(project)
+    result = manager.delete(project)
+    _invalidate_list_index('projects')
+    return result
+
+
+# The number of resources stored in each chunk of a listing index.
+LIST_INDEX_CHUNK_SIZE = 500
+
+
+def _get_list_cache_config():
+    config = {'backend': 'default', 'timeout': 60}
+    config.update(getattr(settings, 'IDENTITY_LIST_CACHE', {}))
+    return config
+
+
+def _get_list_cache_key(*args):
+    key = repr((getattr(settings, 'OPENSTACK_KEYSTONE_URL', None),) + args)
+    return 'identity_list:%s' % hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def _invalidate_list_index(kind):
+    """Makes the listings of ``kind`` resources be indexed again."""
+    config = _get_list_cache_config()
+    if config['timeout']:
+        cache = base._get_cache(config['backend'])
+        # The indexes are keyed on the generation, which outlives them.
+        cache.set(_get_list_cache_key(kind, 'generation'),
+                  uuid.uuid4().hex, config['timeout'])
+
+
+def _matches(resource, filters):
+    return all(getattr(resource, name, None) == value
+               for name, value in (filters or {}).items())
+
+
+class _LocalStore(dict):
+    """Holds an index in memory when the cache is disabled."""
+
+    def get_many(self, keys):
+        return dict((key, self[key]) for key in keys if key in self)
+
+    def set(self, key, value, timeout=None):
+        self[key] = value
+
+    def set_many(self, data, timeout=None):
+        self.update(data)
+
+
+class _ListIndex(object):
+    """A listing of resources, sorted by name, stored in chunks.
+
+    Memcached does not store values larger than its item size limit, 1MB
+    by default, which the listing of a large domain exceeds. The resources
+    are therefore stored in chunks of ``LIST_INDEX_CHUNK_SIZE``, as are the
+    positions of their IDs, spread over as many chunks by the hash of the
+    IDs. A page needs at most three of them. Reading a chunk which was
+    evicted raises ``KeyError``.
+    """
+
+    def __init__(self, store, key, count):
+        self.store = store
+        self.key = key
+        self.count = count
+        self.chunk_count = max(1, -(-count // LIST_INDEX_CHUNK_SIZE))
+
+    @classmethod
+    def create(cls, store, key, infos, timeout=None):
+        index = cls(store, key, len(infos))
+        positions = [{} for i in range(index.chunk_count)]
+        for i, info in enumerate(infos):
+            positions[index._get_bucket(info['id'])][info['id']] = i
+        values = {}
+        for n in range(index.chunk_count):
+            start = n * LIST_INDEX_CHUNK_SIZE
+            values[index._get_key('infos', n)] = \
+                infos[start:start + LIST_INDEX_CHUNK_SIZE]
+            values[index._get_key('positions', n)] = positions[n]
+        store.set_many(values, timeout)
+        # The size is stored last, so that the index is only found once
+        # all of its chunks are stored.
+        store.set(key, len(infos), timeout)
+        return index
+
+    def _get_key(self, name, n):
+        return '%s:%s:%d' % (self.key, name, n)
+
+    def _get_bucket(self, resource_id):
+        digest = hashlib.md5(resource_id.encode('utf-8')).hexdigest()
+        return int(digest, 16) % self.chunk_count
+
+    def _get_chunks(self, keys):
+        values = self.store.get_many(keys)
+        return [values[key] for key in keys]
+
+    def get_position(self, resource_id):
+        """Returns the position of a resource, or ``None``."""
+        key = self._get_key('positions', self._get_bucket(resource_id))
+        return self._get_chunks([key])[0].get(resource_id)
+
+    def get_slice(self, start, stop):
+        stop = min(stop, self.count)
+        if start >= stop:
+            return []
+        first = start // LIST_INDEX_CHUNK_SIZE
+        last = (stop - 1) // LIST_INDEX_CHUNK_SIZE
+        chunks = self._get_chunks([self._get_key('infos', n)
+                                   for n in range(first, last + 1)])
+        infos = list(itertools.chain.from_iterable(chunks))
+        offset = first * LIST_INDEX_CHUNK_SIZE
+        return infos[start - offset:stop - offset]
+
+
+def _get_list_index(request, kind, manager, filters, cached=True,
+                    **kwargs):
+    """Returns the :class:`_ListIndex` of a listing, listing it if needed.
+
+    The listings depend on the roles of the user, so the indexes are kept
+    for the token they were listed with.
+    """
+    config = _get_list_cache_config()
+    if cached and config['timeout']:
+        store = base._get_cache(config['backend'])
+        timeout = config['timeout']
+        generation = store.get(_get_list_cache_key(kind, 'generation'))
+        key = _get_list_cache_key(kind, generation, request.user.token.id,
+                                  sorted(kwargs.items()),
+                                  sorted((filters or {}).items()))
+        count = store.get(key)
+        if count is not None:
+            return _ListIndex(store, key, count)
+    else:
+        store, key, timeout = _LocalStore(), kind, None
+    if VERSIONS.active < 3:
+        resources = [resource for resource in manager.list(**kwargs)
+                     if _matches(resource, filters)]
+    else:
+        if filters is not None:
+            kwargs.update(filters)
+        resources = manager.list(**kwargs)
+    infos = sorted((resource._info for resource in resources),
+                   key=lambda info: ((info.get('name') or '').lower(),
+                                     info['id']))
+    return _ListIndex.create(store, key, infos, timeout)
+
+
+def _get_index_page(index, marker, page_size, search):
+    if search:
+        search = search.lower()
+        infos = [info for info in index.get_slice(0, index.count)
+                 if search in (info.get('name') or '').lower() or
+                 search in (info.get('email') or '').lower()]
+        ids = [info['id'] for info in infos]
+        start = ids.index(marker) + 1 if marker in ids else 0
+        return (infos[start:start + page_size],
+                start + page_size < len(infos))
+    position = index.get_position(marker) if marker else None
+    start = position + 1 if position is not None else 0
+    return (index.get_slice(start, start + page_size),
+            start + page_size < index.count)
+
+
+def _paginate_list(request, kind, manager, marker=None, filters=None,
+                   search=None, **kwargs):
+    """Returns a page of the resources listed by ``manager``.
+
+    Keystone does not page its v3 listings, so every page view used to
+    list, and render, all of the projects or users of a domain. The
+    listing is instead sorted by name and kept, indexed by ID, for
+    ``timeout`` seconds in the Django cache configured by
+    ``IDENTITY_LIST_CACHE``, each page being sliced from it after the
+    ``marker`` ID. ``filters`` are applied by Keystone, except with the v2
+    API which does not support them, while ``search`` keeps the resources
+    whose name, or email, contains it, ignoring case. Returns the page and
+    whether there are more resources after it.
+    """
+    page_size = utils.get_page_size(request)
+    index = _get_list_index(request, kind, manager, filters, **kwargs)
+    try:
+        infos, has_more_data = _get_index_page(index, marker, page_size,
+                                               search)
+    except KeyError:
+        # A chunk of the index was evicted from the cache, or could not be
+        # stored in it.
+        index = _get_list_index(request, kind, manager, filters,
+                                cached=False, **kwargs)
+        infos, has_more_data = _get_index_page(index, marker, page_size,
+                                               search)
+    page = [manager.resource_class(manager, info, loaded=True)
+            for info in infos]
+    return page, has_more_data
 
 
 def tenant_list(request, paginate=False, marker=None, domain=None, user=None,
@@ -268,13 +469,23 @@ def tenant_list(request, paginate=False, marker=None, domain=None, user=None,
     # if requesting the projects for the current user,
     # return the list from the cache
     if user == request.user.id:
-        tenants = request.user.authorized_tenants
+        tenants = [tenant for tenant in request.user.authorized_tenants
+                   if _matches(tenant, filters)]
 
-    elif VERSIONS.active < 3:
+    elif VERSIONS.active < 3 and not (paginate and filters):
         tenants = manager.list(limit, marker)
         if paginate and len(tenants) > page_size:
             tenants.pop(-1)
             has_more_data = True
+    elif paginate:
+        # The v2 API can only page through all of the projects, filtered
+        # listings are paged through the index.
+        kwargs = {}
+        if VERSIONS.active >= 3:
+            kwargs = {"domain": domain, "user": user}
+        tenants, has_more_data = _paginate_list(request, 'projects', manager,
+                                                marker=marker,
+                                                filters=filters, **kwargs)
     else:
         kwargs = {
             "domain": domain,
@@ -290,10 +501,14 @@ def tenant_update(request, project, name=None, description=None,
                   enabled=None, domain=None, **kwargs):
     manager = VERSIONS.get_project_manager(request, admin=True)
     if VERSIONS.active < 3:
-        return manager.update(project, name, description, enabled, **kwargs)
+        project = manager.update(project, name, description, enabled,
+                                 **kwargs)
     else:
-        return manager.update(project, name=name, description=description,
-                              enabled=enabled, domain=domain, **kwargs)
+        project = manager.update(project, name=name,
+                                 description=description, enabled=enabled,
+                                 domain=domain, **kwargs)
+    _invalidate_list_index('projects')
+    return project
 
 
 def user_list(request, project=None, domain=None, group=None, filters=None):
@@ -311,23 +526,73 @@ def user_list(request, project=None, domain=None, group=None, filters=None):
     return [VERSIONS.upgrade_v2_user(user) for user in users]
 
 
+def _get_user_list_kwargs(domain):
+    if VERSIONS.active < 3:
+        return {}
+    return {"domain": domain}
+
+
+def user_list_paged(request, marker=None, domain=None, filters=None,
+                    search=None):
+    """Returns a page of the users, sorted by name, after the ``marker`` ID.
+
+    Only the users whose name contains ``search`` are listed if it is
+    given. Returns the page and whether there are more users after it.
+    """
+    manager = keystoneclient(request, admin=True).users
+    users, has_more_data = _paginate_list(request, 'users', manager,
+                                          marker=marker, filters=filters,
+                                          search=search,
+                                          **_get_user_list_kwargs(domain))
+    return ([VERSIONS.upgrade_v2_user(user) for user in users],
+            has_more_data)
+
+
+def _get_names(request, manager, resource_ids):
+    def get_name(resource_id):
+        try:
+            return manager.get(resource_id).name
+        except keystone_exceptions.NotFound:
+            return None
+
+    resource_ids = list(resource_ids)
+    names = concurrency.run_bounded(request, get_name, resource_ids)
+    return dict((resource_id, name)
+                for resource_id, name in zip(resource_ids, names)
+                if name is not None)
+
+
+def user_names(request, user_ids):
+    """Returns a dict mapping the given user IDs to the names of the users.
+
+    The users are got one by one, concurrently, rather than listing every
+    user of the domain for a few of them. Unknown IDs are left out.
+    """
+    manager = keystoneclient(request, admin=True).users
+    return _get_names(request, manager, user_ids)
+
+
 def user_create(request, name=None, email=None, password=None, project=None,
                 enabled=None, domain=None, description=None):
     manager = keystoneclient(request, admin=True).users
     try:
         if VERSIONS.active < 3:
             user = manager.create(name, password, email, project, enabled)
-            return VERSIONS.upgrade_v2_user(user)
+            user = VERSIONS.upgrade_v2_user(user)
         else:
-            return manager.create(name, password=password, email=email,
+            user = manager.create(name, password=password, email=email,
                                   project=project, enabled=enabled,
                                   domain=domain, description=description)
     except keystone_exceptions.Conflict:
         raise exceptions.Conflict()
+    _invalidate_list_index('users')
+    return user
 
 
 def user_delete(request, user_id):
-    return keystoneclient(request, admin=True).users.delete(user_id)
+    result = keystoneclient(request, admin=True).users.delete(user_id)
+    _invalidate_list_index('users')
+    return result
 
 
 def user_get(request, user_id, admin=True):
@@ -362,6 +627,9 @@ def user_update(request, user, **data):
         except Exception:
             error = exceptions.handle(request, ignore=True)
 
+        # Either of the updates may have gone through.
+        _invalidate_list_index('users')
+
         # Check for existing roles
         # Show a warning if no role exists for the project
         user_roles = roles_for_user(request, user, project)
@@ -380,14 +648,17 @@ def user_update(request, user, **data):
             user = manager.update(user, **data)
         except keystone_exceptions.Conflict:
             raise exceptions.Conflict()
+        _invalidate_list_index('users')
 
 
 def user_update_enabled(request, user, enabled):
     manager = keystoneclient(request, admin=True).users
     if VERSIONS.active < 3:
-        return manager.update_enabled(user, enabled)
+        user = manager.update_enabled(user, enabled)
     else:
-        return manager.update(user, enabled=enabled)
+        user = manager.update(user, enabled=enabled)
+    _invalidate_list_index('users')
+    return user
 
 
 def user_update_password(request, user, password, admin=True):
@@ -443,9 +714,11 @@ def user_update_tenant(request, user, project, admin=True):
 
 def group_create(request, domain_id, name, description=None):
     manager = keystoneclient(request, admin=True).groups
-    return manager.create(domain=domain_id,
-                          name=name,
-                          description=description)
+    group = manager.create(domain=domain_id,
+                           name=name,
+                           description=description)
+    _invalidate_list_index('groups')
+    return group
 
 
 def group_get(request, group_id, admin=True):
@@ -455,7 +728,9 @@ def group_get(request, group_id, admin=True):
 
 def group_delete(request, group_id):
     manager = keystoneclient(request, admin=True).groups
-    return manager.delete(group_id)
+    result = manager.delete(group_id)
+    _invalidate_list_index('groups')
+    return result
 
 
 def group_list(request, domain=None, project=None, user=None):
@@ -473,11 +748,34 @@ def group_list(request, domain=None, project=None, user=None):
     return groups
 
 
+def group_list_paged(request, marker=None, domain=None, search=None):
+    """Returns a page of the groups, sorted by name, after the ``marker`` ID.
+
+    Only the groups whose name contains ``search`` are listed if it is
+    given. Returns the page and whether there are more groups after it.
+    """
+    manager = keystoneclient(request, admin=True).groups
+    return _paginate_list(request, 'groups', manager, marker=marker,
+                          search=search, domain=domain)
+
+
+def group_names(request, group_ids):
+    """Returns a dict mapping the given group IDs to the names of the groups.
+
+    The groups are got one by one, concurrently, rather than listing every
+    group of the domain for a few of them. Unknown IDs are left out.
+    """
+    manager = keystoneclient(request, admin=True).groups
+    return _get_names(request, manager, group_ids)
+
+
 def group_update(request, group_id, name=None, description=None):
     manager = keystoneclient(request, admin=True).groups
-    return manager.update(group=group_id,
-                          name=name,
-                          description=description)
+    group = manager.update(group=group_id,
+                           name=name,
+                           description=description)
+    _invalidate_list_index('groups')
+    return group
 
 
 def add_group_user(request, group_id, user_id):
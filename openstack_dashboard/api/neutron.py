@@ -23,6 +23,7 @@ import collections
 import logging
 
 import netaddr
+import six
 
 from django.conf import settings
 from django.utils.datastructures import SortedDict
@@ -36,6 +37,7 @@ from openstack_dashboard.api import base
 from openstack_dashboard.api import network_base
 from openstack_dashboard.api import nova
 from openstack_dashboard import policy
+from openstack_dashboard.utils import concurrency
 
 
 LOG = logging.getLogger(__name__)
@@ -544,6 +546,31 @@ def neutronclient(request):
     return c
 
 
+# The longest filter, in characters, which fits into the URI of the
+# listing requests, learnt from the RequestURITooLong errors of each
+# Neutron endpoint and listing.
+_uri_budgets = {}
+
+
+def _filter_len(filter_attr, filter_values):
+    # Length of each query filter is:
+    # <key>=<value>& (e.g., id=<uuid>)
+    # The length will be key_len + value_len + 2
+    return sum(len(filter_attr) + len(val) + 2 for val in filter_values)
+
+
+def _uri_budget_key(request, list_method, filter_attr):
+    endpoint = None
+    if request is not None:
+        try:
+            endpoint = base.url_for(request, 'network')
+        except Exception:
+            pass
+    method = getattr(list_method, '__func__', list_method)
+    return (endpoint, getattr(method, '__module__', None),
+            getattr(method, '__name__', repr(method)), filter_attr)
+
+
 def list_resources_with_long_filters(list_method,
                                      filter_attr, filter_values, **params):
     """List neutron resources with handling RequestURITooLong exception.
@@ -551,7 +578,12 @@ def list_resources_with_long_filters(list_method,
     If filter parameters are long, list resources API request leads to
     414 error (URL is too long). For such case, this method split
     list parameters specified by a list_field argument into chunks
-    and call the specified list_method repeatedly.
+    and call the specified list_method concurrently for the chunks.
+
+    The length of the filter which fits into a request is remembered for
+    each Neutron endpoint and listing, so that the chunks are requested
+    straight away the next time instead of after a failing request. The
+    resources of all chunks are merged, without duplicates.
 
     :param list_method: Method used to retrieve resource list.
     :param filter_attr: attribute name to be filtered. The value corresponding
@@ -565,37 +597,63 @@ def list_resources_with_long_filters(list_method,
     :param params: parameters to pass a specified listing API call
         without any changes. You can specify more filter conditions
         in addition to a pair of filter_attr and filter_values.
+        The ``request`` parameter, or the ``request`` attribute of the
+        object of list_method, is used for the concurrent calls.
     """
-    try:
-        params[filter_attr] = filter_values
-        return list_method(**params)
-    except neutron_exc.RequestURITooLong as uri_len_exc:
-        # The URI is too long because of too many filter values.
-        # Use the excess attribute of the exception to know how many
-        # filter values can be inserted into a single request.
-
-        # We consider only the filter condition from (filter_attr,
-        # filter_values) and do not consider other filter conditions
-        # which may be specified in **params.
-        if type(filter_values) != list:
-            filter_values = [filter_values]
-
-        # Length of each query filter is:
-        # <key>=<value>& (e.g., id=<uuid>)
-        # The length will be key_len + value_maxlen + 2
-        all_filter_len = sum(len(filter_attr) + len(val) + 2
-                             for val in filter_values)
-        allowed_filter_len = all_filter_len - uri_len_exc.excess
-
-        val_maxlen = max(len(val) for val in filter_values)
-        filter_maxlen = len(filter_attr) + val_maxlen + 2
-        chunk_size = allowed_filter_len / filter_maxlen
-
-        resources = []
-        for i in range(0, len(filter_values), chunk_size):
-            params[filter_attr] = filter_values[i:i + chunk_size]
-            resources.extend(list_method(**params))
-        return resources
+    request = params.get('request',
+                         getattr(getattr(list_method, '__self__', None),
+                                 'request', None))
+    if isinstance(filter_values, six.string_types):
+        values = [filter_values]
+    else:
+        values = list(filter_values)
+    key = _uri_budget_key(request, list_method, filter_attr)
+    budget = _uri_budgets.get(key)
+    all_filter_len = _filter_len(filter_attr, values)
+    if budget is None or all_filter_len <= budget:
+        try:
+            params[filter_attr] = filter_values
+            return list_method(**params)
+        except neutron_exc.RequestURITooLong as uri_len_exc:
+            # The URI is too long because of too many filter values.
+            # Use the excess attribute of the exception to know how many
+            # filter values can be inserted into a single request.
+
+            # We consider only the filter condition from (filter_attr,
+            # filter_values) and do not consider other filter conditions
+            # which may be specified in **params.
+            budget = all_filter_len - uri_len_exc.excess
+            _uri_budgets[key] = budget
+
+    val_maxlen = max(len(val) for val in values)
+    filter_maxlen = len(filter_attr) + val_maxlen + 2
+    chunk_size = max(budget // filter_maxlen, 1)
+
+    def list_chunk(chunk):
+        chunk_params = dict(params)
+        chunk_params.pop(filter_attr, None)
+        if len(chunk) == 1:
+            chunk_params[filter_attr] = chunk
+            return list_method(**chunk_params)
+        # The chunk is listed as a whole if it fits into the latest
+        # budget, or split again if that turns out to be too large.
+        return list_resources_with_long_filters(list_method, filter_attr,
+                                                chunk, **chunk_params)
+
+    chunks = [values[i:i + chunk_size]
+              for i in range(0, len(values), chunk_size)]
+    resources = []
+    seen = set()
+    for chunk_resources in concurrency.run_bounded(request, list_chunk,
+                                                   chunks):
+        for resource in chunk_resources:
+            resource_id = getattr(resource, 'id', None)
+            if resource_id is not None:
+                if resource_id in seen:
+                    continue
+                seen.add(resource_id)
+            resources.append(resource)
+    return resources
 
 
 def network_list(request, **params):
@@ -1065,6 +1123,7 @@ def _server_get_addresses(request, server, ports, floating_ips, network_names):
 
 
 @memoized
+@base.capability_cached('network')
 def list_extensions(request):
     extensions_list = neutronclient(request).list_extensions()
     if 'extensions' in extensions_list:
@@ -40,6 +40,7 @@ from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
 from openstack_dashboard.api import network_base
+from openstack_dashboard.utils import http_pool
 
 
 LOG = logging.getLogger(__name__)
@@ -449,7 +450,12 @@ def novaclient(request):
                            auth_url=base.url_for(request, 'compute'),
                            insecure=insecure,
                            cacert=cacert,
-                           http_log_debug=settings.DEBUG)
+                           http_log_debug=settings.DEBUG,
+                           connection_pool=True)
+    # NOTE: Share the connections of every client of the process instead of
+    # the ones of this client only.
+    c.client._connection_pool = http_pool.AdapterPool(
+        verify=c.client.verify_cert)
     c.client.auth_token = request.user.token.id
     c.client.management_url = base.url_for(request, 'compute')
     return c
@@ -938,6 +944,12 @@ def list_extensions(request):
     return nova_list_extensions.ListExtManager(novaclient(request)).show_all()
 
 
+@memoized
+@base.capability_cached('compute')
+def _list_extension_names(request):
+    return [extension.name for extension in list_extensions(request)]
+
+
 @memoized
 def extension_supported(extension_name, request):
     """Determine if nova supports a given extension name.
@@ -945,11 +957,7 @@ def extension_supported(extension_name, request):
     Example values for the extension_name include AdminActions, ConsoleOutput,
     etc.
     """
-    extensions = list_extensions(request)
-    for extension in extensions:
-        if extension.name == extension_name:
-            return True
-    return False
+    return extension_name in _list_extension_names(request)
 
 
 def can_set_server_password():
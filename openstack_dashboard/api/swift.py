@@ -16,9 +16,14 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import logging
+import re
+import sys
+import uuid
 
 from oslo_utils import timeutils
+import six
 import six.moves.urllib.parse as urlparse
 import swiftclient
 
@@ -29,11 +34,17 @@ from horizon import exceptions
 from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
+from openstack_dashboard.utils import concurrency
+from openstack_dashboard.utils import http_pool
 
 
 LOG = logging.getLogger(__name__)
 FOLDER_DELIMITER = "/"
 CHUNK_SIZE = getattr(settings, 'SWIFT_FILE_TRANSFER_CHUNK_SIZE', 512 * 1024)
+# Objects larger than a segment are uploaded as Dynamic Large Objects.
+SEGMENT_SIZE = getattr(settings, 'SWIFT_UPLOAD_SEGMENT_SIZE',
+                       32 * 1024 * 1024)
+SEGMENTS_CONTAINER_SUFFIX = "_segments"
 # Swift ACL
 GLOBAL_READ_ACL = ".r:*"
 LIST_CONTENTS_ACL = ".rlistings"
@@ -106,19 +117,35 @@ def _metadata_to_header(metadata):
     return headers
 
 
-@memoized
-def swift_api(request):
+def _swift_connection(request):
     endpoint = base.url_for(request, 'object-store')
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
-    return swiftclient.client.Connection(None,
-                                         request.user.username,
-                                         None,
-                                         preauthtoken=request.user.token.id,
-                                         preauthurl=endpoint,
-                                         cacert=cacert,
-                                         insecure=insecure,
-                                         auth_version="2.0")
+    connection = swiftclient.client.Connection(
+        None,
+        request.user.username,
+        None,
+        preauthtoken=request.user.token.id,
+        preauthurl=endpoint,
+        cacert=cacert,
+        insecure=insecure,
+        auth_version="2.0")
+    http_connection = connection.http_connection
+
+    def pooled_http_connection(url=None):
+        parsed, conn = http_connection(url)
+        http_pool.mount(conn.request_session, conn.url,
+                        verify=conn.requests_args['verify'])
+        return parsed, conn
+
+    # The HTTP connection is created lazily, on the first call.
+    connection.http_connection = pooled_http_connection
+    return connection
+
+
+@memoized
+def swift_api(request):
+    return _swift_connection(request)
 
 
 def swift_container_exists(request, container_name):
@@ -227,39 +254,72 @@ def swift_get_objects(request, container_name, prefix=None, marker=None,
         return (object_objs, False)
 
 
+class ObjectFilter(object):
+    """Matches the names of objects against a filter string.
+
+    The filter string is split into terms, all of which must match. A term
+    without wildcards matches names containing it, ignoring the case. A
+    term with ``*`` wildcards is a pattern the whole name must match, like
+    a shell glob, e.g. ``backup-*.tar``; the literal text a pattern starts
+    with is the ``prefix`` every matching name starts with.
+    """
+
+    def __init__(self, filter_string):
+        terms = filter_string.split()
+        self.substrings = [term.lower() for term in terms if '*' not in term]
+        self.patterns = []
+        self.prefix = ''
+        for term in terms:
+            if '*' not in term:
+                continue
+            parts = term.split('*')
+            self.patterns.append(re.compile(
+                '.*'.join(re.escape(part) for part in parts) + r'\Z',
+                re.DOTALL))
+            if len(parts[0]) > len(self.prefix):
+                self.prefix = parts[0]
+
+    def matches(self, name):
+        lower_name = name.lower()
+        return (all(term in lower_name for term in self.substrings) and
+                all(pattern.match(name) for pattern in self.patterns))
+
+
+def _iter_objects(request, container_name, prefix, marker=None):
+    # Lists the objects page by page, as they are consumed.
+    limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
+    while True:
+        headers, objects = swift_api(request).get_container(
+            container_name, prefix=prefix, marker=marker, limit=limit,
+            delimiter=FOLDER_DELIMITER)
+        for item in _objectify(objects, container_name):
+            yield item
+        if len(objects) < limit:
+            return
+        marker = objects[-1].get('name', objects[-1].get('subdir'))
+
+
 def swift_filter_objects(request, filter_string, container_name, prefix=None,
-                         marker=None):
-    # FIXME(kewu): Swift currently has no real filtering API, thus the marker
-    # parameter here won't actually help the pagination. For now I am just
-    # getting the largest number of objects from a container and filtering
-    # based on those objects.
-    limit = 9999
-    objects = swift_get_objects(request,
-                                container_name,
-                                prefix=prefix,
-                                marker=marker,
-                                limit=limit)
-    filter_string_list = filter_string.lower().strip().split(' ')
-
-    def matches_filter(obj):
-        for q in filter_string_list:
-            return wildcard_search(obj.name.lower(), q)
-
-    return filter(matches_filter, objects[0])
-
-
-def wildcard_search(string, q):
-    q_list = q.split('*')
-    if all(map(lambda x: x == '', q_list)):
-        return True
-    elif q_list[0] not in string:
-        return False
-    else:
-        if q_list[0] == '':
-            tail = string
-        else:
-            head, delimiter, tail = string.partition(q_list[0])
-        return wildcard_search(tail, '*'.join(q_list[1:]))
+                         marker=None, limit=None):
+    """Returns the objects of a pseudo-folder matching ``filter_string``.
+
+    The names relative to ``prefix`` are matched by an
+    :class:`ObjectFilter`. The listing of the container is restricted to
+    the prefix of the filter's patterns, and is fetched page by page, after
+    ``marker``, until ``limit`` matching objects, by default
+    ``API_RESULT_LIMIT``, are found.
+    """
+    limit = limit or getattr(settings, 'API_RESULT_LIMIT', 1000)
+    prefix = prefix or ''
+    object_filter = ObjectFilter(filter_string)
+    matches = []
+    for obj in _iter_objects(request, container_name,
+                             prefix + object_filter.prefix, marker):
+        if object_filter.matches(obj.name[len(prefix):]):
+            matches.append(obj)
+            if len(matches) >= limit:
+                break
+    return matches
 
 
 def swift_copy_object(request, orig_container_name, orig_object_name,
@@ -275,19 +335,153 @@ def swift_copy_object(request, orig_container_name, orig_object_name,
                                          headers=headers)
 
 
+class SegmentWriter(object):
+    """Uploads the data written to it as the segments of a large object.
+
+    The data is cut into segments of ``SWIFT_UPLOAD_SEGMENT_SIZE`` bytes,
+    which are uploaded concurrently, on the worker pool, while further data
+    is written. At most ``API_CONCURRENCY_PER_REQUEST`` segments are
+    pending at once; writing more waits for the oldest one to be uploaded,
+    so the memory used does not grow with the size of the object.
+
+    The segments are stored in the ``<container>_segments`` container under
+    a unique prefix, so they can be uploaded before the name of the object
+    is known. Once :meth:`close` returns, the object is created as a Dynamic
+    Large Object by :func:`swift_upload_object`.
+    """
+
+    def __init__(self, request, container_name, segment_size=None):
+        self.request = request
+        self.segment_container = container_name + SEGMENTS_CONTAINER_SUFFIX
+        self.segment_size = segment_size or SEGMENT_SIZE
+        self.prefix = "%s/%d/" % (uuid.uuid4().hex, self.segment_size)
+        self.limit = getattr(settings, 'API_CONCURRENCY_PER_REQUEST', 5)
+        self.size = 0
+        self.segments = 0
+        self._buffer = six.BytesIO()
+        self._pending = collections.deque()
+        self._container_created = False
+
+    @property
+    def manifest(self):
+        return "%s/%s" % (self.segment_container, self.prefix)
+
+    def _put_segment(self, name, data):
+        # swiftclient connections cannot be shared between threads.
+        return _swift_connection(self.request).put_object(
+            self.segment_container, name, data, content_length=len(data))
+
+    def _flush(self):
+        data = self._buffer.getvalue()
+        self._buffer = six.BytesIO()
+        if not data and self.segments:
+            return
+        if not self._container_created:
+            swift_api(self.request).put_container(self.segment_container)
+            self._container_created = True
+        while len(self._pending) >= max(self.limit, 1):
+            self._pending.popleft().result()
+        name = "%s%08d" % (self.prefix, self.segments)
+        self._pending.append(concurrency.submit(self.request,
+                                                self._put_segment,
+                                                name, data))
+        self.segments += 1
+
+    def write(self, data):
+        self.size += len(data)
+        while data:
+            room = self.segment_size - self._buffer.tell()
+            self._buffer.write(data[:room])
+            data = data[room:]
+            if self._buffer.tell() >= self.segment_size:
+                self._flush()
+
+    def close(self):
+        """Uploads the last segment and waits for all of them."""
+        self._flush()
+        while self._pending:
+            self._pending.popleft().result()
+
+    def abort(self):
+        """Cancels the pending segments and deletes the uploaded ones."""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        for i in range(self.segments):
+            try:
+                _swift_connection(self.request).delete_object(
+                    self.segment_container, "%s%08d" % (self.prefix, i))
+            except Exception:
+                pass
+
+
+class SegmentedUpload(object):
+    """An uploaded file whose data was already stored as segments.
+
+    Returned by the streaming upload handler of the Containers panel and
+    accepted by :func:`swift_upload_object`, which sets ``stored`` once
+    the object is created. If uploading the segments failed, ``exc_info``
+    holds the error, raised again on upload.
+    """
+
+    def __init__(self, name, content_type, writer, exc_info=None):
+        self.name = name
+        self.content_type = content_type
+        self.writer = writer
+        self.size = writer.size
+        self.exc_info = exc_info
+        self.stored = False
+
+    def __bool__(self):
+        return True
+    __nonzero__ = __bool__
+
+
 def swift_upload_object(request, container_name, object_name,
                         object_file=None):
+    """Uploads ``object_file`` as the object ``object_name``.
+
+    Files larger than ``SWIFT_UPLOAD_SEGMENT_SIZE`` are uploaded in segments
+    and stored as a Dynamic Large Object. A :class:`SegmentedUpload` is
+    stored the same way, without uploading its data again.
+    """
     headers = {}
     size = 0
     if object_file:
         headers['X-Object-Meta-Orig-Filename'] = object_file.name
         size = object_file.size
 
-    etag = swift_api(request).put_object(container_name,
-                                         object_name,
-                                         object_file,
-                                         content_length=size,
-                                         headers=headers)
+    writer = None
+    if isinstance(object_file, SegmentedUpload):
+        if object_file.exc_info:
+            six.reraise(*object_file.exc_info)
+        writer = object_file.writer
+    elif SEGMENT_SIZE and size > SEGMENT_SIZE:
+        writer = SegmentWriter(request, container_name)
+        try:
+            for chunk in object_file.chunks(CHUNK_SIZE):
+                writer.write(chunk)
+            writer.close()
+        except Exception:
+            exc_info = sys.exc_info()
+            writer.abort()
+            six.reraise(*exc_info)
+
+    if writer is not None:
+        headers['X-Object-Manifest'] = writer.manifest
+        etag = swift_api(request).put_object(container_name,
+                                             object_name,
+                                             '',
+                                             content_length=0,
+                                             headers=headers)
+        if isinstance(object_file, SegmentedUpload):
+            object_file.stored = True
+    else:
+        etag = swift_api(request).put_object(container_name,
+                                             object_name,
+                                             object_file,
+                                             content_length=size,
+                                             headers=headers)
 
     obj_info = {'name': object_name, 'bytes': size, 'etag': etag}
     return StorageObject(obj_info, container_name)
@@ -327,10 +521,20 @@ def swift_delete_object(request, container_name, object_name):
 
 
 def swift_get_object(request, container_name, object_name, with_data=True,
-                     resp_chunk_size=CHUNK_SIZE):
+                     resp_chunk_size=CHUNK_SIZE, headers=None):
+    """Returns an object, with an iterator over its data if ``with_data``.
+
+    ``headers`` are sent with the request for the data, e.g. ``Range`` or
+    ``If-None-Match``. The ``content_range`` of the returned object is set
+    if only a range of the data was returned. A ``swiftclient.
+    ClientException`` is raised if the object was not modified or a
+    precondition failed.
+    """
     if with_data:
+        kwargs = {'headers': headers} if headers else {}
         headers, data = swift_api(request).get_object(
-            container_name, object_name, resp_chunk_size=resp_chunk_size)
+            container_name, object_name, resp_chunk_size=resp_chunk_size,
+            **kwargs)
     else:
         data = None
         headers = swift_api(request).head_object(container_name,
@@ -348,6 +552,8 @@ def swift_get_object(request, container_name, object_name, with_data=True,
         'content_type': headers.get('content-type'),
         'etag': headers.get('etag'),
         'timestamp': timestamp,
+        'last_modified': headers.get('last-modified'),
+        'content_range': headers.get('content-range'),
     }
     return StorageObject(obj_info,
                          container_name,
@@ -53,6 +53,9 @@ class UpdateRow(tables.Row):
 
     def get_data(self, request, image_id):
         image = api.glance.image_get(request, image_id)
+        if image.status in ("queued", "saving"):
+            image.upload_progress = api.glance.image_upload_progress(
+                request, image_id)
         return image
 
 
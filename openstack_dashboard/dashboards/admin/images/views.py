@@ -37,6 +37,7 @@ from openstack_dashboard.dashboards.project.images.images import views
 from openstack_dashboard.dashboards.admin.images import forms as project_forms
 from openstack_dashboard.dashboards.admin.images \
     import tables as project_tables
+from openstack_dashboard import usage
 
 
 LOG = logging.getLogger(__name__)
@@ -85,16 +86,15 @@ class IndexView(tables.DataTableView):
             exceptions.handle(self.request, msg)
         if images:
             try:
-                tenants, more = api.keystone.tenant_list(self.request)
+                project_names = usage.get_project_names(
+                    self.request, [image.owner for image in images])
             except Exception:
-                tenants = []
+                project_names = {}
                 msg = _('Unable to retrieve project list.')
                 exceptions.handle(self.request, msg)
 
-            tenant_dict = dict([(t.id, t.name) for t in tenants])
-
             for image in images:
-                image.tenant_name = tenant_dict.get(image.owner)
+                image.tenant_name = project_names.get(image.owner)
         return images
 
     def get_filters(self):
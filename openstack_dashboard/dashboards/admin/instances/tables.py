@@ -24,6 +24,7 @@ from openstack_dashboard import api
 from openstack_dashboard.dashboards.project.instances \
     import tables as project_tables
 from openstack_dashboard import policy
+from openstack_dashboard import usage
 
 
 class AdminEditInstance(project_tables.EditInstance):
@@ -84,6 +85,8 @@ class LiveMigrateInstance(policy.PolicyTargetMixin,
 
 
 class AdminUpdateRow(project_tables.UpdateRow):
+    all_tenants = True
+
     def get_data(self, request, instance_id):
         instance = super(AdminUpdateRow, self).get_data(request, instance_id)
         tenant = api.keystone.tenant_get(request,
@@ -92,6 +95,18 @@ class AdminUpdateRow(project_tables.UpdateRow):
         instance.tenant_name = getattr(tenant, "name", None)
         return instance
 
+    def get_data_bulk(self, request, instance_ids):
+        instances = super(AdminUpdateRow, self).get_data_bulk(request,
+                                                              instance_ids)
+        missing = [instance for instance in instances.values()
+                   if not hasattr(instance, "tenant_name")]
+        if missing:
+            project_names = usage.get_project_names(
+                request, [instance.tenant_id for instance in missing])
+            for instance in missing:
+                instance.tenant_name = project_names.get(instance.tenant_id)
+        return instances
+
 
 class AdminInstanceFilterAction(tables.FilterAction):
     # Change default name of 'filter' to distinguish this one from the
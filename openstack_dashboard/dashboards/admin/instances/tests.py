@@ -12,6 +12,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
 import uuid
 
 from django.core.urlresolvers import reverse
@@ -175,6 +176,35 @@ class InstanceViewTest(test.BaseAdminViewTests):
         self.assertContains(res, "Active", 1, 200)
         self.assertContains(res, "Running", 1, 200)
 
+    @test.create_stubs({api.nova: ('server_list', 'flavor_list',
+                                   'extension_supported', ),
+                        api.keystone: ('tenant_list',)})
+    def test_ajax_loading_instances_bulk(self):
+        servers = self.servers.list()[:2]
+        tenants = self.tenants.list()
+        api.nova.extension_supported('AdminActions', IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        api.nova.server_list(IsA(http.HttpRequest),
+                             search_opts={'paginate': True},
+                             all_tenants=True) \
+            .AndReturn([self.servers.list(), False])
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([tenants, False])
+        self.mox.ReplayAll()
+
+        url = (INDEX_URL + "?action=rows_update&table=instances"
+               "&obj_id=%s&obj_id=%s" % (servers[0].id, servers[1].id))
+
+        res = self.client.get(url, {},
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+
+        rows = json.loads(res.content)['rows']
+        self.assertEqual(sorted(server.id for server in servers),
+                         sorted(rows.keys()))
+        self.assertIn("test_tenant", rows[servers[0].id])
+
     @test.create_stubs({api.nova: ('flavor_list', 'server_list',
                                    'extension_supported', ),
                         api.keystone: ('tenant_list',),
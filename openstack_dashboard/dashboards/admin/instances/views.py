@@ -19,7 +19,6 @@
 
 from django.core.urlresolvers import reverse
 from django.core.urlresolvers import reverse_lazy
-from django.utils.datastructures import SortedDict
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
@@ -35,6 +34,7 @@ from openstack_dashboard.dashboards.admin.instances \
 from openstack_dashboard.dashboards.project.instances import views
 from openstack_dashboard.dashboards.project.instances.workflows \
     import update_instance
+from openstack_dashboard import usage
 
 
 # re-use console from project.instances.views to make reflection work
@@ -66,26 +66,30 @@ class AdminIndexView(tables.DataTableView):
     table_class = project_tables.AdminInstancesTable
     template_name = 'admin/instances/index.html'
     page_title = _("Instances")
+    cache_data = True
 
     def has_more_data(self, table):
         return self._more
 
-    def get_data(self):
-        instances = []
-        marker = self.request.GET.get(
-            project_tables.AdminInstancesTable._meta.pagination_param, None)
-        search_opts = self.get_filters({'marker': marker, 'paginate': True})
-        # Gather our tenants to correlate against IDs
+    def _get_project_names(self, project_ids=()):
         try:
-            tenants, has_more = api.keystone.tenant_list(self.request)
+            return usage.get_project_names(self.request, project_ids)
         except Exception:
-            tenants = []
             msg = _('Unable to retrieve instance project information.')
             exceptions.handle(self.request, msg)
+        return {}
 
+    def get_data(self):
+        instances = []
+        marker = self.request.GET.get(
+            project_tables.AdminInstancesTable._meta.pagination_param, None)
+        search_opts = self.get_filters({'marker': marker, 'paginate': True})
+        project_names = None
         if 'project' in search_opts:
-            ten_filter_ids = [t.id for t in tenants
-                              if t.name == search_opts['project']]
+            project_names = self._get_project_names()
+            ten_filter_ids = [project_id for project_id, name
+                              in project_names.items()
+                              if name == search_opts['project']]
             del search_opts['project']
             if len(ten_filter_ids) > 0:
                 search_opts['tenant_id'] = ten_filter_ids[0]
@@ -119,8 +123,11 @@ class AdminIndexView(tables.DataTableView):
                 # If fails to retrieve flavor list, creates an empty list.
                 flavors = []
 
-            full_flavors = SortedDict([(f.id, f) for f in flavors])
-            tenant_dict = SortedDict([(t.id, t) for t in tenants])
+            full_flavors = usage.index_by_id(flavors)
+            # Gather our tenants to correlate against IDs
+            if project_names is None:
+                project_names = self._get_project_names(
+                    [inst.tenant_id for inst in instances])
             # Loop through instances to get flavor and tenant info.
             for inst in instances:
                 flavor_id = inst.flavor["id"]
@@ -135,8 +142,7 @@ class AdminIndexView(tables.DataTableView):
                 except Exception:
                     msg = _('Unable to retrieve instance size information.')
                     exceptions.handle(self.request, msg)
-                tenant = tenant_dict.get(inst.tenant_id, None)
-                inst.tenant_name = getattr(tenant, "name", None)
+                inst.tenant_name = project_names.get(inst.tenant_id)
         return instances
 
     def get_filters(self, filters):
@@ -24,6 +24,7 @@ from openstack_dashboard.test.test_data import utils as test_utils
 INDEX_URL = reverse('horizon:admin:metering:index')
 CREATE_URL = reverse('horizon:admin:metering:create')
 SAMPLES_URL = reverse('horizon:admin:metering:samples')
+REPORT_URL = reverse('horizon:admin:metering:csvreport')
 
 
 class MeteringViewTests(test.BaseAdminViewTests):
@@ -177,3 +178,42 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
 
         self._verify_series(res._container[0], 9.0, '2012-12-21T11:00:55',
                             expected_names)
+
+    @test.create_stubs({api.keystone: ('tenant_list',),
+                        api.nova: ('flavor_list',),
+                        api.ceilometer: ('meter_list',
+                                         'sample_list',
+                                         'statistic_list'), })
+    def test_report_csv(self):
+        meters = [api.ceilometer.Meter(meter)
+                  for meter in self.testdata.meters.list()]
+        statistics = [api.ceilometer.Statistic(statistic)
+                      for statistic in self.testdata.statistics.list()]
+        tenants = self.testdata.tenants.list()
+        api.nova.flavor_list(IsA(http.HttpRequest), None).AndReturn([])
+        api.ceilometer.meter_list(IsA(http.HttpRequest)).AndReturn(meters)
+        api.keystone.tenant_list(IsA(http.HttpRequest),
+                                 domain=None,
+                                 paginate=False).AndReturn([tenants, False])
+        api.ceilometer.sample_list(IsA(http.HttpRequest),
+                                   IsA(str),
+                                   limit=IsA(int)).MultipleTimes() \
+            .AndReturn([])
+        api.ceilometer.statistic_list(IsA(http.HttpRequest),
+                                      IsA(str),
+                                      period=IsA(int),
+                                      query=IsA(list)).MultipleTimes() \
+            .AndReturn(statistics)
+        self.mox.ReplayAll()
+
+        res = self.client.get(REPORT_URL + "?date_options=7")
+
+        self.assertTrue(res.streaming)
+        rows = "".join(res.streaming_content).splitlines()
+        self.assertEqual("Project Name,Meter,Description,Service,Time,"
+                         "Value (Avg),Unit", rows[0])
+        # One row for each project and each of the three distinct meters.
+        self.assertEqual(1 + 3 * len(tenants), len(rows))
+        self.assertEqual(set(['instance', 'disk.read.bytes',
+                              'disk.write.bytes']),
+                         set(row.split(",")[1] for row in rows[1:]))
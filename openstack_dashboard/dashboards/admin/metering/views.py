@@ -13,6 +13,7 @@
 import json
 import logging
 
+from django import VERSION  # noqa
 from django.core.urlresolvers import reverse_lazy
 from django.http import HttpResponse  # noqa
 from django.utils.translation import ugettext_lazy as _
@@ -29,6 +30,7 @@ from openstack_dashboard.dashboards.admin.metering import forms as \
     metering_forms
 from openstack_dashboard.dashboards.admin.metering import tabs as \
     metering_tabs
+from openstack_dashboard.utils import concurrency
 from openstack_dashboard.utils import metering as metering_utils
 
 
@@ -101,25 +103,37 @@ class CsvReportView(django.views.generic.View):
         return resp
 
 
-class ReportCsvRenderer(csvbase.BaseCsvResponse):
+if VERSION >= (1, 5, 0):
+    _CsvResponseBase = csvbase.BaseCsvStreamingResponse
+else:
+    # Django 1.4 cannot stream responses, the report is rendered at once.
+    _CsvResponseBase = csvbase.BaseCsvResponse
+
+
+class ReportCsvRenderer(_CsvResponseBase):
 
     columns = [_("Project Name"), _("Meter"), _("Description"),
                _("Service"), _("Time"), _("Value (Avg)"), _("Unit")]
 
     def get_row_data(self):
 
-        for p in self.context['usage'].values():
-            for u in p:
-                yield (u["project"],
-                       u["meter"],
-                       u["description"],
-                       u["service"],
-                       u["time"],
-                       u["value"],
-                       u["unit"])
+        for u in self.context['usage']:
+            yield (u["project"],
+                   u["meter"],
+                   u["description"],
+                   u["service"],
+                   u["time"],
+                   u["value"],
+                   u["unit"])
 
 
 def load_report_data(request):
+    """Returns an iterator over the rows of the usage report.
+
+    The meters are queried concurrently and their rows are yielded as soon
+    as the statistics of a meter are available, so the report can be
+    streamed without keeping all of it in memory.
+    """
     meters = ceilometer.Meters(request)
     services = {
         _('Nova'): meters.list_nova(),
@@ -130,7 +144,6 @@ def load_report_data(request):
         _('Kwapi'): meters.list_kwapi(),
         _('IPMI'): meters.list_ipmi(),
     }
-    project_rows = {}
     date_options = request.GET.get('date_options', 7)
     date_from = request.GET.get('date_from')
     date_to = request.GET.get('date_to')
@@ -148,18 +161,30 @@ def load_report_data(request):
     except Exception:
         exceptions.handle(request,
                           _('Unable to retrieve project list.'))
-    for meter in meters._cached_meters.values():
-        service = None
-        for name, m_list in services.items():
-            if meter in m_list:
-                service = name
-                break
-        res, unit = project_aggregates.query(meter.name)
-        for r in res:
-            values = r.get_meter(meter.name.replace(".", "_"))
-            if values:
-                for value in values:
-                    row = {"name": 'none',
+        return iter([])
+
+    def query(meter):
+        try:
+            res, unit = project_aggregates.query(meter.name)
+        except Exception:
+            # The response is already being streamed, so the meter can only
+            # be left out of the report.
+            LOG.warning("Unable to retrieve the statistics of meter %s.",
+                        meter.name, exc_info=True)
+            res = []
+        return meter, res
+
+    def rows(results):
+        for meter, res in results:
+            service = None
+            for name, m_list in services.items():
+                if meter in m_list:
+                    service = name
+                    break
+            for r in res:
+                values = r.get_meter(meter.name.replace(".", "_"))
+                for value in values or []:
+                    yield {"name": 'none',
                            "project": r.id,
                            "meter": meter.name,
                            "description": meter.description,
@@ -167,8 +192,6 @@ def load_report_data(request):
                            "time": value._apiresource.period_end,
                            "value": value._apiresource.avg,
                            "unit": meter.unit}
-                    if r.id not in project_rows:
-                        project_rows[r.id] = [row]
-                    else:
-                        project_rows[r.id].append(row)
-    return project_rows
+
+    return rows(concurrency.imap_bounded(
+        request, query, list(meters._cached_meters.values())))
@@ -13,7 +13,6 @@
 #    under the License.
 
 from django.core.urlresolvers import reverse_lazy
-from django.utils.datastructures import SortedDict
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
@@ -34,6 +33,7 @@ from openstack_dashboard.dashboards.admin.networks.subnets \
     import tables as subnets_tables
 from openstack_dashboard.dashboards.admin.networks \
     import tables as networks_tables
+from openstack_dashboard import usage
 
 
 class IndexView(tables.DataTableView):
@@ -42,17 +42,14 @@ class IndexView(tables.DataTableView):
     page_title = _("Networks")
 
     @memoized.memoized_method
-    def _get_tenant_list(self):
+    def _get_tenant_list(self, tenant_ids=()):
         try:
-            tenants, has_more = api.keystone.tenant_list(self.request)
+            return usage.get_project_names(self.request, tenant_ids)
         except Exception:
-            tenants = []
             msg = _("Unable to retrieve information about the "
                     "networks' projects.")
             exceptions.handle(self.request, msg)
-
-        tenant_dict = SortedDict([(t.id, t) for t in tenants])
-        return tenant_dict
+        return {}
 
     def _get_agents_data(self, network):
         agents = []
@@ -79,11 +76,11 @@ class IndexView(tables.DataTableView):
             exceptions.handle(self.request, msg)
         if networks:
             self.exception = False
-            tenant_dict = self._get_tenant_list()
+            tenant_dict = self._get_tenant_list(
+                tuple(n.tenant_id for n in networks))
             for n in networks:
                 # Set tenant name
-                tenant = tenant_dict.get(n.tenant_id, None)
-                n.tenant_name = getattr(tenant, 'name', None)
+                n.tenant_name = tenant_dict.get(n.tenant_id)
                 n.num_agents = self._get_agents_data(n.id)
 
             if self.exception:
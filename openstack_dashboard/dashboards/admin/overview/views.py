@@ -22,13 +22,11 @@ from django.utils import translation
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
-from horizon.utils import csvbase
 
-from openstack_dashboard import api
 from openstack_dashboard import usage
 
 
-class GlobalUsageCsvRenderer(csvbase.BaseCsvResponse):
+class GlobalUsageCsvRenderer(usage.UsageCsvStreamingResponse):
 
     columns = [_("Project Name"), _("VCPUs"), _("RAM (MB)"),
                _("Disk (GB)"), _("Usage (Hours)")]
@@ -58,17 +56,17 @@ class GlobalOverview(usage.UsageView):
         data = super(GlobalOverview, self).get_data()
         # Pre-fill project names
         try:
-            projects, has_more = api.keystone.tenant_list(self.request)
+            project_names = usage.get_project_names(
+                self.request, [instance.tenant_id for instance in data])
         except Exception:
-            projects = []
+            project_names = {}
             exceptions.handle(self.request,
                               _('Unable to retrieve project list.'))
         for instance in data:
-            project = filter(lambda t: t.id == instance.tenant_id, projects)
             # If we could not get the project name, show the tenant_id with
             # a 'Deleted' identifier instead.
-            if project:
-                instance.project_name = getattr(project[0], "name", None)
+            if instance.tenant_id in project_names:
+                instance.project_name = project_names[instance.tenant_id]
             else:
                 deleted = _("Deleted")
                 instance.project_name = translation.string_concat(
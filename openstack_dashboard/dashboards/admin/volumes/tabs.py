@@ -18,7 +18,6 @@ from horizon import tabs
 
 from openstack_dashboard import api
 from openstack_dashboard.api import cinder
-from openstack_dashboard.api import keystone
 
 from openstack_dashboard.dashboards.admin.volumes.snapshots \
     import tables as snapshots_tables
@@ -28,6 +27,7 @@ from openstack_dashboard.dashboards.admin.volumes.volumes \
     import tables as volumes_tables
 from openstack_dashboard.dashboards.project.volumes \
     import tabs as volumes_tabs
+from openstack_dashboard import usage
 
 
 class VolumeTab(tabs.TableTab, volumes_tabs.VolumeTableMixIn):
@@ -36,6 +36,7 @@ class VolumeTab(tabs.TableTab, volumes_tabs.VolumeTableMixIn):
     slug = "volumes_tab"
     template_name = "admin/volumes/volumes/volumes_tables.html"
     preload = False
+    cache_data = True
 
     def get_volumes_data(self):
         volumes = self._get_volumes(search_opts={'all_tenants': True})
@@ -47,17 +48,18 @@ class VolumeTab(tabs.TableTab, volumes_tabs.VolumeTableMixIn):
 
         # Gather our tenants to correlate against IDs
         try:
-            tenants, has_more = keystone.tenant_list(self.request)
+            project_names = usage.get_project_names(
+                self.request,
+                [getattr(volume, "os-vol-tenant-attr:tenant_id", None)
+                 for volume in volumes])
         except Exception:
-            tenants = []
+            project_names = {}
             msg = _('Unable to retrieve volume project information.')
             exceptions.handle(self.request, msg)
 
-        tenant_dict = SortedDict([(t.id, t) for t in tenants])
         for volume in volumes:
             tenant_id = getattr(volume, "os-vol-tenant-attr:tenant_id", None)
-            tenant = tenant_dict.get(tenant_id, None)
-            volume.tenant_name = getattr(tenant, "name", None)
+            volume.tenant_name = project_names.get(tenant_id)
 
         return volumes
 
@@ -135,20 +137,22 @@ class SnapshotTab(tabs.TableTab):
 
             # Gather our tenants to correlate against volume IDs
             try:
-                tenants, has_more = keystone.tenant_list(self.request)
+                project_names = usage.get_project_names(
+                    self.request,
+                    [getattr(volumes.get(snapshot.volume_id),
+                             'os-vol-tenant-attr:tenant_id', None)
+                     for snapshot in snapshots])
             except Exception:
-                tenants = []
+                project_names = {}
                 msg = _('Unable to retrieve volume project information.')
                 exceptions.handle(self.request, msg)
 
-            tenant_dict = dict([(t.id, t) for t in tenants])
             for snapshot in snapshots:
                 volume = volumes.get(snapshot.volume_id)
                 tenant_id = getattr(volume,
                                     'os-vol-tenant-attr:tenant_id', None)
-                tenant = tenant_dict.get(tenant_id, None)
                 snapshot._volume = volume
-                snapshot.tenant_name = getattr(tenant, "name", None)
+                snapshot.tenant_name = project_names.get(tenant_id)
                 snapshot.host_name = getattr(
                     volume, 'os-vol-host-attr:host', None)
 
@@ -94,3 +94,4 @@ class VolumesTable(volumes_tables.VolumesTable):
                        UnmanageVolumeAction)
         columns = ('tenant', 'host', 'name', 'size', 'status', 'volume_type',
                    'attachments', 'bootable', 'encryption',)
+        paginate = True
@@ -166,17 +166,8 @@ class DeleteTenantsAction(tables.DeleteAction):
 
 
 class TenantFilterAction(tables.FilterAction):
-    def filter(self, table, tenants, filter_string):
-        """Really naive case-insensitive search."""
-        # FIXME(gabriel): This should be smarter. Written for demo purposes.
-        q = filter_string.lower()
-
-        def comp(tenant):
-            if q in tenant.name.lower():
-                return True
-            return False
-
-        return filter(comp, tenants)
+    filter_type = "server"
+    filter_choices = (('name', _("Project Name ="), True),)
 
 
 class UpdateRow(tables.Row):
@@ -14,6 +14,7 @@
 
 import copy
 import datetime
+import json
 import logging
 import os
 
@@ -34,7 +35,6 @@ from openstack_dashboard import api
 from openstack_dashboard.dashboards.identity.projects import workflows
 from openstack_dashboard import policy_backend
 from openstack_dashboard.test import helpers as test
-from openstack_dashboard import usage
 from openstack_dashboard.usage import quotas
 
 with_sel = os.environ.get('WITH_SELENIUM', False)
@@ -57,7 +57,8 @@ class TenantsViewTests(test.BaseAdminViewTests):
         api.keystone.tenant_list(IsA(http.HttpRequest),
                                  domain=None,
                                  paginate=True,
-                                 marker=None) \
+                                 marker=None,
+                                 filters=None) \
             .AndReturn([self.tenants.list(), False])
         self.mox.ReplayAll()
 
@@ -75,7 +76,8 @@ class TenantsViewTests(test.BaseAdminViewTests):
         api.keystone.tenant_list(IsA(http.HttpRequest),
                                  domain=domain.id,
                                  paginate=True,
-                                 marker=None) \
+                                 marker=None,
+                                 filters=None) \
                     .AndReturn([domain_tenants, False])
         self.mox.ReplayAll()
 
@@ -93,6 +95,7 @@ class ProjectsViewNonAdminTests(test.TestCase):
                                  user=self.user.id,
                                  paginate=True,
                                  marker=None,
+                                 filters=None,
                                  admin=False) \
             .AndReturn([self.tenants.list(), False])
         self.mox.ReplayAll()
@@ -102,6 +105,42 @@ class ProjectsViewNonAdminTests(test.TestCase):
         self.assertItemsEqual(res.context['table'].data, self.tenants.list())
 
 
+class MembersSearchViewTests(test.BaseAdminViewTests):
+    @test.create_stubs({api.keystone: ('user_list_paged',)})
+    def test_search_users(self):
+        self.setSessionValues(domain_context='1')
+        users = self.users.list()[:2]
+        api.keystone.user_list_paged(IsA(http.HttpRequest),
+                                     marker='1',
+                                     domain='1',
+                                     search='user') \
+            .AndReturn((users, True))
+        self.mox.ReplayAll()
+
+        # The domain of the query is ignored, the domain context is used.
+        url = reverse(workflows.SEARCH_MEMBERS_URL, args=['users'])
+        res = self.client.get(url, {'search': 'user', 'marker': '1',
+                                    'domain': '2'})
+        self.assertEqual('application/json', res['Content-Type'])
+        self.assertEqual({'items': [{'id': user.id, 'name': user.name}
+                                    for user in users],
+                          'has_more': True},
+                         json.loads(res.content))
+
+    @test.create_stubs({api.keystone: ('group_list_paged',)})
+    def test_search_groups_error(self):
+        api.keystone.group_list_paged(IsA(http.HttpRequest),
+                                      marker=None,
+                                      domain=None,
+                                      search='') \
+            .AndRaise(self.exceptions.keystone)
+        self.mox.ReplayAll()
+
+        url = reverse(workflows.SEARCH_MEMBERS_URL, args=['groups'])
+        res = self.client.get(url)
+        self.assertEqual(500, res.status_code)
+
+
 class CreateProjectWorkflowTests(test.BaseAdminViewTests):
     def _get_project_info(self, project):
         domain = self._get_default_domain()
@@ -981,6 +1020,73 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
              '<UpdateProjectGroups: update_group_members>',
              '<UpdateProjectQuota: update_quotas>'])
 
+    @override_settings(PROJECT_MEMBERSHIP_SEARCH=True)
+    @test.create_stubs({api.keystone: ('get_default_role',
+                                       'tenant_get',
+                                       'domain_get',
+                                       'user_list',
+                                       'user_names',
+                                       'group_list',
+                                       'group_names',
+                                       'role_list',
+                                       'get_project_users_roles',
+                                       'get_project_groups_roles'),
+                        quotas: ('get_tenant_quota_data',
+                                 'get_disabled_quotas')})
+    def test_update_project_get_membership_search(self):
+        project = self.tenants.first()
+        quota = self.quotas.first()
+        default_role = self.roles.first()
+        domain_id = project.domain_id
+        roles = self.roles.list()
+        users_roles = {'1': [roles[0].id], '2': [roles[1].id]}
+        groups_roles = {'1': [roles[0].id]}
+
+        api.keystone.tenant_get(IsA(http.HttpRequest),
+                                self.tenant.id, admin=True) \
+            .AndReturn(project)
+        api.keystone.domain_get(IsA(http.HttpRequest), domain_id) \
+            .AndReturn(self.domain)
+        quotas.get_disabled_quotas(IsA(http.HttpRequest)) \
+            .AndReturn(self.disabled_quotas.first())
+        quotas.get_tenant_quota_data(IsA(http.HttpRequest),
+                                     tenant_id=self.tenant.id) \
+            .AndReturn(quota)
+
+        # Only the current members are looked up, the roles only once.
+        api.keystone.get_default_role(IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(default_role)
+        api.keystone.get_project_users_roles(IsA(http.HttpRequest),
+                                             self.tenant.id) \
+            .AndReturn(users_roles)
+        api.keystone.user_names(IsA(http.HttpRequest), set(['1', '2'])) \
+            .AndReturn({'1': 'test_user', '2': 'user_two'})
+        api.keystone.role_list(IsA(http.HttpRequest)).AndReturn(roles)
+        api.keystone.get_project_groups_roles(IsA(http.HttpRequest),
+                                              self.tenant.id) \
+            .AndReturn(groups_roles)
+        api.keystone.group_names(IsA(http.HttpRequest), set(['1'])) \
+            .AndReturn({'1': 'group_one'})
+
+        self.mox.ReplayAll()
+
+        url = reverse('horizon:identity:projects:update',
+                      args=[self.tenant.id])
+        res = self.client.get(url)
+
+        workflow = res.context['workflow']
+        step = workflow.get_step(workflows.PROJECT_USER_MEMBER_SLUG)
+        field = step.action.fields[USER_ROLE_PREFIX + roles[0].id]
+        self.assertEqual([('1', 'test_user'), ('2', 'user_two')],
+                         list(field.choices))
+        self.assertEqual(['1'], field.initial)
+        self.assertContains(res, 'data-search-url="%s"'
+                            % reverse(workflows.SEARCH_MEMBERS_URL,
+                                      args=['users']))
+        step = workflow.get_step(workflows.PROJECT_GROUP_MEMBER_SLUG)
+        field = step.action.fields[GROUP_ROLE_PREFIX + roles[0].id]
+        self.assertEqual([('1', 'group_one')], list(field.choices))
+
     @test.create_stubs({api.keystone: ('tenant_get',
                                        'domain_get',
                                        'tenant_update',
@@ -1596,7 +1702,8 @@ class UsageViewTests(test.BaseAdminViewTests):
     def _test_usage_csv(self, nova_stu_enabled=True):
         now = timezone.now()
         usage_obj = api.nova.NovaUsage(self.usages.first())
-        self._stub_nova_api_calls(nova_stu_enabled)
+        self.mox.StubOutWithMock(api.nova, 'usage_get')
+        self.mox.StubOutWithMock(api.nova, 'extension_supported')
         api.nova.extension_supported(
             'SimpleTenantUsage', IsA(http.HttpRequest)) \
             .AndReturn(nova_stu_enabled)
@@ -1607,23 +1714,18 @@ class UsageViewTests(test.BaseAdminViewTests):
             api.nova.usage_get(IsA(http.HttpRequest),
                                self.tenant.id,
                                start, end).AndReturn(usage_obj)
-        api.nova.tenant_absolute_limits(IsA(http.HttpRequest))\
-            .AndReturn(self.limits['absolute'])
-        api.cinder.tenant_absolute_limits(IsA(http.HttpRequest)) \
-            .AndReturn(self.cinder_limits['absolute'])
-        self._stub_neutron_api_calls()
         self.mox.ReplayAll()
 
         project_id = self.tenants.first().id
         csv_url = reverse('horizon:identity:projects:usage',
                           args=[project_id]) + "?format=csv"
         res = self.client.get(csv_url)
-        self.assertTemplateUsed(res, 'project/overview/usage.csv')
-
-        self.assertTrue(isinstance(res.context['usage'], usage.ProjectUsage))
+        self.assertTrue(res.streaming)
+        content = b''.join(res.streaming_content).decode('utf-8')
+        self.assertIn('Project ID:,%s\n' % project_id, content)
         hdr = ('Instance Name,VCPUs,RAM (MB),Disk (GB),Usage (Hours),'
                'Time since created (Seconds),State')
-        self.assertContains(res, '%s\r\n' % hdr)
+        self.assertIn('%s\r\n' % hdr, content)
 
 
 class DetailProjectViewTests(test.BaseAdminViewTests):
@@ -26,6 +26,8 @@ urlpatterns = patterns(
     '',
     url(r'^$', views.IndexView.as_view(), name='index'),
     url(r'^create$', views.CreateProjectView.as_view(), name='create'),
+    url(r'^(?P<kind>users|groups)/search/$',
+        views.MembersSearchView.as_view(), name='search_members'),
     url(r'^(?P<tenant_id>[^/]+)/update/$',
         views.UpdateProjectView.as_view(), name='update'),
     url(r'^(?P<project_id>[^/]+)/usage/$',
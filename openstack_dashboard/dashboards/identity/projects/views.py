@@ -16,7 +16,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+import logging
+
 from django.core.urlresolvers import reverse
+from django import http
 from django.utils.translation import ugettext_lazy as _
 from django.views import generic
 
@@ -39,6 +43,8 @@ from openstack_dashboard.dashboards.identity.projects \
 from openstack_dashboard.dashboards.project.overview \
     import views as project_views
 
+LOG = logging.getLogger(__name__)
+
 PROJECT_INFO_FIELDS = ("domain_id",
                        "domain_name",
                        "name",
@@ -86,7 +92,8 @@ class IndexView(tables.DataTableView):
                     self.request,
                     domain=domain_context,
                     paginate=True,
-                    marker=marker)
+                    marker=marker,
+                    filters=self.get_api_filters())
             except Exception:
                 exceptions.handle(self.request,
                                   _("Unable to retrieve project list."))
@@ -98,6 +105,7 @@ class IndexView(tables.DataTableView):
                     user=self.request.user.id,
                     paginate=True,
                     marker=marker,
+                    filters=self.get_api_filters(),
                     admin=False)
             except Exception:
                 exceptions.handle(self.request,
@@ -109,6 +117,42 @@ class IndexView(tables.DataTableView):
         return tenants
 
 
+class MembersSearchView(generic.View):
+    """Returns a page of the users or groups which can be project members.
+
+    Backs the membership steps of the project workflows when
+    ``PROJECT_MEMBERSHIP_SEARCH`` is enabled, so that they do not have to
+    list every user and group of the domain.
+    """
+    list_functions = {
+        'users': (("identity", "identity:list_users"), 'user_list_paged'),
+        'groups': (("identity", "identity:list_groups"), 'group_list_paged'),
+    }
+
+    def get(self, request, kind):
+        rule, function_name = self.list_functions[kind]
+        if not policy.check((rule,), request):
+            return http.HttpResponseForbidden()
+        # The domain is not taken from the query, only the domain the
+        # dashboard is scoped to can be searched.
+        domain = (request.session.get('domain_context') or
+                  getattr(request.user, 'user_domain_id', None))
+        try:
+            items, has_more = getattr(api.keystone, function_name)(
+                request,
+                marker=request.GET.get('marker') or None,
+                domain=domain,
+                search=request.GET.get('search', ''))
+        except Exception:
+            LOG.exception("Unable to search the project %s.", kind)
+            return http.HttpResponseServerError()
+        data = {'items': [{'id': item.id, 'name': item.name}
+                          for item in items],
+                'has_more': has_more}
+        return http.HttpResponse(json.dumps(data),
+                                 content_type='application/json')
+
+
 class ProjectUsageView(usage.UsageView):
     table_class = usage.ProjectUsageTable
     usage_class = usage.ProjectUsage
@@ -38,12 +38,67 @@ from openstack_dashboard.usage import quotas
 
 INDEX_URL = "horizon:identity:projects:index"
 ADD_USER_URL = "horizon:identity:projects:create_user"
+SEARCH_MEMBERS_URL = "horizon:identity:projects:search_members"
 PROJECT_GROUP_ENABLED = keystone.VERSIONS.active >= 3
 PROJECT_USER_MEMBER_SLUG = "update_members"
 PROJECT_GROUP_MEMBER_SLUG = "update_group_members"
 COMMON_HORIZONTAL_TEMPLATE = "identity/projects/_common_horizontal_form.html"
 
 
+def _is_membership_search_enabled():
+    return getattr(settings, 'PROJECT_MEMBERSHIP_SEARCH', False)
+
+
+@memoized.memoized
+def _get_roles(request):
+    # The membership steps and the workflow all need the roles.
+    return api.keystone.role_list(request)
+
+
+def _role_list(request):
+    if _is_membership_search_enabled():
+        return _get_roles(request)
+    return api.keystone.role_list(request)
+
+
+def _get_search_url(kind):
+    if not _is_membership_search_enabled():
+        return None
+    return reverse(SEARCH_MEMBERS_URL, args=[kind])
+
+
+def _get_posted_members(action):
+    """Returns the IDs of the members posted in the role fields of action.
+
+    With membership search, the members added in the browser are not among
+    the choices of the fields, which only hold the current members.
+    """
+    if not action.is_bound:
+        return []
+    prefix = action.get_member_field_name('')
+    member_ids = set()
+    for field_name in action.data:
+        if field_name.startswith(prefix):
+            member_ids.update(action.data.getlist(field_name))
+    return sorted(member_ids)
+
+
+def _get_role_changes(member_step, data, members_roles, available_roles):
+    """Returns the (member ID, role ID) assignments to grant and to revoke.
+
+    ``members_roles`` maps the ID of every current member to the IDs of its
+    roles, which are compared with the ones posted in the member step.
+    """
+    current = set((member_id, role_id)
+                  for member_id, role_ids in members_roles.items()
+                  for role_id in role_ids)
+    requested = set((member_id, role.id)
+                    for role in available_roles
+                    for member_id in
+                    data[member_step.get_member_field_name(role.id)])
+    return requested - current, current - requested
+
+
 class ProjectQuotaAction(workflows.Action):
     ifcb_label = _("Injected File Content (Bytes)")
     metadata_items = forms.IntegerField(min_value=-1,
@@ -232,18 +287,39 @@ class UpdateProjectMembersAction(workflows.MembershipAction):
         self.fields[default_role_name].initial = default_role.id
 
         # Get list of available users
-        all_users = []
-        try:
-            all_users = api.keystone.user_list(request,
-                                               domain=domain_id)
-        except Exception:
-            exceptions.handle(request, err_msg)
-        users_list = [(user.id, user.name) for user in all_users]
+        users_roles = None
+        if _is_membership_search_enabled():
+            # Only the current members are listed, the other users are
+            # searched for as the available list is filtered.
+            users_roles = {}
+            user_ids = set()
+            user_names = {}
+            try:
+                if project_id:
+                    users_roles = api.keystone.get_project_users_roles(
+                        request, project_id)
+                user_ids = set(users_roles) | set(_get_posted_members(self))
+                user_names = api.keystone.user_names(request, user_ids)
+            except Exception:
+                exceptions.handle(request,
+                                  err_msg,
+                                  redirect=reverse(INDEX_URL))
+            users_list = sorted(((user_id, user_names.get(user_id, user_id))
+                                 for user_id in user_ids),
+                                key=lambda user: user[1])
+        else:
+            all_users = []
+            try:
+                all_users = api.keystone.user_list(request,
+                                                   domain=domain_id)
+            except Exception:
+                exceptions.handle(request, err_msg)
+            users_list = [(user.id, user.name) for user in all_users]
 
         # Get list of roles
         role_list = []
         try:
-            role_list = api.keystone.role_list(request)
+            role_list = _role_list(request)
         except Exception:
             exceptions.handle(request,
                               err_msg,
@@ -257,7 +333,7 @@ class UpdateProjectMembersAction(workflows.MembershipAction):
             self.fields[field_name].initial = []
 
         # Figure out users & roles
-        if project_id:
+        if project_id and users_roles is None:
             try:
                 users_roles = api.keystone.get_project_users_roles(request,
                                                                    project_id)
@@ -266,6 +342,7 @@ class UpdateProjectMembersAction(workflows.MembershipAction):
                                   err_msg,
                                   redirect=reverse(INDEX_URL))
 
+        if users_roles:
             for user_id in users_roles:
                 roles_ids = users_roles[user_id]
                 for role_id in roles_ids:
@@ -284,10 +361,14 @@ class UpdateProjectMembers(workflows.UpdateMembersStep):
     no_available_text = _("No users found.")
     no_members_text = _("No users.")
 
+    @property
+    def search_url(self):
+        return _get_search_url('users')
+
     def contribute(self, data, context):
         if data:
             try:
-                roles = api.keystone.role_list(self.workflow.request)
+                roles = _role_list(self.workflow.request)
             except Exception:
                 exceptions.handle(self.workflow.request,
                                   _('Unable to retrieve user list.'))
@@ -330,18 +411,41 @@ class UpdateProjectGroupsAction(workflows.MembershipAction):
         self.fields[default_role_name].initial = default_role.id
 
         # Get list of available groups
-        all_groups = []
-        try:
-            all_groups = api.keystone.group_list(request,
-                                                 domain=domain_id)
-        except Exception:
-            exceptions.handle(request, err_msg)
-        groups_list = [(group.id, group.name) for group in all_groups]
+        groups_roles = None
+        if _is_membership_search_enabled():
+            # Only the current groups are listed, the other groups are
+            # searched for as the available list is filtered.
+            groups_roles = {}
+            group_ids = set()
+            group_names = {}
+            try:
+                if project_id:
+                    groups_roles = api.keystone.get_project_groups_roles(
+                        request, project_id)
+                group_ids = (set(groups_roles) |
+                             set(_get_posted_members(self)))
+                group_names = api.keystone.group_names(request, group_ids)
+            except Exception:
+                exceptions.handle(request,
+                                  err_msg,
+                                  redirect=reverse(INDEX_URL))
+            groups_list = sorted(((group_id,
+                                   group_names.get(group_id, group_id))
+                                  for group_id in group_ids),
+                                 key=lambda group: group[1])
+        else:
+            all_groups = []
+            try:
+                all_groups = api.keystone.group_list(request,
+                                                     domain=domain_id)
+            except Exception:
+                exceptions.handle(request, err_msg)
+            groups_list = [(group.id, group.name) for group in all_groups]
 
         # Get list of roles
         role_list = []
         try:
-            role_list = api.keystone.role_list(request)
+            role_list = _role_list(request)
         except Exception:
             exceptions.handle(request,
                               err_msg,
@@ -355,7 +459,7 @@ class UpdateProjectGroupsAction(workflows.MembershipAction):
             self.fields[field_name].initial = []
 
         # Figure out groups & roles
-        if project_id:
+        if project_id and groups_roles is None:
             try:
                 groups_roles = api.keystone.get_project_groups_roles(
                     request, project_id)
@@ -364,6 +468,7 @@ class UpdateProjectGroupsAction(workflows.MembershipAction):
                                   err_msg,
                                   redirect=reverse(INDEX_URL))
 
+        if groups_roles:
             for group_id in groups_roles:
                 roles_ids = groups_roles[group_id]
                 for role_id in roles_ids:
@@ -382,10 +487,14 @@ class UpdateProjectGroups(workflows.UpdateMembersStep):
     no_available_text = _("No groups found.")
     no_members_text = _("No groups.")
 
+    @property
+    def search_url(self):
+        return _get_search_url('groups')
+
     def contribute(self, data, context):
         if data:
             try:
-                roles = api.keystone.role_list(self.workflow.request)
+                roles = _role_list(self.workflow.request)
             except Exception:
                 exceptions.handle(self.workflow.request,
                                   _('Unable to retrieve role list.'))
@@ -469,7 +578,7 @@ class CreateProject(CommonQuotaWorkflow):
         # update project members
         users_to_add = 0
         try:
-            available_roles = api.keystone.role_list(request)
+            available_roles = _role_list(request)
             member_step = self.get_step(PROJECT_USER_MEMBER_SLUG)
             # count how many users are to be added
             for role in available_roles:
@@ -505,7 +614,7 @@ class CreateProject(CommonQuotaWorkflow):
         # update project groups
         groups_to_add = 0
         try:
-            available_roles = api.keystone.role_list(request)
+            available_roles = _role_list(request)
             member_step = self.get_step(PROJECT_GROUP_MEMBER_SLUG)
 
             # count how many groups are to be added
@@ -626,7 +735,7 @@ class UpdateProject(CommonQuotaWorkflow):
 
     @memoized.memoized_method
     def _get_available_roles(self, request):
-        return api.keystone.role_list(request)
+        return _role_list(request)
 
     def _update_project(self, request, data):
         # update project info
@@ -765,6 +874,8 @@ class UpdateProject(CommonQuotaWorkflow):
             auth_utils.remove_project_cache(request.user.token.unscoped_token)
 
     def _update_project_groups(self, request, data, project_id, domain_id):
+        if _is_membership_search_enabled():
+            return self._update_project_group_roles(request, data, project_id)
         # update project groups
         groups_to_modify = 0
         member_step = self.get_step(PROJECT_GROUP_MEMBER_SLUG)
@@ -838,6 +949,38 @@ class UpdateProject(CommonQuotaWorkflow):
                               % groups_to_modify)
             return False
 
+    def _update_project_group_roles(self, request, data, project_id):
+        # Only send the role assignments which changed, from a single
+        # listing of the current ones.
+        groups_to_modify = 0
+        member_step = self.get_step(PROJECT_GROUP_MEMBER_SLUG)
+        try:
+            available_roles = self._get_available_roles(request)
+            groups_roles = api.keystone.get_project_groups_roles(
+                request, project_id)
+            grants, revokes = _get_role_changes(member_step, data,
+                                                groups_roles, available_roles)
+            groups_to_modify = len(set(group_id for group_id, role_id
+                                       in grants | revokes))
+            for group_id, role_id in revokes:
+                api.keystone.remove_group_role(request,
+                                               role=role_id,
+                                               group=group_id,
+                                               project=project_id)
+            for group_id, role_id in grants:
+                api.keystone.add_group_role(request,
+                                            role=role_id,
+                                            group=group_id,
+                                            project=project_id)
+            return True
+        except Exception:
+            exceptions.handle(request,
+                              _('Failed to modify %s project '
+                                'members, update project groups '
+                                'and update project quotas.')
+                              % groups_to_modify)
+            return False
+
     def _update_project_quota(self, request, data, project_id):
         try:
             super(UpdateProject, self)._update_project_quota(
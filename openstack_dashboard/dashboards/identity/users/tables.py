@@ -166,12 +166,9 @@ class DeleteUsersAction(tables.DeleteAction):
 
 
 class UserFilterAction(tables.FilterAction):
-    def filter(self, table, users, filter_string):
-        """Naive case-insensitive search."""
-        q = filter_string.lower()
-        return [user for user in users
-                if q in user.name.lower()
-                or q in (getattr(user, 'email', None) or '').lower()]
+    filter_type = "server"
+    filter_choices = (('search', _("User Name or Email"), True),
+                      ('name', _("User Name ="), True))
 
 
 class UpdateRow(tables.Row):
@@ -53,13 +53,16 @@ class UsersViewTests(test.BaseAdminViewTests):
                      if user.domain_id == domain_id]
         return users
 
-    @test.create_stubs({api.keystone: ('user_list',)})
+    @test.create_stubs({api.keystone: ('user_list_paged',)})
     def test_index(self):
         domain = self._get_default_domain()
         domain_id = domain.id
         users = self._get_users(domain_id)
-        api.keystone.user_list(IgnoreArg(),
-                               domain=domain_id).AndReturn(users)
+        api.keystone.user_list_paged(IgnoreArg(),
+                                     marker=None,
+                                     domain=domain_id,
+                                     filters=None,
+                                     search=None).AndReturn((users, False))
 
         self.mox.ReplayAll()
         res = self.client.get(USERS_INDEX_URL)
@@ -76,6 +79,26 @@ class UsersViewTests(test.BaseAdminViewTests):
                               domain_context_name=domain.name)
         self.test_index()
 
+    @test.create_stubs({api.keystone: ('user_list_paged',)})
+    def test_index_search(self):
+        domain = self._get_default_domain()
+        users = self._get_users(domain.id)
+        api.keystone.user_list_paged(IgnoreArg(),
+                                     marker=None,
+                                     domain=domain.id,
+                                     filters=None,
+                                     search='example').AndReturn((users,
+                                                                  False))
+        self.mox.ReplayAll()
+
+        # The name or email search is not an exact match filter.
+        res = self.client.post(USERS_INDEX_URL,
+                               {'users__filter__q': 'example',
+                                'users__filter__q_field': 'search'})
+        self.assertRedirectsNoFollow(res, USERS_INDEX_URL)
+        res = self.client.get(USERS_INDEX_URL)
+        self.assertItemsEqual(res.context['table'].data, users)
+
     @test.create_stubs({api.keystone: ('user_create',
                                        'get_default_domain',
                                        'tenant_list',
@@ -488,7 +511,8 @@ class UsersViewTests(test.BaseAdminViewTests):
             res, "form", 'password',
             ['Password must be between 8 and 18 characters.'])
 
-    @test.create_stubs({api.keystone: ('user_update_enabled', 'user_list')})
+    @test.create_stubs({api.keystone: ('user_update_enabled',
+                                       'user_list_paged')})
     def test_enable_user(self):
         domain = self._get_default_domain()
         domain_id = domain.id
@@ -496,7 +520,10 @@ class UsersViewTests(test.BaseAdminViewTests):
         users = self._get_users(domain_id)
         user.enabled = False
 
-        api.keystone.user_list(IgnoreArg(), domain=domain_id).AndReturn(users)
+        api.keystone.user_list_paged(IgnoreArg(), marker=None,
+                                     domain=domain_id, filters=None,
+                                     search=None) \
+            .AndReturn((users, False))
         api.keystone.user_update_enabled(IgnoreArg(),
                                          user.id,
                                          True).AndReturn(user)
@@ -508,7 +535,8 @@ class UsersViewTests(test.BaseAdminViewTests):
 
         self.assertRedirectsNoFollow(res, USERS_INDEX_URL)
 
-    @test.create_stubs({api.keystone: ('user_update_enabled', 'user_list')})
+    @test.create_stubs({api.keystone: ('user_update_enabled',
+                                       'user_list_paged')})
     def test_disable_user(self):
         domain = self._get_default_domain()
         domain_id = domain.id
@@ -517,8 +545,10 @@ class UsersViewTests(test.BaseAdminViewTests):
 
         self.assertTrue(user.enabled)
 
-        api.keystone.user_list(IgnoreArg(), domain=domain_id) \
-            .AndReturn(users)
+        api.keystone.user_list_paged(IgnoreArg(), marker=None,
+                                     domain=domain_id, filters=None,
+                                     search=None) \
+            .AndReturn((users, False))
         api.keystone.user_update_enabled(IgnoreArg(),
                                          user.id,
                                          False).AndReturn(user)
@@ -530,7 +560,8 @@ class UsersViewTests(test.BaseAdminViewTests):
 
         self.assertRedirectsNoFollow(res, USERS_INDEX_URL)
 
-    @test.create_stubs({api.keystone: ('user_update_enabled', 'user_list')})
+    @test.create_stubs({api.keystone: ('user_update_enabled',
+                                       'user_list_paged')})
     def test_enable_disable_user_exception(self):
         domain = self._get_default_domain()
         domain_id = domain.id
@@ -538,8 +569,10 @@ class UsersViewTests(test.BaseAdminViewTests):
         users = self._get_users(domain_id)
         user.enabled = False
 
-        api.keystone.user_list(IgnoreArg(), domain=domain_id) \
-            .AndReturn(users)
+        api.keystone.user_list_paged(IgnoreArg(), marker=None,
+                                     domain=domain_id, filters=None,
+                                     search=None) \
+            .AndReturn((users, False))
         api.keystone.user_update_enabled(IgnoreArg(), user.id, True) \
                     .AndRaise(self.exceptions.keystone)
         self.mox.ReplayAll()
@@ -549,14 +582,16 @@ class UsersViewTests(test.BaseAdminViewTests):
 
         self.assertRedirectsNoFollow(res, USERS_INDEX_URL)
 
-    @test.create_stubs({api.keystone: ('user_list',)})
+    @test.create_stubs({api.keystone: ('user_list_paged',)})
     def test_disabling_current_user(self):
         domain = self._get_default_domain()
         domain_id = domain.id
         users = self._get_users(domain_id)
         for i in range(0, 2):
-            api.keystone.user_list(IgnoreArg(), domain=domain_id) \
-                .AndReturn(users)
+            api.keystone.user_list_paged(IgnoreArg(), marker=None,
+                                         domain=domain_id, filters=None,
+                                         search=None) \
+                .AndReturn((users, False))
 
         self.mox.ReplayAll()
 
@@ -567,14 +602,16 @@ class UsersViewTests(test.BaseAdminViewTests):
                          u'You cannot disable the user you are currently '
                          u'logged in as.')
 
-    @test.create_stubs({api.keystone: ('user_list',)})
+    @test.create_stubs({api.keystone: ('user_list_paged',)})
     def test_delete_user_with_improper_permissions(self):
         domain = self._get_default_domain()
         domain_id = domain.id
         users = self._get_users(domain_id)
         for i in range(0, 2):
-            api.keystone.user_list(IgnoreArg(), domain=domain_id) \
-                .AndReturn(users)
+            api.keystone.user_list_paged(IgnoreArg(), marker=None,
+                                         domain=domain_id, filters=None,
+                                         search=None) \
+                .AndReturn((users, False))
 
         self.mox.ReplayAll()
 
@@ -622,7 +659,7 @@ class SeleniumTests(test.SeleniumAdminTestCase):
                                        'tenant_list',
                                        'get_default_role',
                                        'role_list',
-                                       'user_list')})
+                                       'user_list_paged')})
     def test_modal_create_user_with_passwords_not_matching(self):
         domain = self._get_default_domain()
 
@@ -631,8 +668,9 @@ class SeleniumTests(test.SeleniumAdminTestCase):
         api.keystone.tenant_list(IgnoreArg(), domain=None, user=None) \
             .AndReturn([self.tenants.list(), False])
         api.keystone.role_list(IgnoreArg()).AndReturn(self.roles.list())
-        api.keystone.user_list(IgnoreArg(), domain=None) \
-            .AndReturn(self.users.list())
+        api.keystone.user_list_paged(IgnoreArg(), marker=None, domain=None,
+                                     filters=None, search=None) \
+            .AndReturn((self.users.list(), False))
         api.keystone.get_default_role(IgnoreArg()) \
                     .AndReturn(self.roles.first())
         self.mox.ReplayAll()
@@ -45,14 +45,26 @@ class IndexView(tables.DataTableView):
     template_name = 'identity/users/index.html'
     page_title = _("Users")
 
+    def has_more_data(self, table):
+        return self._more
+
     def get_data(self):
         users = []
+        marker = self.request.GET.get(
+            project_tables.UsersTable._meta.pagination_param, None)
         domain_context = self.request.session.get('domain_context', None)
+        self._more = False
         if policy.check((("identity", "identity:list_users"),),
                         self.request):
+            filters = self.get_api_filters() or {}
+            search = filters.pop('search', None)
             try:
-                users = api.keystone.user_list(self.request,
-                                               domain=domain_context)
+                users, self._more = api.keystone.user_list_paged(
+                    self.request,
+                    marker=marker,
+                    domain=domain_context,
+                    filters=filters or None,
+                    search=search)
             except Exception:
                 exceptions.handle(self.request,
                                   _('Unable to retrieve user list.'))
@@ -388,6 +388,9 @@ class DownloadObject(tables.LinkAction):
 
 class ObjectFilterAction(tables.FilterAction):
     def _filtered_data(self, table, filter_string):
+        # The subfolders and the objects are filtered from the same listing.
+        if getattr(self, '_filter_string', None) == filter_string:
+            return self.filtered_data
         request = table.request
         container = self.table.kwargs['container_name']
         subfolder = self.table.kwargs['subfolder_path']
@@ -396,6 +399,7 @@ class ObjectFilterAction(tables.FilterAction):
                                                             filter_string,
                                                             container,
                                                             prefix=prefix)
+        self._filter_string = filter_string
         return self.filtered_data
 
     def filter_subfolders_data(self, table, objects, filter_string):
@@ -22,6 +22,7 @@ import tempfile
 import django
 from django.core.files.uploadedfile import InMemoryUploadedFile  # noqa
 from django import http
+from django import test as django_test
 from django.utils import http as utils_http
 
 from mox import IsA  # noqa
@@ -58,6 +59,23 @@ def invalid_paths():
     return INVALID_PATHS
 
 
+class FakeSegmentWriter(object):
+    size = 0
+    data = b''
+    closed = False
+    aborted = False
+
+    def write(self, data):
+        self.data += data
+        self.size += len(data)
+
+    def close(self):
+        self.closed = True
+
+    def abort(self):
+        self.aborted = True
+
+
 class SwiftTests(test.TestCase):
 
     def _test_invalid_paths(self, response):
@@ -230,6 +248,81 @@ class SwiftTests(test.TestCase):
         index_url = reverse('horizon:project:containers:index', args=args)
         self.assertRedirectsNoFollow(res, index_url)
 
+    def _post_segmented(self, form_data, client=None):
+        self.addCleanup(setattr, api.swift, 'SEGMENT_SIZE',
+                        api.swift.SEGMENT_SIZE)
+        api.swift.SEGMENT_SIZE = 100
+        temp_file = tempfile.TemporaryFile()
+        temp_file.write(b'x' * 1000)
+        temp_file.flush()
+        temp_file.seek(0)
+        container = self.containers.first()
+        upload_url = reverse('horizon:project:containers:object_upload',
+                             args=[container.name])
+        form_data = dict(form_data, object_file=temp_file)
+        return (client or self.client).post(upload_url, form_data)
+
+    @test.create_stubs({api.swift: ('swift_upload_object', 'SegmentWriter')})
+    def test_upload_segmented(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+
+        def store(request, container_name, object_name, upload):
+            upload.stored = True
+
+        writer = FakeSegmentWriter()
+        api.swift.SegmentWriter(IsA(http.HttpRequest), container.name) \
+            .AndReturn(writer)
+        api.swift.swift_upload_object(IsA(http.HttpRequest),
+                                      container.name,
+                                      obj.name,
+                                      IsA(api.swift.SegmentedUpload)) \
+            .WithSideEffects(store).AndReturn(obj)
+        self.mox.ReplayAll()
+
+        res = self._post_segmented({'method': forms.UploadObject.__name__,
+                                    'container_name': container.name,
+                                    'name': obj.name})
+
+        args = (utils.wrap_delimiter(container.name),)
+        index_url = reverse('horizon:project:containers:index', args=args)
+        self.assertRedirectsNoFollow(res, index_url)
+        # The file was handed to the writer as it was received.
+        self.assertEqual(b'x' * 1000, writer.data)
+        self.assertTrue(writer.closed)
+        self.assertFalse(writer.aborted)
+
+    @test.create_stubs({api.swift: ('SegmentWriter',)})
+    def test_upload_segmented_invalid_form(self):
+        container = self.containers.first()
+        writer = FakeSegmentWriter()
+        api.swift.SegmentWriter(IsA(http.HttpRequest), container.name) \
+            .AndReturn(writer)
+        self.mox.ReplayAll()
+
+        res = self._post_segmented({'method': forms.UploadObject.__name__,
+                                    'container_name': container.name,
+                                    'name': ''})
+
+        self.assertTemplateUsed(res, 'project/containers/upload.html')
+        # The segments of the file are not left behind.
+        self.assertTrue(writer.aborted)
+
+    def test_upload_segmented_csrf(self):
+        # Without the CSRF header, nothing is written to Swift before the
+        # token of the form is checked.
+        self.mox.StubOutWithMock(api.swift, 'SegmentWriter')
+        self.mox.ReplayAll()
+
+        client = django_test.Client(enforce_csrf_checks=True)
+        client.cookies = self.client.cookies
+        container = self.containers.first()
+        res = self._post_segmented({'method': forms.UploadObject.__name__,
+                                    'container_name': container.name,
+                                    'name': 'name'}, client=client)
+
+        self.assertEqual(403, res.status_code)
+
     @test.create_stubs({api.swift: ('swift_upload_object',)})
     def test_upload_without_file(self):
         container = self.containers.first()
@@ -346,7 +439,8 @@ class SwiftTests(test.TestCase):
                     IsA(http.HttpRequest),
                     container.name,
                     obj.name,
-                    resp_chunk_size=api.swift.CHUNK_SIZE).AndReturn(obj)
+                    resp_chunk_size=api.swift.CHUNK_SIZE,
+                    headers={}).AndReturn(obj)
                 self.mox.ReplayAll()
 
                 download_url = reverse(
@@ -373,6 +467,107 @@ class SwiftTests(test.TestCase):
                     'attachment; filename=%s' % expected_name
                 )
 
+    @test.create_stubs({api.swift: ('swift_get_object',)})
+    def test_download_range(self):
+        container = self.containers.first()
+        obj = copy.copy(self.objects.first())
+        obj._apidict = dict(obj._apidict,
+                            bytes=4,
+                            etag='abc',
+                            last_modified='Tue, 20 Oct 2015 10:00:00 GMT',
+                            content_range='bytes 2-5/10')
+        obj.data = iter([b'data'])
+        api.swift.swift_get_object(
+            IsA(http.HttpRequest),
+            container.name,
+            obj.name,
+            resp_chunk_size=api.swift.CHUNK_SIZE,
+            headers={'Range': 'bytes=2-5',
+                     'If-Match': '"abc"'}).AndReturn(obj)
+        self.mox.ReplayAll()
+
+        download_url = reverse('horizon:project:containers:object_download',
+                               args=[container.name, obj.name])
+        res = self.client.get(download_url, HTTP_RANGE='bytes=2-5',
+                              HTTP_IF_RANGE='"abc"')
+
+        self.assertEqual(206, res.status_code)
+        self.assertEqual('bytes 2-5/10', res['Content-Range'])
+        self.assertEqual('4', res['Content-Length'])
+        self.assertEqual('"abc"', res['ETag'])
+        self.assertEqual('Tue, 20 Oct 2015 10:00:00 GMT',
+                         res['Last-Modified'])
+        self.assertEqual(b'data', b''.join(res.streaming_content))
+
+    @test.create_stubs({api.swift: ('swift_get_object',)})
+    def test_download_multiple_ranges(self):
+        container = self.containers.first()
+        obj = copy.copy(self.objects.first())
+        obj.data = iter([obj.data])
+        api.swift.swift_get_object(
+            IsA(http.HttpRequest),
+            container.name,
+            obj.name,
+            resp_chunk_size=api.swift.CHUNK_SIZE,
+            headers={}).AndReturn(obj)
+        self.mox.ReplayAll()
+
+        download_url = reverse('horizon:project:containers:object_download',
+                               args=[container.name, obj.name])
+        res = self.client.get(download_url, HTTP_RANGE='bytes=0-1,4-5',
+                              HTTP_IF_RANGE='"abc"')
+        self.assertEqual(200, res.status_code)
+        self.assertEqual('application/octet-stream', res['Content-Type'])
+        self.assertFalse(res.has_header('Content-Range'))
+
+    @test.create_stubs({api.swift: ('swift_get_object',)})
+    def test_download_range_changed(self):
+        container = self.containers.first()
+        obj = copy.copy(self.objects.first())
+        obj.data = iter([obj.data])
+        exc = copy.copy(self.exceptions.swift)
+        exc.http_status = 412
+        api.swift.swift_get_object(
+            IsA(http.HttpRequest),
+            container.name,
+            obj.name,
+            resp_chunk_size=api.swift.CHUNK_SIZE,
+            headers={'Range': 'bytes=2-5',
+                     'If-Match': '"abc"'}).AndRaise(exc)
+        api.swift.swift_get_object(
+            IsA(http.HttpRequest),
+            container.name,
+            obj.name,
+            resp_chunk_size=api.swift.CHUNK_SIZE,
+            headers={}).AndReturn(obj)
+        self.mox.ReplayAll()
+
+        download_url = reverse('horizon:project:containers:object_download',
+                               args=[container.name, obj.name])
+        res = self.client.get(download_url, HTTP_RANGE='bytes=2-5',
+                              HTTP_IF_RANGE='"abc"')
+        self.assertEqual(200, res.status_code)
+        self.assertFalse(res.has_header('Content-Range'))
+
+    @test.create_stubs({api.swift: ('swift_get_object',)})
+    def test_download_not_modified(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+        exc = copy.copy(self.exceptions.swift)
+        exc.http_status = 304
+        api.swift.swift_get_object(
+            IsA(http.HttpRequest),
+            container.name,
+            obj.name,
+            resp_chunk_size=api.swift.CHUNK_SIZE,
+            headers={'If-None-Match': '"abc"'}).AndRaise(exc)
+        self.mox.ReplayAll()
+
+        download_url = reverse('horizon:project:containers:object_download',
+                               args=[container.name, obj.name])
+        res = self.client.get(download_url, HTTP_IF_NONE_MATCH='"abc"')
+        self.assertEqual(304, res.status_code)
+
     @test.create_stubs({api.swift: ('swift_get_containers',)})
     def test_copy_index(self):
         ret = (self.containers.list(), False)
@@ -10,6 +10,13 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import sys
+
+from django.conf import settings
+from django.core.files import uploadhandler
+from django.utils.crypto import constant_time_compare
+from django.utils.http import same_origin
+
 from openstack_dashboard.api import swift
 
 
@@ -17,3 +24,101 @@ def wrap_delimiter(name):
     if name and not name.endswith(swift.FOLDER_DELIMITER):
         return name + swift.FOLDER_DELIMITER
     return name
+
+
+def has_csrf_header(request):
+    """Returns whether the request passes the CSRF check with the token of
+    its ``X-CSRFToken`` header.
+
+    Unlike the token of the form, the header can be checked before the body
+    of the request is parsed.
+    """
+    if getattr(request, '_dont_enforce_csrf_checks', False):
+        return True
+    if request.is_secure():
+        referer = request.META.get('HTTP_REFERER')
+        good_referer = 'https://%s/' % request.get_host()
+        if not referer or not same_origin(referer, good_referer):
+            return False
+    token = request.META.get('HTTP_X_CSRFTOKEN', '')
+    cookie = request.COOKIES.get(settings.CSRF_COOKIE_NAME, '')
+    return bool(token) and constant_time_compare(token, cookie)
+
+
+class SegmentedUploadHandler(uploadhandler.FileUploadHandler):
+    """Uploads large object files to Swift while they are received.
+
+    The ``object_file`` of a request larger than
+    ``SWIFT_UPLOAD_SEGMENT_SIZE`` is neither kept in memory nor spooled to
+    the disk; its data is written to a :class:`~openstack_dashboard.api.
+    swift.SegmentWriter` as it arrives and the file is replaced by a
+    :class:`~openstack_dashboard.api.swift.SegmentedUpload`. Smaller
+    requests, and requests which do not pass the CSRF check with the token
+    of their header, are left to the default upload handlers, so nothing is
+    written to Swift before the request is known to be legitimate.
+
+    The segments which do not end up in an object, e.g. because the form
+    is invalid or the client disconnected, are deleted by :meth:`discard`.
+    """
+
+    def __init__(self, request, container_name):
+        super(SegmentedUploadHandler, self).__init__(request)
+        self.container_name = container_name
+        self.activated = False
+        self.writer = None
+        self.exc_info = None
+        self.uploads = []
+
+    def handle_raw_input(self, input_data, META, content_length, boundary,
+                         encoding=None):
+        self.activated = bool(swift.SEGMENT_SIZE and
+                              content_length > swift.SEGMENT_SIZE and
+                              has_csrf_header(self.request))
+
+    def new_file(self, field_name, *args, **kwargs):
+        super(SegmentedUploadHandler, self).new_file(field_name,
+                                                     *args, **kwargs)
+        self.writer = None
+        if self.activated and field_name == 'object_file':
+            self.writer = swift.SegmentWriter(self.request,
+                                              self.container_name)
+            self.exc_info = None
+            raise uploadhandler.StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.writer is None:
+            return raw_data
+        if self.exc_info is None:
+            try:
+                self.writer.write(raw_data)
+            except Exception:
+                # The rest of the file is discarded, the error is raised
+                # when the object is stored.
+                self.exc_info = sys.exc_info()
+                self.writer.abort()
+
+    def file_complete(self, file_size):
+        if self.writer is None:
+            return None
+        writer, self.writer = self.writer, None
+        if self.exc_info is None:
+            try:
+                writer.close()
+            except Exception:
+                self.exc_info = sys.exc_info()
+                writer.abort()
+        upload = swift.SegmentedUpload(self.file_name, self.content_type,
+                                       writer, self.exc_info)
+        self.uploads.append(upload)
+        return upload
+
+    def discard(self):
+        """Deletes the segments which were not stored as an object."""
+        writers = [upload.writer for upload in self.uploads
+                   if not upload.stored and upload.exc_info is None]
+        if self.writer is not None and self.exc_info is None:
+            # The request ended while the file was being received.
+            writers.append(self.writer)
+        self.writer = None
+        for writer in writers:
+            writer.abort()
@@ -24,9 +24,13 @@ import os
 
 import django
 from django import http
+from django.utils.decorators import method_decorator
 from django.utils.functional import cached_property  # noqa
 from django.utils.translation import ugettext_lazy as _
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.csrf import csrf_protect
 from django.views import generic
+import swiftclient
 
 from horizon import browsers
 from horizon import exceptions
@@ -170,7 +174,31 @@ class CreatePseudoFolderView(forms.ModalFormView):
         return context
 
 
-class UploadView(forms.ModalFormView):
+class SegmentedUploadMixin(object):
+    """Stores the large files uploaded to the view in Swift as they arrive.
+
+    See :class:`~openstack_dashboard.dashboards.project.containers.utils.
+    SegmentedUploadHandler`.
+    """
+
+    @method_decorator(csrf_exempt)
+    def dispatch(self, request, *args, **kwargs):
+        # The upload handlers must be set before the body is parsed, which
+        # the CSRF check does; the check is done once they are. The handler
+        # only writes to Swift once the CSRF header was checked.
+        handler = utils.SegmentedUploadHandler(request,
+                                               kwargs['container_name'])
+        request.upload_handlers.insert(0, handler)
+        dispatch = super(SegmentedUploadMixin, self).dispatch
+        try:
+            return csrf_protect(dispatch)(request, *args, **kwargs)
+        finally:
+            # Failed CSRF checks, invalid forms, errors and disconnected
+            # clients leave no segments behind.
+            handler.discard()
+
+
+class UploadView(SegmentedUploadMixin, forms.ModalFormView):
     form_class = project_forms.UploadObject
     template_name = 'project/containers/upload.html'
     success_url = "horizon:project:containers:index"
@@ -192,11 +220,61 @@ class UploadView(forms.ModalFormView):
         return context
 
 
+def _get_download_headers(request):
+    headers = {}
+    for header in ('Range', 'If-None-Match', 'If-Modified-Since'):
+        value = request.META.get('HTTP_%s' % header.upper().replace('-', '_'))
+        if value:
+            headers[header] = value
+    if ',' in headers.get('Range', ''):
+        # Several ranges would be returned as a multipart/byteranges body,
+        # only single ranges are forwarded and the whole object is sent
+        # otherwise, as the server is allowed to.
+        del headers['Range']
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if if_range and 'Range' in headers:
+        # The range is only valid if the object did not change since the
+        # client got its first part, whose ETag or date it sent.
+        if if_range.startswith(('"', 'W/')):
+            headers['If-Match'] = if_range
+        else:
+            headers['If-Unmodified-Since'] = if_range
+    return headers
+
+
+def _get_object_data(request, container_name, object_path):
+    headers = _get_download_headers(request)
+    try:
+        return api.swift.swift_get_object(request, container_name,
+                                          object_path,
+                                          resp_chunk_size=swift.CHUNK_SIZE,
+                                          headers=headers)
+    except swiftclient.ClientException as e:
+        if e.http_status != 412 or 'Range' not in headers:
+            raise
+    # The object changed since the range was requested, send all of it.
+    for header in ('Range', 'If-Match', 'If-Unmodified-Since'):
+        headers.pop(header, None)
+    return api.swift.swift_get_object(request, container_name, object_path,
+                                      resp_chunk_size=swift.CHUNK_SIZE,
+                                      headers=headers)
+
+
 def object_download(request, container_name, object_path):
+    """Streams the data of an object.
+
+    Single range requests and conditional requests are forwarded to Swift,
+    so downloads can be resumed or split and unchanged objects are not sent
+    again.
+    """
     try:
-        obj = api.swift.swift_get_object(request, container_name, object_path,
-                                         resp_chunk_size=swift.CHUNK_SIZE)
-    except Exception:
+        obj = _get_object_data(request, container_name, object_path)
+    except Exception as e:
+        if isinstance(e, swiftclient.ClientException):
+            if e.http_status == 304:
+                return http.HttpResponseNotModified()
+            if e.http_status == 416:
+                return http.HttpResponse(status=416)
         redirect = reverse("horizon:project:containers:index")
         exceptions.handle(request,
                           _("Unable to retrieve object."),
@@ -219,6 +297,14 @@ def object_download(request, container_name, object_path):
     response['Content-Disposition'] = 'attachment; filename="%s"' % safe_name
     response['Content-Type'] = 'application/octet-stream'
     response['Content-Length'] = obj.bytes
+    response['Accept-Ranges'] = 'bytes'
+    if getattr(obj, 'etag', None):
+        response['ETag'] = '"%s"' % obj.etag.strip('"')
+    if getattr(obj, 'last_modified', None):
+        response['Last-Modified'] = obj.last_modified
+    if getattr(obj, 'content_range', None):
+        response.status_code = 206
+        response['Content-Range'] = obj.content_range
     return response
 
 
@@ -317,7 +403,7 @@ class ObjectDetailView(forms.ModalFormMixin, generic.TemplateView):
         return context
 
 
-class UpdateObjectView(forms.ModalFormView):
+class UpdateObjectView(SegmentedUploadMixin, forms.ModalFormView):
     form_class = project_forms.UpdateObject
     template_name = 'project/containers/update.html'
     success_url = "horizon:project:containers:index"
@@ -0,0 +1,187 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""A per-process catalog of the public images.
+
+The forms offering images to boot or rebuild an instance, or to create a
+volume from, all list the public images, of which deployments commonly have
+thousands. The catalog lists them once per process and image endpoint, then
+only asks Glance, every ``refresh_interval`` seconds, for the public images
+changed since the last change it has seen, using the ``changes-since``
+filter. Images which are deleted or no longer active are removed then.
+Images made private are not listed by these queries, so the catalog is
+listed again from scratch every ``max_age`` seconds.
+
+The images are kept as ``_info`` dicts, ordered by name and indexed by ID,
+and are rebuilt from copies of them for every request, since the forms
+change some of their attributes. See the ``PUBLIC_IMAGE_CATALOG`` setting.
+"""
+
+import datetime
+import logging
+import threading
+import time
+
+from django.conf import settings
+from oslo_utils import timeutils
+
+from openstack_dashboard.api import base
+from openstack_dashboard.api import glance
+
+LOG = logging.getLogger(__name__)
+
+PUBLIC_FILTERS = {'is_public': True, 'status': 'active'}
+
+# The changes are listed again from a little before the last one seen, so
+# that images changed within the same second are not missed.
+CHANGES_OVERLAP = datetime.timedelta(seconds=60)
+
+_catalogs = {}
+_lock = threading.Lock()
+
+
+def _get_config():
+    config = {'refresh_interval': 30, 'max_age': 300}
+    config.update(getattr(settings, 'PUBLIC_IMAGE_CATALOG', {}))
+    return config
+
+
+def _is_available(info):
+    return (info.get('is_public') and info.get('status') == 'active' and
+            not info.get('deleted'))
+
+
+class _Catalog(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.by_id = {}
+        self.ordered = []
+        self.loaded_at = None
+        self.checked_at = None
+        self.changed_at = None
+
+    def _list(self, request, filters):
+        """Lists all of the images matching ``filters``, page by page."""
+        limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
+        infos = []
+        marker = None
+        while True:
+            images = glance.image_list_detailed(request, marker=marker,
+                                                filters=filters)[0]
+            infos.extend(image._info for image in images)
+            if len(images) < limit:
+                return infos
+            marker = images[-1].id
+
+    def _refresh(self, request, config):
+        now = time.time()
+        if (self.changed_at is None or
+                now - self.loaded_at >= config['max_age']):
+            infos = self._list(request, PUBLIC_FILTERS)
+            by_id = dict((info['id'], info) for info in infos)
+            self.loaded_at = now
+            self.changed_at = None
+        else:
+            since = timeutils.normalize_time(
+                timeutils.parse_isotime(self.changed_at)) - CHANGES_OVERLAP
+            infos = self._list(request, {
+                'is_public': True,
+                'changes-since': since.strftime('%Y-%m-%dT%H:%M:%S')})
+            by_id = dict(self.by_id)
+            for info in infos:
+                if _is_available(info):
+                    by_id[info['id']] = info
+                else:
+                    by_id.pop(info['id'], None)
+        changes = [info['updated_at'] for info in infos
+                   if info.get('updated_at')]
+        if self.changed_at is not None:
+            changes.append(self.changed_at)
+        self.changed_at = max(changes) if changes else None
+        self.by_id = by_id
+        self.ordered = sorted(by_id.values(),
+                              key=lambda info: ((info.get('name') or '')
+                                                .lower(), info['id']))
+        self.checked_at = now
+
+    def _is_fresh(self, config):
+        return (self.checked_at is not None and
+                time.time() - self.checked_at < config['refresh_interval'])
+
+    def refresh(self, request, config):
+        if self._is_fresh(config):
+            return
+        # Only the first listing is waited for. Later on, one request
+        # refreshes the catalog while the others serve the previous images.
+        if not self.lock.acquire(self.checked_at is None):
+            return
+        try:
+            if self._is_fresh(config):
+                return
+            self._refresh(request, config)
+        except Exception:
+            if self.checked_at is None:
+                raise
+            # Serve the images listed last time rather than none, the next
+            # request tries again.
+            LOG.warning("Unable to refresh the public image catalog.",
+                        exc_info=True)
+        finally:
+            self.lock.release()
+
+
+def _get_catalog(request):
+    key = (base.url_for(request, 'image'), request.user.services_region)
+    with _lock:
+        if key not in _catalogs:
+            _catalogs[key] = _Catalog()
+        return _catalogs[key]
+
+
+def _build(request, infos):
+    return base.build_resources(glance.glanceclient(request).images, infos)
+
+
+def get_images(request):
+    """Returns the active public images, ordered by name.
+
+    If the catalog is disabled, they are listed from Glance as is.
+    """
+    config = _get_config()
+    if config['refresh_interval'] <= 0:
+        return glance.image_list_detailed(request,
+                                          filters=PUBLIC_FILTERS)[0]
+    catalog = _get_catalog(request)
+    catalog.refresh(request, config)
+    return _build(request, catalog.ordered)
+
+
+def get_images_by_id(request, image_ids):
+    """Returns a dict of the public images among ``image_ids``, by ID.
+
+    Returns an empty dict if the catalog is disabled.
+    """
+    config = _get_config()
+    if config['refresh_interval'] <= 0:
+        return {}
+    catalog = _get_catalog(request)
+    catalog.refresh(request, config)
+    by_id = catalog.by_id
+    infos = [by_id[image_id] for image_id in set(image_ids)
+             if image_id in by_id]
+    return dict((image.id, image) for image in _build(request, infos))
+
+
+def clear():
+    """Drops all of the images cached by this process."""
+    with _lock:
+        _catalogs.clear()
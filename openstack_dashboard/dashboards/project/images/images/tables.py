@@ -235,6 +235,9 @@ class UpdateRow(tables.Row):
 
     def get_data(self, request, image_id):
         image = api.glance.image_get(request, image_id)
+        if image.status in ("queued", "saving"):
+            image.upload_progress = api.glance.image_upload_progress(
+                request, image_id)
         return image
 
     def load_cells(self, image=None):
@@ -247,6 +250,20 @@ class UpdateRow(tables.Row):
             self.classes.append('category-' + category)
 
 
+class UploadStatusColumn(tables.Column):
+    """Displays the progress of an upload next to the status of the image."""
+
+    def get_data(self, datum):
+        data = super(UploadStatusColumn, self).get_data(datum)
+        progress = getattr(datum, "upload_progress", None)
+        if (progress and progress['status'] == 'uploading' and
+                progress['size']):
+            percent = 100 * progress['uploaded'] // progress['size']
+            return _("%(status)s (%(percent)d%%)") % {
+                'status': data, 'percent': percent}
+        return data
+
+
 class ImagesTable(tables.DataTable):
     STATUS_CHOICES = (
         ("active", True),
@@ -275,11 +292,11 @@ class ImagesTable(tables.DataTable):
     image_type = tables.Column(get_image_type,
                                verbose_name=_("Type"),
                                display_choices=TYPE_CHOICES)
-    status = tables.Column("status",
-                           verbose_name=_("Status"),
-                           status=True,
-                           status_choices=STATUS_CHOICES,
-                           display_choices=STATUS_DISPLAY_CHOICES)
+    status = UploadStatusColumn("status",
+                                verbose_name=_("Status"),
+                                status=True,
+                                status_choices=STATUS_CHOICES,
+                                display_choices=STATUS_DISPLAY_CHOICES)
     public = tables.Column("is_public",
                            verbose_name=_("Public"),
                            empty_value=False,
@@ -22,11 +22,14 @@ from socket import timeout as socket_timeout  # noqa
 from django.core.urlresolvers import reverse
 from django import http
 
+from glanceclient.v1 import images
+import mock
 from mox import IsA  # noqa
 
 from horizon import exceptions
 
 from openstack_dashboard import api
+from openstack_dashboard.dashboards.project.images import catalog
 from openstack_dashboard.dashboards.project.images import utils
 from openstack_dashboard.test import helpers as test
 
@@ -62,6 +65,24 @@ class ImagesAndSnapshotsTests(test.TestCase):
         row_actions = images_table.get_row_actions(images[2])
         self.assertTrue(len(row_actions), 3)
 
+    @test.create_stubs({api.glance: ('image_get',
+                                     'image_upload_progress')})
+    def test_row_update_upload_progress(self):
+        image = self.images.first()
+        image.status = 'saving'
+        api.glance.image_get(IsA(http.HttpRequest), image.id) \
+            .AndReturn(image)
+        api.glance.image_upload_progress(IsA(http.HttpRequest), image.id) \
+            .AndReturn({'status': 'uploading',
+                        'size': 2048,
+                        'uploaded': 512})
+        self.mox.ReplayAll()
+
+        url = (INDEX_URL +
+               "?action=row_update&table=images&obj_id=" + image.id)
+        res = self.client.get(url, {}, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertContains(res, 'Saving (25%)')
+
     @test.create_stubs({api.glance: ('image_list_detailed',)})
     def test_index_no_images(self):
         api.glance.image_list_detailed(IsA(http.HttpRequest),
@@ -310,6 +331,163 @@ class ImagesAndSnapshotsUtilsTests(test.TestCase):
             len(images_cache['images_by_project'][self.tenant.id]))
 
 
+@test.update_settings(PUBLIC_IMAGE_CATALOG={'refresh_interval': 30,
+                                            'max_age': 3600})
+class PublicImageCatalogTests(test.TestCase):
+    def setUp(self):
+        super(PublicImageCatalogTests, self).setUp()
+        catalog.clear()
+        self.client = mock.Mock(images=images.ImageManager(None))
+
+    def tearDown(self):
+        catalog.clear()
+        super(PublicImageCatalogTests, self).tearDown()
+
+    def _image(self, image_id, name, updated_at, **info):
+        info.update({'id': image_id, 'name': name, 'updated_at': updated_at})
+        info.setdefault('is_public', True)
+        info.setdefault('status', 'active')
+        return images.Image(images.ImageManager(None), info)
+
+    def _expire(self):
+        for image_catalog in catalog._catalogs.values():
+            image_catalog.checked_at -= 60
+
+    @test.create_stubs({api.glance: ('image_list_detailed', 'glanceclient')})
+    def test_refreshed_with_changes_since(self):
+        alpha = self._image('1', 'alpha', '2015-01-01T10:00:00')
+        beta = self._image('2', 'beta', '2015-01-02T10:00:00')
+        deleted = self._image('2', 'beta', '2015-01-03T10:00:00',
+                              status='deleted', deleted=True)
+        charlie = self._image('3', 'Charlie', '2015-01-03T11:00:00')
+        api.glance.glanceclient(IsA(http.HttpRequest)).MultipleTimes() \
+            .AndReturn(self.client)
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest), marker=None,
+            filters={'is_public': True, 'status': 'active'}) \
+            .AndReturn([[beta, alpha], False, False])
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest), marker=None,
+            filters={'is_public': True,
+                     'changes-since': '2015-01-02T09:59:00'}) \
+            .AndReturn([[deleted, charlie], False, False])
+
+        self.mox.ReplayAll()
+
+        ret = catalog.get_images(self.request)
+        self.assertEqual(['alpha', 'beta'], [image.name for image in ret])
+        ret = catalog.get_images(self.request)
+        self.assertEqual(['alpha', 'beta'], [image.name for image in ret])
+
+        self._expire()
+        ret = catalog.get_images(self.request)
+        self.assertEqual(['alpha', 'Charlie'], [image.name for image in ret])
+        ret = catalog.get_images_by_id(self.request, ['1', '2', '4'])
+        self.assertEqual(['1'], list(ret))
+        self.assertEqual('alpha', ret['1'].name)
+
+    @test.update_settings(API_RESULT_LIMIT=2)
+    @test.create_stubs({api.glance: ('image_list_detailed', 'glanceclient')})
+    def test_listed_page_by_page(self):
+        listed = [self._image(str(i), 'image%d' % i, '2015-01-01T10:00:00')
+                  for i in range(3)]
+        api.glance.glanceclient(IsA(http.HttpRequest)) \
+            .AndReturn(self.client)
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest), marker=None,
+            filters={'is_public': True, 'status': 'active'}) \
+            .AndReturn([listed[:2], True, False])
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest), marker='1',
+            filters={'is_public': True, 'status': 'active'}) \
+            .AndReturn([listed[2:], False, True])
+
+        self.mox.ReplayAll()
+
+        ret = catalog.get_images(self.request)
+        self.assertEqual(['0', '1', '2'], [image.id for image in ret])
+
+    @test.create_stubs({api.glance: ('image_list_detailed', 'glanceclient')})
+    def test_refresh_error(self):
+        alpha = self._image('1', 'alpha', '2015-01-01T10:00:00')
+        api.glance.glanceclient(IsA(http.HttpRequest)).MultipleTimes() \
+            .AndReturn(self.client)
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest), marker=None,
+            filters={'is_public': True, 'status': 'active'}) \
+            .AndReturn([[alpha], False, False])
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest), marker=None,
+            filters={'is_public': True,
+                     'changes-since': '2015-01-01T09:59:00'}) \
+            .AndRaise(self.exceptions.glance)
+
+        self.mox.ReplayAll()
+
+        catalog.get_images(self.request)
+        self._expire()
+        ret = catalog.get_images(self.request)
+        self.assertEqual(['alpha'], [image.name for image in ret])
+
+    @test.create_stubs({api.glance: ('image_list_detailed', 'glanceclient')})
+    def test_images_built_from_copies(self):
+        alpha = self._image('1', 'alpha', '2015-01-01T10:00:00',
+                            properties={'architecture': 'x86_64'})
+        api.glance.glanceclient(IsA(http.HttpRequest)).MultipleTimes() \
+            .AndReturn(self.client)
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest), marker=None,
+            filters={'is_public': True, 'status': 'active'}) \
+            .AndReturn([[alpha], False, False])
+
+        self.mox.ReplayAll()
+
+        image = catalog.get_images(self.request)[0]
+        image.name = 'changed'
+        image.properties['architecture'] = 'changed'
+        image = catalog.get_images(self.request)[0]
+        self.assertEqual('alpha', image.name)
+        self.assertEqual('x86_64', image.properties['architecture'])
+
+    @test.create_stubs({api.glance: ('image_list_detailed', 'glanceclient')})
+    def test_previous_images_served_during_refresh(self):
+        alpha = self._image('1', 'alpha', '2015-01-01T10:00:00')
+        api.glance.glanceclient(IsA(http.HttpRequest)).MultipleTimes() \
+            .AndReturn(self.client)
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest), marker=None,
+            filters={'is_public': True, 'status': 'active'}) \
+            .AndReturn([[alpha], False, False])
+
+        self.mox.ReplayAll()
+
+        catalog.get_images(self.request)
+        self._expire()
+        # Another request is refreshing the catalog, this one does not wait
+        # for it.
+        image_catalog = list(catalog._catalogs.values())[0]
+        with image_catalog.lock:
+            ret = catalog.get_images(self.request)
+        self.assertEqual(['alpha'], [image.name for image in ret])
+
+    @test.update_settings(PUBLIC_IMAGE_CATALOG={'refresh_interval': 0})
+    @test.create_stubs({api.glance: ('image_list_detailed',)})
+    def test_disabled(self):
+        public_images = [image for image in self.images.list()
+                         if image.status == 'active' and image.is_public]
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest),
+            filters={'is_public': True, 'status': 'active'}) \
+            .MultipleTimes().AndReturn([public_images, False, False])
+
+        self.mox.ReplayAll()
+
+        self.assertEqual(public_images, catalog.get_images(self.request))
+        self.assertEqual(public_images, catalog.get_images(self.request))
+        self.assertEqual({}, catalog.get_images_by_id(
+            self.request, [image.id for image in public_images]))
+
+
 class SeleniumTests(test.SeleniumTestCase):
     @test.create_stubs({api.glance: ('image_list_detailed',)})
     def test_modal_create_image_from_url(self):
@@ -16,6 +16,7 @@ from horizon import exceptions
 from horizon.templatetags import sizeformat
 
 from openstack_dashboard.api import glance
+from openstack_dashboard.dashboards.project.images import catalog
 
 
 def get_available_images(request, project_id=None, images_cache=None):
@@ -26,17 +27,16 @@ def get_available_images(request, project_id=None, images_cache=None):
     :param images_cache: An optional dict-like object in which to
      cache public and per-project id image metadata.
 
+    The public images are taken from the catalog shared by all requests,
+    see :mod:`openstack_dashboard.dashboards.project.images.catalog`.
     """
     if images_cache is None:
         images_cache = {}
     public_images = images_cache.get('public_images', [])
     images_by_project = images_cache.get('images_by_project', {})
     if 'public_images' not in images_cache:
-        public = {"is_public": True,
-                  "status": "active"}
         try:
-            images, _more, _prev = glance.image_list_detailed(
-                request, filters=public)
+            images = catalog.get_images(request)
             [public_images.append(image) for image in images]
             images_cache['public_images'] = public_images
         except Exception:
@@ -68,11 +68,11 @@ def get_available_images(request, project_id=None, images_cache=None):
     images = owned_images + public_images
 
     # Remove duplicate images
-    image_ids = []
+    image_ids = set()
     final_images = []
     for image in images:
         if image.id not in image_ids:
-            image_ids.append(image.id)
+            image_ids.add(image.id)
             final_images.append(image)
     return [image for image in final_images
             if image.container_format not in ('aki', 'ari')]
@@ -673,6 +673,7 @@ def get_instance_error(instance):
 
 class UpdateRow(tables.Row):
     ajax = True
+    all_tenants = False
 
     def get_data(self, request, instance_id):
         instance = api.nova.server_get(request, instance_id)
@@ -689,6 +690,50 @@ class UpdateRow(tables.Row):
             messages.error(request, error)
         return instance
 
+    def get_data_bulk(self, request, instance_ids):
+        # A single instance is cheaper to get than the whole listing.
+        if len(instance_ids) < 2:
+            return super(UpdateRow, self).get_data_bulk(request, instance_ids)
+        wanted = set(instance_ids)
+        # Only the first page of the listing, the most recently created
+        # servers, is asked for so that polling costs the same whatever the
+        # number of servers, e.g. of the whole cloud for the admin table.
+        servers, has_more = api.nova.server_list(
+            request, search_opts={'paginate': True},
+            all_tenants=self.all_tenants)
+        instances = dict((server.id, server) for server in servers
+                         if server.id in wanted)
+        try:
+            flavors = api.nova.flavor_list(request)
+        except Exception:
+            flavors = []
+            exceptions.handle(request, ignore=True)
+        full_flavors = dict((str(flavor.id), flavor) for flavor in flavors)
+        for instance in instances.values():
+            flavor_id = instance.flavor["id"]
+            if flavor_id in full_flavors:
+                instance.full_flavor = full_flavors[flavor_id]
+            else:
+                try:
+                    instance.full_flavor = api.nova.flavor_get(request,
+                                                               flavor_id)
+                except Exception:
+                    exceptions.handle(request,
+                                      _('Unable to retrieve flavor '
+                                        'information for instance "%s".')
+                                      % instance.id,
+                                      ignore=True)
+            error = get_instance_error(instance)
+            if error:
+                messages.error(request, error)
+        # Instances missing from a truncated listing are looked up one by
+        # one so that only the deleted ones are reported as such.
+        missing = [instance_id for instance_id in instance_ids
+                   if instance_id not in instances]
+        instances.update(super(UpdateRow, self).get_data_bulk(request,
+                                                              missing))
+        return instances
+
 
 class StartInstance(policy.PolicyTargetMixin, tables.BatchAction):
     name = "start"
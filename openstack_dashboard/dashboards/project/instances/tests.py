@@ -1074,6 +1074,61 @@ class InstanceTests(helpers.TestCase):
 
         self.assertRedirectsNoFollow(res, INDEX_URL)
 
+    def test_instance_auto_console(self):
+        server = self.servers.first()
+        CONSOLE_URL = '/vncserver&title=%s(%s)' % (server.name, server.id)
+
+        self.mox.StubOutWithMock(console, 'get_console')
+        self.mox.StubOutWithMock(api.nova, 'server_get')
+        api.nova.server_get(IsA(http.HttpRequest), server.id) \
+            .AndReturn(server)
+        console.get_console(IgnoreArg(), 'AUTO', server) \
+            .AndReturn(('VNC', CONSOLE_URL))
+
+        self.mox.ReplayAll()
+
+        url = reverse('horizon:project:instances:auto_console',
+                      args=[server.id])
+        res = self.client.get(url)
+        self.assertRedirectsNoFollow(res, CONSOLE_URL)
+
+    def test_instance_auto_console_serial(self):
+        server = self.servers.first()
+
+        self.mox.StubOutWithMock(console, 'get_console')
+        self.mox.StubOutWithMock(api.nova, 'server_get')
+        api.nova.server_get(IsA(http.HttpRequest), server.id) \
+            .AndReturn(server)
+        console.get_console(IgnoreArg(), 'AUTO', server) \
+            .AndReturn(('SERIAL', '/SERIAL'))
+
+        self.mox.ReplayAll()
+
+        url = reverse('horizon:project:instances:auto_console',
+                      args=[server.id])
+        res = self.client.get(url)
+        redirect = reverse('horizon:project:instances:serial',
+                           args=[server.id])
+        self.assertRedirectsNoFollow(res, redirect)
+
+    def test_instance_auto_console_exception(self):
+        server = self.servers.first()
+
+        self.mox.StubOutWithMock(console, 'get_console')
+        self.mox.StubOutWithMock(api.nova, 'server_get')
+        api.nova.server_get(IsA(http.HttpRequest), server.id) \
+            .AndReturn(server)
+        console.get_console(IgnoreArg(), 'AUTO', server) \
+            .AndRaise(exceptions.NotAvailable('console'))
+
+        self.mox.ReplayAll()
+
+        url = reverse('horizon:project:instances:auto_console',
+                      args=[server.id])
+        res = self.client.get(url)
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+
     @helpers.create_stubs({api.nova: ('server_get',
                                       'snapshot_create',
                                       'server_list',
@@ -4232,6 +4287,41 @@ class InstanceAjaxTests(helpers.TestCase):
         self.assertContains(res, server.name)
         self.assertContains(res, "Not available")
 
+    @helpers.create_stubs({api.nova: ("server_list",
+                                      "server_get",
+                                      "flavor_list",
+                                      "extension_supported"),
+                           api.neutron: ("is_extension_supported",)})
+    def test_rows_update(self):
+        servers = self.servers.list()
+        deleted = servers[1]
+
+        api.nova.extension_supported('AdminActions', IsA(http.HttpRequest))\
+            .MultipleTimes().AndReturn(True)
+        api.neutron.is_extension_supported(IsA(http.HttpRequest),
+                                           'security-group')\
+            .MultipleTimes().AndReturn(True)
+        api.nova.server_list(IsA(http.HttpRequest),
+                             search_opts={'paginate': True},
+                             all_tenants=False)\
+            .AndReturn(([servers[0], servers[2]], False))
+        api.nova.flavor_list(IsA(http.HttpRequest))\
+            .AndReturn(self.flavors.list())
+        api.nova.server_get(IsA(http.HttpRequest), deleted.id)\
+            .AndRaise(self.exceptions.nova_not_found)
+
+        self.mox.ReplayAll()
+
+        params = [('action', 'rows_update'),
+                  ('table', 'instances'),
+                  ('obj_id', servers[0].id),
+                  ('obj_id', deleted.id)]
+        res = self.client.get('?'.join((INDEX_URL, urlencode(params))),
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        rows = json.loads(res.content)['rows']
+        self.assertEqual([servers[0].id], rows.keys())
+        self.assertIn(servers[0].name, rows[servers[0].id])
+
 
 class ConsoleManagerTests(helpers.TestCase):
 
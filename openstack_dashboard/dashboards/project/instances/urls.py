@@ -41,6 +41,7 @@ urlpatterns = patterns(
     url(INSTANCES % 'vnc', 'vnc', name='vnc'),
     url(INSTANCES % 'spice', 'spice', name='spice'),
     url(INSTANCES % 'rdp', 'rdp', name='rdp'),
+    url(INSTANCES % 'auto_console', 'auto_console', name='auto_console'),
     url(INSTANCES % 'resize', views.ResizeView.as_view(), name='resize'),
     url(INSTANCES_KEYPAIR % 'decryptpassword',
         views.DecryptPasswordView.as_view(), name='decryptpassword'),
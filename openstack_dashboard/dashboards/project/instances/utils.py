@@ -23,9 +23,19 @@ from openstack_dashboard import api
 LOG = logging.getLogger(__name__)
 
 
-def flavor_list(request):
-    """Utility method to retrieve a list of flavors."""
+def flavor_list(request, cached=False):
+    """Utility method to retrieve a list of flavors.
+
+    With ``cached``, the list is shared for a short time with the other
+    requests of the project, see ``RESOURCE_LIST_CACHE``.
+    """
     try:
+        if cached:
+            return api.base.resource_list_cached(
+                request, 'flavors', 'compute',
+                lambda: api.nova.flavor_list(request),
+                lambda: api.nova.novaclient(request).flavors,
+                per_project=True)
         return api.nova.flavor_list(request)
     except Exception:
         exceptions.handle(request,
@@ -64,9 +74,18 @@ def sort_flavor_list(request, flavors):
         return []
 
 
-def availability_zone_list(request):
-    """Utility method to retrieve a list of availability zones."""
+def availability_zone_list(request, cached=False):
+    """Utility method to retrieve a list of availability zones.
+
+    With ``cached``, the list is shared for a short time with the other
+    requests, see ``RESOURCE_LIST_CACHE``.
+    """
     try:
+        if cached:
+            return api.base.resource_list_cached(
+                request, 'availability_zones', 'compute',
+                lambda: api.nova.availability_zone_list(request),
+                lambda: api.nova.novaclient(request).availability_zones)
         return api.nova.availability_zone_list(request)
     except Exception:
         exceptions.handle(request,
@@ -134,7 +153,7 @@ def keypair_field_data(request, include_empty_option=False):
     return keypair_list
 
 
-def flavor_field_data(request, include_empty_option=False):
+def flavor_field_data(request, include_empty_option=False, cached=False):
     """Returns a list of tuples of all image flavors.
 
     Generates a list of image flavors available. And returns a list of
@@ -143,9 +162,10 @@ def flavor_field_data(request, include_empty_option=False):
     :param request: django http request object
     :param include_empty_option: flag to include a empty tuple in the front of
     the list
+    :param cached: flag to use the flavor list shared with other requests
     :return: list of (id, name) tuples
     """
-    flavors = flavor_list(request)
+    flavors = flavor_list(request, cached=cached)
     if flavors:
         flavors_list = sort_flavor_list(request, flavors)
         if include_empty_option:
@@ -21,6 +21,7 @@ Views for managing instances.
 """
 import logging
 
+from django.conf import settings
 from django.core.urlresolvers import reverse
 from django.core.urlresolvers import reverse_lazy
 from django import http
@@ -39,6 +40,8 @@ from horizon import workflows
 
 from openstack_dashboard import api
 
+from openstack_dashboard.dashboards.project.images \
+    import catalog as image_catalog
 from openstack_dashboard.dashboards.project.instances \
     import console as project_console
 from openstack_dashboard.dashboards.project.instances \
@@ -49,6 +52,7 @@ from openstack_dashboard.dashboards.project.instances \
     import tabs as project_tabs
 from openstack_dashboard.dashboards.project.instances \
     import workflows as project_workflows
+from openstack_dashboard.utils import concurrency
 
 LOG = logging.getLogger(__name__)
 
@@ -57,6 +61,7 @@ class IndexView(tables.DataTableView):
     table_class = project_tables.InstancesTable
     template_name = 'project/instances/index.html'
     page_title = _("Instances")
+    cache_data = True
 
     def has_more_data(self, table):
         return self._more
@@ -77,8 +82,19 @@ class IndexView(tables.DataTableView):
                               _('Unable to retrieve instances.'))
 
         if instances:
+            # The address, flavor and image lookups are independent of each
+            # other, so issue them concurrently.
+            addresses = concurrency.submit(
+                self.request, api.network.servers_update_addresses,
+                self.request, instances)
+            flavors = concurrency.submit(
+                self.request, api.nova.flavor_list, self.request)
+            # TODO(gabriel): Handle pagination.
+            images = concurrency.submit(
+                self.request, api.glance.image_list_detailed, self.request)
+
             try:
-                api.network.servers_update_addresses(self.request, instances)
+                addresses.result()
             except Exception:
                 exceptions.handle(
                     self.request,
@@ -87,15 +103,13 @@ class IndexView(tables.DataTableView):
 
             # Gather our flavors and images and correlate our instances to them
             try:
-                flavors = api.nova.flavor_list(self.request)
+                flavors = flavors.result()
             except Exception:
                 flavors = []
                 exceptions.handle(self.request, ignore=True)
 
             try:
-                # TODO(gabriel): Handle pagination.
-                images, more, prev = api.glance.image_list_detailed(
-                    self.request)
+                images, more, prev = images.result()
             except Exception:
                 images = []
                 exceptions.handle(self.request, ignore=True)
@@ -104,6 +118,18 @@ class IndexView(tables.DataTableView):
                                        for flavor in flavors])
             image_map = SortedDict([(str(image.id), image)
                                     for image in images])
+            # The listing stops at API_RESULT_LIMIT images, the public
+            # images it missed are looked up in the public image catalog.
+            missing = [instance.image['id'] for instance in instances
+                       if isinstance(getattr(instance, 'image', None), dict)
+                       and instance.image.get('id')
+                       and instance.image['id'] not in image_map]
+            if missing:
+                try:
+                    image_map.update(image_catalog.get_images_by_id(
+                        self.request, missing))
+                except Exception:
+                    exceptions.handle(self.request, ignore=True)
 
             # Loop through instances to get flavor info.
             for instance in instances:
@@ -199,6 +225,24 @@ def rdp(request, instance_id):
         exceptions.handle(request, msg, redirect=redirect)
 
 
+def auto_console(request, instance_id):
+    console_type = getattr(settings, 'CONSOLE_TYPE', 'AUTO')
+    try:
+        instance = api.nova.server_get(request, instance_id)
+        console_type, console_url = project_console.get_console(
+            request, console_type, instance)
+        # For serial console, the url is different from VNC, etc.
+        # because it does not include parms for title and token
+        if console_type == 'SERIAL':
+            console_url = reverse('horizon:project:instances:serial',
+                                  args=[instance_id])
+        return shortcuts.redirect(console_url)
+    except Exception:
+        redirect = reverse("horizon:project:instances:index")
+        msg = _('Unable to get console for instance "%s".') % instance_id
+        exceptions.handle(request, msg, redirect=redirect)
+
+
 class SerialConsoleView(generic.TemplateView):
     template_name = 'project/instances/serial_console.html'
 
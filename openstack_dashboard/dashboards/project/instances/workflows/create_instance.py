@@ -16,6 +16,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import itertools
 import json
 import logging
 import operator
@@ -40,6 +41,7 @@ from openstack_dashboard.api import base
 from openstack_dashboard.api import cinder
 from openstack_dashboard.api import nova
 from openstack_dashboard.usage import quotas
+from openstack_dashboard.utils import concurrency
 
 from openstack_dashboard.dashboards.project.images \
     import utils as image_utils
@@ -77,7 +79,39 @@ class SelectProjectUser(workflows.Step):
     contributes = ("project_id", "user_id")
 
 
-class SetInstanceDetailsAction(workflows.Action):
+class ConcurrentChoicesMixin(object):
+    """Populates the choices of the fields of an action concurrently.
+
+    The ``populate_<field>_choices`` methods usually make an API call each,
+    so they are run on the shared worker pool rather than one after another.
+    The fields listed together in one of ``sequential_choices`` depend on
+    each other, e.g. share a cache, and are populated in that order by a
+    single call.
+    """
+    sequential_choices = ()
+
+    def _populate_choices(self, request, context):
+        names = [name for name in self.fields
+                 if callable(getattr(self, "populate_%s_choices" % name,
+                                     None))]
+        groups = [[name for name in group if name in names]
+                  for group in self.sequential_choices]
+        grouped = set(itertools.chain(*groups))
+        groups.extend([name] for name in names if name not in grouped)
+
+        def populate(group):
+            return [getattr(self, "populate_%s_choices" % name)(request,
+                                                                context)
+                    for name in group]
+
+        futures = [(group, concurrency.submit(request, populate, group))
+                   for group in groups if group]
+        for group, future in futures:
+            for name, choices in zip(group, future.result()):
+                self.fields[name].choices = choices
+
+
+class SetInstanceDetailsAction(ConcurrentChoicesMixin, workflows.Action):
     availability_zone = forms.ChoiceField(label=_("Availability Zone"),
                                           required=False)
 
@@ -139,6 +173,9 @@ class SetInstanceDetailsAction(workflows.Action):
         help_text_template = ("project/instances/"
                               "_launch_details_help.html")
 
+    # Both are populated from the images cache of the action.
+    sequential_choices = (("image_id", "instance_snapshot_id"),)
+
     def __init__(self, request, context, *args, **kwargs):
         self._init_images_cache()
         self.request = request
@@ -177,10 +214,10 @@ class SetInstanceDetailsAction(workflows.Action):
     def _get_flavor(self, flavor_id):
         try:
             # We want to retrieve details for a given flavor,
-            # however flavor_list uses a memoized decorator
+            # however flavor_list is cached
             # so it is used instead of flavor_get to reduce the number
             # of API calls.
-            flavors = instance_utils.flavor_list(self.request)
+            flavors = instance_utils.flavor_list(self.request, cached=True)
             flavor = [x for x in flavors if x.id == flavor_id][0]
         except IndexError:
             flavor = None
@@ -370,16 +407,10 @@ class SetInstanceDetailsAction(workflows.Action):
         return cleaned_data
 
     def populate_flavor_choices(self, request, context):
-        return instance_utils.flavor_field_data(request, False)
+        return instance_utils.flavor_field_data(request, False, cached=True)
 
     def populate_availability_zone_choices(self, request, context):
-        try:
-            zones = api.nova.availability_zone_list(request)
-        except Exception:
-            zones = []
-            exceptions.handle(request,
-                              _('Unable to retrieve availability zones.'))
-
+        zones = instance_utils.availability_zone_list(request, cached=True)
         zone_list = [(zone.zoneName, zone.zoneName)
                      for zone in zones if zone.zoneState['available']]
         zone_list.sort()
@@ -392,10 +423,12 @@ class SetInstanceDetailsAction(workflows.Action):
     def get_help_text(self, extra_context=None):
         extra = {} if extra_context is None else dict(extra_context)
         try:
-            extra['usages'] = api.nova.tenant_absolute_limits(self.request)
-            extra['usages_json'] = json.dumps(extra['usages'])
+            usages = concurrency.submit(self.request,
+                                        api.nova.tenant_absolute_limits,
+                                        self.request)
             flavors = json.dumps([f._info for f in
-                                  instance_utils.flavor_list(self.request)])
+                                  instance_utils.flavor_list(self.request,
+                                                             cached=True)])
             extra['flavors'] = flavors
             images = image_utils.get_available_images(
                 self.request, self.initial['project_id'], self._images_cache)
@@ -406,6 +439,8 @@ class SetInstanceDetailsAction(workflows.Action):
                           'size': functions.bytes_to_gigabytes(i.size)}
                          for i in images]
                 extra['images'] = json.dumps(attrs)
+            extra['usages'] = usages.result()
+            extra['usages_json'] = json.dumps(extra['usages'])
 
         except Exception:
             exceptions.handle(self.request,
@@ -535,7 +570,7 @@ class SetInstanceDetails(workflows.Step):
 KEYPAIR_IMPORT_URL = "horizon:project:access_and_security:keypairs:import"
 
 
-class SetAccessControlsAction(workflows.Action):
+class SetAccessControlsAction(ConcurrentChoicesMixin, workflows.Action):
     keypair = forms.DynamicChoiceField(label=_("Key Pair"),
                                        required=False,
                                        help_text=_("Key pair to use for "
@@ -21,6 +21,7 @@ import django.test
 from mox import IsA  # noqa
 
 from openstack_dashboard import api
+from openstack_dashboard.dashboards.project.network_topology import views
 from openstack_dashboard.test import helpers as test
 from openstack_dashboard.usage import quotas
 
@@ -46,7 +47,25 @@ class NetworkTopologyTests(test.TestCase):
     def test_json_view_router_disabled(self):
         self._test_json_view(router_enable=False)
 
-    def _test_json_view(self, router_enable=True):
+    @django.test.utils.override_settings(CONSOLE_TYPE='SPICE')
+    @test.create_stubs({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_console_type(self):
+        self._test_json_view(console='spice')
+
+    @django.test.utils.override_settings(CONSOLE_TYPE=None)
+    @test.create_stubs({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_console_disabled(self):
+        self._test_json_view(console=None)
+
+    def _test_json_view(self, router_enable=True, console='auto_console'):
         api.nova.server_list(
             IsA(http.HttpRequest)).AndReturn([self.servers.list(), False])
         tenant_networks = [net for net in self.networks.list()
@@ -81,13 +100,17 @@ class NetworkTopologyTests(test.TestCase):
         # servers
         # result_server_urls = [(server['id'], server['url'])
         #                       for server in data['servers']]
-        expect_server_urls = [
-            {'id': server.id,
-             'name': server.name,
-             'status': server.status,
-             'task': None,
-             'url': '/project/instances/%s/' % server.id}
-            for server in self.servers.list()]
+        expect_server_urls = []
+        for server in self.servers.list():
+            expect_server = {
+                'id': server.id,
+                'name': server.name,
+                'status': server.status,
+                'task': None,
+                'url': '/project/instances/%s/' % server.id}
+            if console and server.status == 'ACTIVE':
+                expect_server['console'] = console
+            expect_server_urls.append(expect_server)
         self.assertEqual(expect_server_urls, data['servers'])
 
         # rotuers
@@ -143,12 +166,101 @@ class NetworkTopologyTests(test.TestCase):
             router1 = routers[0]
             ext_net = external_networks[0]
             expect_port_urls.append(
-                {'id': 'gateway%s' % ext_net.id,
+                {'id': 'gateway%s-%s' % (ext_net.id, router1.id),
                  'device_id': router1.id,
                  'network_id': ext_net.id,
                  'fixed_ips': []})
         self.assertEqual(expect_port_urls, data['ports'])
 
+    def _stub_json_view_data(self, servers=None):
+        if servers is not None:
+            api.nova.server_list(IsA(http.HttpRequest)) \
+                .MultipleTimes().AndReturn([servers, False])
+        api.neutron.network_list_for_tenant(
+            IsA(http.HttpRequest),
+            self.tenant.id).MultipleTimes().AndReturn([])
+        api.neutron.network_list(
+            IsA(http.HttpRequest),
+            **{'router:external': True}).MultipleTimes().AndReturn([])
+        api.neutron.router_list(
+            IsA(http.HttpRequest),
+            tenant_id=self.tenant.id).MultipleTimes().AndReturn([])
+        api.neutron.port_list(
+            IsA(http.HttpRequest)).MultipleTimes().AndReturn([])
+
+    @test.create_stubs({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_not_modified(self):
+        self._stub_json_view_data(self.servers.list())
+        self.mox.ReplayAll()
+
+        res = self.client.get(JSON_URL)
+        version = json.loads(res.content)['version']
+        self.assertEqual('"%s"' % version, res['ETag'])
+
+        res = self.client.get(JSON_URL, {'since': version})
+        self.assertEqual(304, res.status_code)
+        self.assertEqual('', res.content)
+
+        res = self.client.get(JSON_URL,
+                              HTTP_IF_NONE_MATCH='"%s"' % version)
+        self.assertEqual(304, res.status_code)
+
+    @test.create_stubs({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_delta(self):
+        servers = self.servers.list()
+        api.nova.server_list(
+            IsA(http.HttpRequest)).AndReturn([servers, False])
+        api.nova.server_list(
+            IsA(http.HttpRequest)).AndReturn([servers[1:], False])
+        self._stub_json_view_data()
+        self.mox.ReplayAll()
+
+        res = self.client.get(JSON_URL)
+        version = json.loads(res.content)['version']
+
+        res = self.client.get(JSON_URL, {'since': version})
+        data = json.loads(res.content)
+        self.assertTrue(data['delta'])
+        self.assertNotEqual(version, data['version'])
+        self.assertEqual([server.id for server in servers[1:]],
+                         data['servers']['ids'])
+        self.assertEqual([servers[0].id], data['servers']['removed'])
+        self.assertEqual([], data['servers']['changed'])
+        self.assertEqual({'ids': [], 'changed': [], 'removed': []},
+                         data['networks'])
+
+    def test_gateway_ports_unique(self):
+        routers = [{'id': router_id,
+                    'external_gateway_info': {'network_id': 'ext'}}
+                   for router_id in ('1', '2')]
+        ports = []
+        views.JSONView()._prepare_gateway_ports(routers, ports)
+        self.assertEqual(['gatewayext-1', 'gatewayext-2'],
+                         [port['id'] for port in ports])
+        self.assertEqual(['1', '2'], [port['device_id'] for port in ports])
+
+    @test.create_stubs({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_unknown_version(self):
+        self._stub_json_view_data(self.servers.list())
+        self.mox.ReplayAll()
+
+        res = self.client.get(JSON_URL, {'since': 'unknown'})
+        data = json.loads(res.content)
+        self.assertNotIn('delta', data)
+        self.assertEqual(len(self.servers.list()), len(data['servers']))
+
 
 class NetworkTopologyCreateTests(test.TestCase):
 
@@ -161,7 +273,8 @@ class NetworkTopologyCreateTests(test.TestCase):
         quota_data['instances']['available'] = instances_quota
 
         quotas.tenant_quota_usages(
-            IsA(http.HttpRequest)) \
+            IsA(http.HttpRequest),
+            targets=('instances', 'networks', 'routers')) \
             .MultipleTimes().AndReturn(quota_data)
 
         self.mox.ReplayAll()
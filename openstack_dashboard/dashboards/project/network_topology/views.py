@@ -16,16 +16,18 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import hashlib
 import json
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from django.core.urlresolvers import reverse_lazy
 from django.http import HttpResponse  # noqa
+from django.http import HttpResponseNotModified  # noqa
 from django.utils.translation import ugettext_lazy as _
 from django.views.generic import View  # noqa
 
-from horizon import exceptions
 from horizon import views
 
 from openstack_dashboard import api
@@ -40,6 +42,8 @@ from openstack_dashboard.dashboards.project.network_topology.routers \
 
 from openstack_dashboard.dashboards.project.instances import\
     console as i_console
+from openstack_dashboard.dashboards.project.instances import\
+    tables as i_tables
 from openstack_dashboard.dashboards.project.instances import\
     views as i_views
 from openstack_dashboard.dashboards.project.instances.workflows import\
@@ -110,7 +114,8 @@ class NetworkTopologyView(views.HorizonTemplateView):
         return has_permission
 
     def _quota_exceeded(self, quota):
-        usages = quotas.tenant_quota_usages(self.request)
+        usages = quotas.tenant_quota_usages(
+            self.request, targets=('instances', 'networks', 'routers'))
         available = usages[quota]['available']
         return available <= 0
 
@@ -136,6 +141,9 @@ class NetworkTopologyView(views.HorizonTemplateView):
 
 
 class JSONView(View):
+    # How long (in seconds) the snapshots used to compute the changes since
+    # a previously returned document are kept.
+    snapshot_timeout = 600
 
     @property
     def is_router_enabled(self):
@@ -165,19 +173,23 @@ class JSONView(View):
             servers = []
         data = []
         console_type = getattr(settings, 'CONSOLE_TYPE', 'AUTO')
-        # lowercase of the keys will be used at the end of the console URL.
+        # The console link is appended to the instance URL. Looking up the
+        # console of every server here would cost one or more Nova calls
+        # per server on each poll, so with AUTO the console type is only
+        # resolved when the link is actually opened.
+        if console_type == 'AUTO':
+            console = 'auto_console'
+        elif console_type in i_console.CONSOLES:
+            # lowercase of the keys will be used at the end of the console URL.
+            console = console_type.lower()
+        else:
+            console = None
         for server in servers:
-            try:
-                console = i_console.get_console(
-                    request, console_type, server)[0].lower()
-            except exceptions.NotAvailable:
-                console = None
-
             server_data = {'name': server.name,
                            'status': server.status,
                            'task': getattr(server, 'OS-EXT-STS:task_state'),
                            'id': server.id}
-            if console:
+            if console and server.status in i_tables.ACTIVE_STATES:
                 server_data['console'] = console
             data.append(server_data)
         self.add_resource_url('horizon:project:instances:detail', data)
@@ -282,17 +294,67 @@ class JSONView(View):
                                                 router['id'],
                                                 external_network):
                 continue
-            fake_port = {'id': 'gateway%s' % external_network,
+            # The ID must be unique, as the topology deltas are keyed on it,
+            # and several routers can use the same external network.
+            fake_port = {'id': 'gateway%s-%s' % (external_network,
+                                                 router['id']),
                          'network_id': external_network,
                          'device_id': router['id'],
                          'fixed_ips': []}
             ports.append(fake_port)
 
+    def _snapshot_key(self, request, version):
+        return 'network_topology:%s:%s:%s' % (request.user.tenant_id,
+                                              request.user.id, version)
+
+    def _get_delta(self, previous, data):
+        """Returns the changes from the previous topology document.
+
+        For every kind of resource the delta lists the resources that were
+        added or changed, the IDs of the removed ones and the ordered IDs of
+        all the current ones.
+        """
+        delta = {'delta': True}
+        for kind, resources in data.items():
+            old = dict((resource['id'], resource)
+                       for resource in previous.get(kind, []))
+            ids = [resource['id'] for resource in resources]
+            current = set(ids)
+            delta[kind] = {
+                'ids': ids,
+                'changed': [resource for resource in resources
+                            if old.get(resource['id']) != resource],
+                'removed': [resource_id for resource_id in old
+                            if resource_id not in current]}
+        return delta
+
     def get(self, request, *args, **kwargs):
         data = {'servers': self._get_servers(request),
                 'networks': self._get_networks(request),
                 'ports': self._get_ports(request),
                 'routers': self._get_routers(request)}
         self._prepare_gateway_ports(data['routers'], data['ports'])
-        json_string = json.dumps(data, ensure_ascii=False)
-        return HttpResponse(json_string, content_type='text/json')
+        json_string = json.dumps(data, ensure_ascii=False, sort_keys=True)
+        version = hashlib.sha1(json_string.encode('utf-8')).hexdigest()
+        etag = '"%s"' % version
+
+        # A client which already has the current document gets a 304. A
+        # client polling with the version of a document we still have a
+        # snapshot of only gets the changes since then.
+        since = request.GET.get('since')
+        if (since == version or
+                request.META.get('HTTP_IF_NONE_MATCH') == etag):
+            response = HttpResponseNotModified()
+        else:
+            previous = None
+            if since:
+                previous = cache.get(self._snapshot_key(request, since))
+            cache.set(self._snapshot_key(request, version), data,
+                      self.snapshot_timeout)
+            if previous is not None:
+                data = self._get_delta(previous, data)
+            data['version'] = version
+            json_string = json.dumps(data, ensure_ascii=False)
+            response = HttpResponse(json_string, content_type='text/json')
+        response['ETag'] = etag
+        return response
@@ -159,15 +159,44 @@ class UsageViewTests(test.TestCase):
     def test_usage_csv_disabled(self):
         self._test_usage_csv(nova_stu_enabled=False)
 
+    @test.create_stubs({api.nova: ('usage_get',
+                                   'extension_supported')})
     def _test_usage_csv(self, nova_stu_enabled=True):
-        self._stub_nova_api_calls(nova_stu_enabled)
-        self._stub_neutron_api_calls()
-        self._stub_cinder_api_calls()
+        # Neither the limits nor the quotas are loaded for the export.
+        api.nova.extension_supported(
+            'SimpleTenantUsage', IsA(http.HttpRequest)) \
+            .AndReturn(nova_stu_enabled)
+        if nova_stu_enabled:
+            self._nova_stu_enabled()
         self.mox.ReplayAll()
         res = self.client.get(reverse('horizon:project:overview:index') +
                               "?format=csv")
-        self.assertTemplateUsed(res, 'project/overview/usage.csv')
-        self.assertTrue(isinstance(res.context['usage'], usage.ProjectUsage))
+        self.assertTrue(res.streaming)
+        content = b''.join(res.streaming_content).decode('utf-8')
+        self.assertIn('Project ID:,%s\n' % self.tenant.id, content)
+        if nova_stu_enabled:
+            for inst in self.usages.first().server_usages:
+                self.assertIn(inst['name'], content)
+
+    @test.create_stubs({api.nova: ('usage_get',
+                                   'extension_supported')})
+    def test_usage_csv_chunks(self):
+        api.nova.extension_supported(
+            'SimpleTenantUsage', IsA(http.HttpRequest)).AndReturn(True)
+        self._nova_stu_enabled()
+        self.mox.ReplayAll()
+
+        res = self.client.get(reverse('horizon:project:overview:index') +
+                              "?format=csv")
+        self.assertEqual(100, res.chunk_size)
+        res.chunk_size = 1
+        chunks = list(res.streaming_content)
+        # One chunk per instance, the first one starting with the header,
+        # and the final, empty one.
+        instances = self.usages.first().server_usages
+        self.assertEqual(len(instances) + 1, len(chunks))
+        self.assertTrue(chunks[0].startswith(b'Usage Report For Period:'))
+        self.assertEqual(b'', chunks[-1])
 
     def test_usage_exception_usage(self):
         self._stub_nova_api_calls(stu_exception=self.exceptions.nova)
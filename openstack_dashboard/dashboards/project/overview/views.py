@@ -21,13 +21,12 @@ from django.template.defaultfilters import capfirst  # noqa
 from django.template.defaultfilters import floatformat  # noqa
 from django.utils.translation import ugettext_lazy as _
 
-from horizon.utils import csvbase
 from horizon import views
 
 from openstack_dashboard import usage
 
 
-class ProjectUsageCsvRenderer(csvbase.BaseCsvResponse):
+class ProjectUsageCsvRenderer(usage.UsageCsvStreamingResponse):
 
     columns = [_("Instance Name"), _("VCPUs"), _("RAM (MB)"),
                _("Disk (GB)"), _("Usage (Hours)"),
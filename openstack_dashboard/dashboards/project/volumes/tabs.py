@@ -84,6 +84,7 @@ class VolumeTab(tabs.TableTab, VolumeTableMixIn):
     slug = "volumes_tab"
     template_name = ("horizon/common/_detail_table.html")
     preload = False
+    cache_data = True
 
     def get_volumes_data(self):
         volumes = self._get_volumes()
@@ -13,8 +13,10 @@
 
 """Policy engine for Horizon"""
 
+import collections
 import logging
 import os.path
+import threading
 
 from django.conf import settings
 from openstack_auth import utils as auth_utils
@@ -33,32 +35,106 @@ CONF = cfg.CONF
 CONF.policy_dirs = []
 
 _ENFORCER = None
+_MTIMES = {}
+_TOKEN_DECISIONS = collections.OrderedDict()
+_LOCK = threading.RLock()
 _BASE_PATH = getattr(settings, 'POLICY_FILES_PATH', '')
 
 
+def _get_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
 def _get_enforcer():
+    """Returns the enforcers of the configured policy files by service.
+
+    A policy file is only read again when its modification time changes.
+    """
     global _ENFORCER
-    if not _ENFORCER:
-        _ENFORCER = {}
+    with _LOCK:
+        if _ENFORCER is None:
+            _ENFORCER = {}
+            _MTIMES.clear()
         policy_files = getattr(settings, 'POLICY_FILES', {})
         for service in policy_files.keys():
             policy_path = os.path.join(_BASE_PATH,
                                        policy_files[service])
-            if os.path.isfile(policy_path):
+            mtime = _get_mtime(policy_path)
+            if mtime is None:
+                if _MTIMES.get(service, 0) is not None:
+                    LOG.warn("policy file for service: %s not found at %s" %
+                             (service, policy_path))
+                _ENFORCER.pop(service, None)
+                _MTIMES[service] = None
+            elif service not in _ENFORCER or _MTIMES[service] != mtime:
                 LOG.debug("adding enforcer for service: %s" % service)
                 enforcer = policy.Enforcer(CONF)
                 CONF.oslo_policy.policy_dirs = []
                 enforcer.policy_path = policy_path
+                enforcer.load_rules(force_reload=True)
+                # The rules are now only reloaded here, on a change of the
+                # file, instead of by each call to enforce().
+                enforcer.use_conf = False
                 _ENFORCER[service] = enforcer
-            else:
-                LOG.warn("policy file for service: %s not found at %s" %
-                         (service, policy_path))
-    return _ENFORCER
+                _MTIMES[service] = mtime
+        return _ENFORCER
 
 
 def reset():
     global _ENFORCER
-    _ENFORCER = None
+    with _LOCK:
+        _ENFORCER = None
+        _TOKEN_DECISIONS.clear()
+
+
+def _get_cache_config():
+    config = {'per_token': False, 'max_tokens': 1000}
+    config.update(getattr(settings, 'POLICY_CHECK_CACHE', {}))
+    return config
+
+
+class _CheckState(object):
+    """The policy decisions and check counters of a request."""
+
+    def __init__(self, decisions, enforcer):
+        self.decisions = decisions
+        self.enforcer = enforcer
+        self.checks = 0
+        self.evaluated = 0
+
+
+def _get_check_state(request, user):
+    """Returns the policy check state of ``request``.
+
+    Decisions are cached for the duration of the request and, if the
+    ``per_token`` option of the ``POLICY_CHECK_CACHE`` setting is enabled,
+    for the lifetime of the user's token in this process.
+    """
+    state = getattr(request, '_policy_check_state', None)
+    if isinstance(state, _CheckState):
+        return state
+    enforcer = _get_enforcer()
+    config = _get_cache_config()
+    token_id = getattr(getattr(user, 'token', None), 'id', None)
+    if config['per_token'] and token_id:
+        with _LOCK:
+            # The decisions of a token are dropped when any policy file
+            # changes since the modification times are part of the key.
+            key = (token_id, tuple(sorted(_MTIMES.items())))
+            decisions = _TOKEN_DECISIONS.pop(key, None)
+            if decisions is None:
+                decisions = {}
+            _TOKEN_DECISIONS[key] = decisions
+            while len(_TOKEN_DECISIONS) > config['max_tokens']:
+                _TOKEN_DECISIONS.popitem(last=False)
+    else:
+        decisions = {}
+    state = _CheckState(decisions, enforcer)
+    request._policy_check_state = state
+    return state
 
 
 def check(actions, request, target=None):
@@ -122,10 +198,19 @@ def check(actions, request, target=None):
     if target.get('domain_id') is None:
         target['domain_id'] = user.domain_id
 
-    credentials = _user_to_credentials(request, user)
+    state = _get_check_state(request, user)
+    state.checks += 1
+    key = (tuple(tuple(action) for action in actions),
+           repr(sorted(target.items())))
+    if key not in state.decisions:
+        state.evaluated += 1
+        credentials = _user_to_credentials(request, user)
+        state.decisions[key] = _enforce(state.enforcer, actions, target,
+                                        credentials)
+    return state.decisions[key]
 
-    enforcer = _get_enforcer()
 
+def _enforce(enforcer, actions, target, credentials):
     for action in actions:
         scope, action = action[0], action[1]
         if scope in enforcer:
@@ -133,9 +218,6 @@ def check(actions, request, target=None):
             if not enforcer[scope].enforce(action, target, credentials):
                 # to match service implementations, if a rule is not found,
                 # use the default rule for that service policy
-                #
-                # waiting to make the check because the first call to
-                # enforce loads the rules
                 if action not in enforcer[scope].rules:
                     if not enforcer[scope].enforce('default',
                                                    target, credentials):
@@ -160,3 +242,26 @@ def _user_to_credentials(request, user):
                              'is_admin': user.is_superuser,
                              'roles': roles}
     return user._credentials
+
+
+class PolicyCheckCounterMiddleware(object):
+    """Logs how many policy checks were made to serve each request.
+
+    The number of checks, and of those which actually had to be evaluated
+    instead of being answered from the decision cache, is logged at the
+    debug level. When ``DEBUG`` is enabled it is also sent in the
+    ``X-Policy-Checks`` response header.
+    """
+
+    def process_response(self, request, response):
+        state = getattr(request, '_policy_check_state', None)
+        if isinstance(state, _CheckState):
+            LOG.debug("%(checks)d policy checks (%(evaluated)d evaluated) "
+                      "for %(path)s",
+                      {'checks': state.checks,
+                       'evaluated': state.evaluated,
+                       'path': request.path})
+            if settings.DEBUG:
+                response['X-Policy-Checks'] = "%d; evaluated=%d" % (
+                    state.checks, state.evaluated)
+        return response
@@ -109,6 +109,7 @@ MIDDLEWARE_CLASSES += (
     'horizon.middleware.HorizonMiddleware',
     'django.middleware.locale.LocaleMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'openstack_dashboard.policy_backend.PolicyCheckCounterMiddleware',
 )
 
 TEMPLATE_CONTEXT_PROCESSORS = (
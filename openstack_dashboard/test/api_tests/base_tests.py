@@ -19,6 +19,7 @@
 from __future__ import absolute_import
 
 from django.conf import settings
+from novaclient.v2 import flavors
 
 from horizon import exceptions
 
@@ -241,6 +242,103 @@ class ApiHelperTests(test.TestCase):
             url = api_base.url_for(self.request, 'image')
 
 
+@test.update_settings(OPENSTACK_CAPABILITY_CACHE={'timeout': 60})
+class CapabilityCacheTests(test.TestCase):
+    def setUp(self):
+        super(CapabilityCacheTests, self).setUp()
+        self.cache = api_base._get_cache('default')
+        self.cache.clear()
+        self.calls = []
+
+        @api_base.capability_cached('compute')
+        def lookup(request, name):
+            self.calls.append(name)
+            return [name]
+        self.lookup = lookup
+
+    def tearDown(self):
+        self.cache.clear()
+        super(CapabilityCacheTests, self).tearDown()
+
+    def test_result_shared_across_requests(self):
+        other_request = self.factory.get('/')
+        other_request.user = self.request.user
+
+        self.assertEqual(['foo'], self.lookup(self.request, 'foo'))
+        self.assertEqual(['foo'], self.lookup(other_request, 'foo'))
+        self.assertEqual(['foo'], self.calls)
+
+    def test_keyed_on_arguments_and_region(self):
+        self.lookup(self.request, 'foo')
+        self.lookup(self.request, 'bar')
+        self.request.user.services_region = "RegionTwo"
+        self.lookup(self.request, 'foo')
+        self.assertEqual(['foo', 'bar', 'foo'], self.calls)
+
+    @test.update_settings(OPENSTACK_CAPABILITY_CACHE={'timeout': 0})
+    def test_disabled(self):
+        self.lookup(self.request, 'foo')
+        self.lookup(self.request, 'foo')
+        self.assertEqual(['foo', 'foo'], self.calls)
+
+    def test_service_not_in_catalog(self):
+        @api_base.capability_cached('notAnApi')
+        def lookup(request):
+            self.calls.append(None)
+            return []
+
+        lookup(self.request)
+        lookup(self.request)
+        self.assertEqual([None, None], self.calls)
+
+
+@test.update_settings(RESOURCE_LIST_CACHE={'timeout': 60})
+class ResourceListCacheTests(test.TestCase):
+    def setUp(self):
+        super(ResourceListCacheTests, self).setUp()
+        self.cache = api_base._get_cache('default')
+        self.cache.clear()
+        self.calls = []
+        self.manager = flavors.FlavorManager(None)
+
+    def tearDown(self):
+        self.cache.clear()
+        super(ResourceListCacheTests, self).tearDown()
+
+    def _list(self, request, per_project=False):
+        def fetch():
+            self.calls.append(request)
+            return self.flavors.list()
+        return api_base.resource_list_cached(
+            request, 'flavors', 'compute', fetch, lambda: self.manager,
+            per_project=per_project)
+
+    def test_resources_shared_across_requests(self):
+        other_request = self.factory.get('/')
+        other_request.user = self.request.user
+
+        self.assertEqual(self.flavors.list(), self._list(self.request))
+        cached = self._list(other_request)
+        self.assertEqual([self.request], self.calls)
+        self.assertEqual([f._info for f in self.flavors.list()],
+                         [f._info for f in cached])
+        self.assertTrue(all(isinstance(f, flavors.Flavor) for f in cached))
+
+    def test_keyed_on_project(self):
+        self._list(self.request, per_project=True)
+        self.request.user.project_id = 'other'
+        self._list(self.request, per_project=True)
+        self._list(self.request)
+        self._list(self.request)
+        self.assertEqual(3, len(self.calls))
+
+    @test.update_settings(RESOURCE_LIST_CACHE={'timeout': 0})
+    def test_disabled(self):
+        self._list(self.request)
+        self._list(self.request)
+        self.assertEqual(2, len(self.calls))
+
+
 class QuotaSetTests(test.TestCase):
 
     def test_quotaset_add_with_plus(self):
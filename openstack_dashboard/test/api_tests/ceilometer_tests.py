@@ -12,7 +12,13 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import datetime
+
+from ceilometerclient.v2 import statistics
+from django.core.cache import cache
 from django import http
+from django.test.utils import override_settings
+from django.utils import timezone
 
 from mox import IsA  # noqa
 
@@ -21,6 +27,50 @@ from openstack_dashboard.test import helpers as test
 
 
 class CeilometerApiTests(test.APITestCase):
+    def _daily_statistics(self, days_and_values):
+        return [api.ceilometer.Statistic(statistics.Statistics(
+                None, {'period_start': day.strftime('%Y-%m-%dT%H:%M:%S'),
+                       'avg': value}, loaded=True))
+                for day, value in days_and_values]
+
+    @override_settings(CEILOMETER_STATISTICS_CACHE={'timeout': 60,
+                                                    'settle_time': 0})
+    def test_statistic_list_daily_reuses_closed_days(self):
+        cache.clear()
+        date_to = timezone.now()
+        date_from = date_to - datetime.timedelta(days=2)
+        today = date_to.replace(hour=0, minute=0, second=0, microsecond=0)
+        days = [today - datetime.timedelta(days=2),
+                today - datetime.timedelta(days=1),
+                today]
+        query = [{'field': 'project_id', 'op': 'eq', 'value': 'id'}]
+
+        self.mox.StubOutWithMock(api.ceilometer, 'statistic_list')
+        api.ceilometer.statistic_list(
+            IsA(http.HttpRequest), 'cpu',
+            query=query + [
+                {'field': 'timestamp', 'op': 'ge', 'value': days[0]},
+                {'field': 'timestamp', 'op': 'le', 'value': date_to}],
+            period=3600 * 24) \
+            .AndReturn(self._daily_statistics(zip(days, [1, 2, 3])))
+        api.ceilometer.statistic_list(
+            IsA(http.HttpRequest), 'cpu',
+            query=query + [
+                {'field': 'timestamp', 'op': 'ge', 'value': today},
+                {'field': 'timestamp', 'op': 'le', 'value': date_to}],
+            period=3600 * 24) \
+            .AndReturn(self._daily_statistics([(today, 4)]))
+        self.mox.ReplayAll()
+
+        ret_list = api.ceilometer.statistic_list_daily(
+            self.request, 'cpu', query, date_from, date_to)
+        self.assertEqual([1, 2, 3], [s.avg for s in ret_list])
+
+        # Only the current day is fetched again.
+        ret_list = api.ceilometer.statistic_list_daily(
+            self.request, 'cpu', query, date_from, date_to)
+        self.assertEqual([1, 2, 4], [s.avg for s in ret_list])
+
     def test_sample_list(self):
         samples = self.samples.list()
         meter_name = "meter_name"
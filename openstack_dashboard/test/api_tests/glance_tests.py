@@ -16,14 +16,27 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import logging
+
 from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test.utils import override_settings
+from mox import IsA  # noqa
 
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
+from openstack_dashboard.utils import http_pool
 
 
 class GlanceApiTests(test.APITestCase):
+    def test_glanceclient_uses_shared_pool(self):
+        url = api.base.url_for(self.request, 'image')
+        client = self._original_glanceclient(self.request)
+        session = client.http_client.session
+        self.assertEqual(self.request.user.token.id,
+                         session.headers['X-Auth-Token'])
+        self.assertIs(http_pool.get_adapter(url), session.get_adapter(url))
+
     @override_settings(API_RESULT_PAGE_SIZE=2)
     def test_image_list_detailed_no_pagination(self):
         # Verify that all images are returned even with a small page size
@@ -247,3 +260,56 @@ class GlanceApiTests(test.APITestCase):
         self.mox.ReplayAll()
         image = api.glance.image_get(self.request, 'empty')
         self.assertIsNone(image.name)
+
+    def test_image_create_upload(self):
+        image = self.images.first()
+        data = SimpleUploadedFile('image.img', b'x' * 1000,
+                                  'application/octet-stream')
+        uploaded = []
+
+        def read_data(image_id, data, purge_props):
+            chunk = data.read(64)
+            while chunk:
+                uploaded.append(chunk)
+                chunk = data.read(64)
+
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        glanceclient.images.create(name='image').AndReturn(image)
+        glanceclient.images.update(image.id,
+                                   data=IsA(api.glance.ImageUploadStream),
+                                   purge_props=False) \
+            .WithSideEffects(read_data)
+        self.mox.ReplayAll()
+
+        ret_val = api.glance.image_create(self.request, name='image',
+                                          data=data)
+        self.assertEqual(image, ret_val)
+        # The buffer of the upload was taken over, not copied.
+        self.assertEqual(b'', data.read())
+        self.assertEqual(b'x' * 1000, b''.join(uploaded))
+        self.assertEqual({'status': 'done', 'size': 1000, 'uploaded': 1000},
+                         api.glance.image_upload_progress(self.request,
+                                                          image.id))
+
+    def test_image_create_upload_failed(self):
+        image = self.images.first()
+        data = SimpleUploadedFile('image.img', b'x' * 1000,
+                                  'application/octet-stream')
+
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        glanceclient.images.create(name='image').AndReturn(image)
+        glanceclient.images.update(image.id,
+                                   data=IsA(api.glance.ImageUploadStream),
+                                   purge_props=False) \
+            .AndRaise(self.exceptions.glance)
+        self.mox.ReplayAll()
+
+        try:
+            logging.disable(logging.ERROR)
+            api.glance.image_create(self.request, name='image', data=data)
+        finally:
+            logging.disable(logging.NOTSET)
+        progress = api.glance.image_upload_progress(self.request, image.id)
+        self.assertEqual('failed', progress['status'])
@@ -18,10 +18,18 @@
 
 from __future__ import absolute_import
 
+import copy
+
+from django.test.utils import override_settings
+from keystoneclient import exceptions as keystone_exceptions
 from keystoneclient.v2_0 import client as keystone_client
+from keystoneclient.v2_0 import users
+from mox import IgnoreArg  # noqa
+import requests
 
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
+from openstack_dashboard.utils import http_pool
 
 
 class FakeConnection(object):
@@ -40,6 +48,27 @@ class ClientConnectionTests(test.TestCase):
                                           endpoint_type='adminURL')
         self.conn = FakeConnection()
 
+    def test_keystoneclient_uses_shared_connections(self):
+        self.addCleanup(http_pool.clear)
+        self.conn.auth_token = self.request.user.token.id
+        self.conn.session = FakeConnection()
+        self.conn.session.session = requests.Session()
+        self.conn.session.verify = True
+        self.conn.session.cert = None
+        client = api.keystone.VERSIONS.get_active_version()['client']
+        if client is not keystone_client:
+            self.mox.StubOutWithMock(client, "Client")
+        client.Client(token=IgnoreArg(), endpoint=IgnoreArg(),
+                      original_ip=IgnoreArg(), insecure=IgnoreArg(),
+                      cacert=IgnoreArg(), auth_url=IgnoreArg(),
+                      debug=IgnoreArg()).AndReturn(self.conn)
+        self.mox.ReplayAll()
+
+        conn = api.keystone.keystoneclient(self.request)
+        self.assertIs(self.conn, conn)
+        self.assertIs(http_pool.get_adapter(self.internal_url),
+                      conn.session.session.get_adapter(self.internal_url))
+
 
 class RoleAPITests(test.APITestCase):
     def setUp(self):
@@ -83,6 +112,145 @@ class RoleAPITests(test.APITestCase):
         role = api.keystone.get_default_role(self.request)
 
 
+class IdentityListPaginationTests(test.APITestCase):
+    def _stub_users(self):
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.users = self.mox.CreateMockAnything()
+        keystoneclient.users.resource_class = users.User
+        return keystoneclient.users
+
+    def _sorted_ids(self, users):
+        return [user.id for user in
+                sorted(users, key=lambda user: (user.name.lower(), user.id))]
+
+    @override_settings(API_RESULT_PAGE_SIZE=2)
+    def test_user_list_paged(self):
+        users = self.users.list()
+        manager = self._stub_users()
+        manager.list(domain='1').MultipleTimes().AndReturn(users)
+        self.mox.ReplayAll()
+
+        ids = self._sorted_ids(users)
+        page, more = api.keystone.user_list_paged(self.request, domain='1')
+        self.assertEqual(ids[:2], [user.id for user in page])
+        self.assertTrue(more)
+        page, more = api.keystone.user_list_paged(
+            self.request, marker=ids[len(ids) - 3], domain='1')
+        self.assertEqual(ids[-2:], [user.id for user in page])
+        self.assertFalse(more)
+
+    def test_user_list_paged_filters(self):
+        user = self.users.first()
+        manager = self._stub_users()
+        manager.list(domain=None, name=user.name).AndReturn([user])
+        self.mox.ReplayAll()
+
+        page, more = api.keystone.user_list_paged(
+            self.request, filters={'name': user.name})
+        self.assertEqual([user.id], [u.id for u in page])
+        self.assertFalse(more)
+
+    def test_user_list_paged_search(self):
+        users = self.users.list()
+        manager = self._stub_users()
+        manager.list(domain=None).AndReturn(users)
+        self.mox.ReplayAll()
+
+        search = users[0].name[1:].upper()
+        page, more = api.keystone.user_list_paged(self.request,
+                                                  search=search)
+        self.assertEqual(
+            self._sorted_ids([user for user in users
+                              if search.lower() in user.name.lower()]),
+            [user.id for user in page])
+        self.assertFalse(more)
+
+    @override_settings(API_RESULT_PAGE_SIZE=2,
+                       IDENTITY_LIST_CACHE={'timeout': 60})
+    def test_user_list_paged_cached(self):
+        api.keystone._invalidate_list_index('users')
+        users = self.users.list()
+        manager = self._stub_users()
+        manager.list(domain=None).AndReturn(users)
+        manager.delete(users[0].id)
+        manager.list(domain=None).AndReturn(users[1:])
+        self.mox.ReplayAll()
+
+        ids = self._sorted_ids(users)
+        api.keystone.user_list_paged(self.request)
+        page, more = api.keystone.user_list_paged(self.request,
+                                                  marker=ids[1])
+        self.assertEqual(ids[2:4], [user.id for user in page])
+        # Deleting a user indexes the users again.
+        api.keystone.user_delete(self.request, users[0].id)
+        page, more = api.keystone.user_list_paged(self.request)
+        self.assertEqual(self._sorted_ids(users[1:])[:2],
+                         [user.id for user in page])
+
+    @override_settings(API_RESULT_PAGE_SIZE=2,
+                       IDENTITY_LIST_CACHE={'timeout': 60})
+    def test_user_list_paged_chunks(self):
+        self.addCleanup(setattr, api.keystone, 'LIST_INDEX_CHUNK_SIZE',
+                        api.keystone.LIST_INDEX_CHUNK_SIZE)
+        api.keystone.LIST_INDEX_CHUNK_SIZE = 3
+        api.keystone._invalidate_list_index('users')
+        users = self.users.list()
+        manager = self._stub_users()
+        manager.list(domain=None).AndReturn(users)
+        self.mox.ReplayAll()
+
+        # Every page is read from the chunks of the cached index.
+        ids = []
+        more = True
+        while more:
+            page, more = api.keystone.user_list_paged(
+                self.request, marker=ids[-1] if ids else None)
+            ids.extend(user.id for user in page)
+        self.assertEqual(self._sorted_ids(users), ids)
+
+    @override_settings(IDENTITY_LIST_CACHE={'timeout': 60})
+    def test_user_list_paged_cached_per_token(self):
+        api.keystone._invalidate_list_index('users')
+        users = self.users.list()
+        manager = self._stub_users()
+        manager.list(domain=None).AndReturn(users)
+        manager.list(domain=None).AndReturn(users[:1])
+        self.mox.ReplayAll()
+
+        api.keystone.user_list_paged(self.request)
+        # Another token may not see the same users.
+        token = copy.copy(self.request.user.token)
+        token.id = 'other_token_id'
+        self.request.user.token = token
+        page, more = api.keystone.user_list_paged(self.request)
+        self.assertEqual([users[0].id], [user.id for user in page])
+
+    def test_user_create_invalidates_after_create(self):
+        manager = self._stub_users()
+        self.mox.StubOutWithMock(api.keystone, '_invalidate_list_index')
+        manager.create(IgnoreArg(), password=None, email=None, project=None,
+                       enabled=None, domain=None, description=None) \
+            .AndRaise(self.exceptions.keystone)
+        self.mox.ReplayAll()
+
+        # The listings are only indexed again once a user was created.
+        self.assertRaises(self.exceptions.keystone.__class__,
+                          api.keystone.user_create, self.request, name='x')
+
+    def test_user_names(self):
+        user = self.users.first()
+        manager = self._stub_users()
+        manager.get(user.id).InAnyOrder().AndReturn(user)
+        manager.get('unknown').InAnyOrder() \
+            .AndRaise(keystone_exceptions.NotFound(404))
+        self.mox.ReplayAll()
+
+        # The users are got by ID instead of listing the domain.
+        self.assertEqual({user.id: user.name},
+                         api.keystone.user_names(self.request,
+                                                 [user.id, 'unknown']))
+
+
 class ServiceAPITests(test.APITestCase):
     def test_service_wrapper(self):
         catalog = self.service_catalog
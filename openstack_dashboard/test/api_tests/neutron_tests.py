@@ -452,6 +452,8 @@ class NeutronApiTests(test.APITestCase):
         # As a result three API calls with 4, 4, 2 port ID
         # are expected.
 
+        self.addCleanup(api.neutron._uri_budgets.clear)
+        api.neutron._uri_budgets.clear()
         ports = [{'id': str(uuid.uuid4()),
                   'name': 'port%s' % i,
                   'admin_state_up': True}
@@ -461,9 +463,15 @@ class NeutronApiTests(test.APITestCase):
         neutronclient = self.stub_neutronclient()
         uri_len_exc = neutron_exc.RequestURITooLong(excess=220)
         neutronclient.list_ports(id=port_ids).AndRaise(uri_len_exc)
+        # The chunks are listed concurrently, i.e. in any order.
         for i in range(0, 10, 4):
-            neutronclient.list_ports(id=port_ids[i:i + 4]) \
+            neutronclient.list_ports(id=port_ids[i:i + 4]).InAnyOrder() \
                 .AndReturn({'ports': ports[i:i + 4]})
+        # The second time the chunks are listed without the failing call,
+        # and the resources found in several chunks are returned once.
+        for i in range(0, 10, 4):
+            neutronclient.list_ports(id=port_ids[i:i + 4]).InAnyOrder() \
+                .AndReturn({'ports': ports[i:i + 5]})
         self.mox.ReplayAll()
 
         ret_val = api.neutron.list_resources_with_long_filters(
@@ -471,3 +479,8 @@ class NeutronApiTests(test.APITestCase):
             request=self.request)
         self.assertEqual(10, len(ret_val))
         self.assertEqual(port_ids, [p.id for p in ret_val])
+
+        ret_val = api.neutron.list_resources_with_long_filters(
+            api.neutron.port_list, 'id', port_ids,
+            request=self.request)
+        self.assertEqual(port_ids, [p.id for p in ret_val])
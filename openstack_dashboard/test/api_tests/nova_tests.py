@@ -30,6 +30,7 @@ import six
 
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
+from openstack_dashboard.utils import http_pool
 
 
 class ServerWrapperTests(test.TestCase):
@@ -51,6 +52,16 @@ class ServerWrapperTests(test.TestCase):
 
 class ComputeApiTests(test.APITestCase):
 
+    def test_novaclient_uses_shared_pool(self):
+        url = api.base.url_for(self.request, 'compute')
+        clients = [self._original_novaclient(self.request) for i in range(2)]
+        sessions = [c.client._get_session(url) for c in clients]
+        self.assertIsNot(sessions[0], sessions[1])
+        self.assertIs(http_pool.get_adapter(url, verify=True),
+                      sessions[0].get_adapter(url))
+        self.assertIs(sessions[0].get_adapter(url),
+                      sessions[1].get_adapter(url))
+
     def test_server_reboot(self):
         server = self.servers.first()
         HARDNESS = servers.REBOOT_HARD
@@ -18,15 +18,26 @@
 
 from __future__ import absolute_import
 
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test.utils import override_settings
+import mox
 from mox import IsA  # noqa
 
 from horizon import exceptions
 
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
+from openstack_dashboard.utils import http_pool
 
 
 class SwiftApiTests(test.APITestCase):
+    def test_swift_connection_uses_shared_pool(self):
+        connection = api.swift._swift_connection(self.request)
+        parsed, conn = connection.http_connection()
+        self.assertEqual(self.request.user.token.id, connection.token)
+        self.assertIs(http_pool.get_adapter(conn.url, verify=True),
+                      conn.request_session.get_adapter(conn.url))
+
     def test_swift_get_containers(self):
         containers = self.containers.list()
         cont_data = [c._apidict for c in containers]
@@ -123,6 +134,67 @@ class SwiftApiTests(test.APITestCase):
         self.assertEqual(len(objects), len(objs))
         self.assertFalse(more)
 
+    def test_object_filter(self):
+        object_filter = api.swift.ObjectFilter('OBJECT test*two*')
+        self.assertEqual('test', object_filter.prefix)
+        self.assertTrue(object_filter.matches('test_object_two'))
+        self.assertFalse(object_filter.matches('test_object_three'))
+        self.assertFalse(object_filter.matches('Test_object_two'))
+        self.assertFalse(object_filter.matches('test_two'))
+        # Every term must match, not only the first one.
+        object_filter = api.swift.ObjectFilter('object three')
+        self.assertEqual('', object_filter.prefix)
+        self.assertTrue(object_filter.matches('test,object_three'))
+        self.assertFalse(object_filter.matches('test_object_two'))
+
+    @override_settings(API_RESULT_LIMIT=2)
+    def test_swift_filter_objects(self):
+        container = self.containers.first()
+        objects = [{'name': 'folder/test_%d' % i, 'bytes': i}
+                   for i in range(5)]
+
+        # The listing is restricted to the prefix of the pattern and paged
+        # until enough matching objects, or all of them, are found.
+        swift_api = self.stub_swiftclient()
+        swift_api.get_container(container.name,
+                                limit=2,
+                                marker=None,
+                                prefix='folder/test_',
+                                delimiter='/').AndReturn([{}, objects[:2]])
+        swift_api.get_container(container.name,
+                                limit=2,
+                                marker='folder/test_1',
+                                prefix='folder/test_',
+                                delimiter='/').AndReturn([{}, objects[2:4]])
+        swift_api.get_container(container.name,
+                                limit=2,
+                                marker='folder/test_3',
+                                prefix='folder/test_',
+                                delimiter='/').AndReturn([{}, objects[4:]])
+        self.mox.ReplayAll()
+
+        objs = api.swift.swift_filter_objects(self.request, 'test_* 3',
+                                              container.name,
+                                              prefix='folder/')
+        self.assertEqual(['folder/test_3'], [obj.name for obj in objs])
+
+    @override_settings(API_RESULT_LIMIT=2)
+    def test_swift_filter_objects_limit(self):
+        container = self.containers.first()
+        objects = [{'name': 'test_%d' % i, 'bytes': i} for i in range(5)]
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_container(container.name,
+                                limit=2,
+                                marker=None,
+                                prefix='',
+                                delimiter='/').AndReturn([{}, objects[:2]])
+        self.mox.ReplayAll()
+
+        objs = api.swift.swift_filter_objects(self.request, 'TEST',
+                                              container.name)
+        self.assertEqual(['test_0', 'test_1'], [obj.name for obj in objs])
+
     def test_swift_get_object_with_data_non_chunked(self):
         container = self.containers.first()
         object = self.objects.first()
@@ -153,6 +225,29 @@ class SwiftApiTests(test.APITestCase):
             self.request, container.name, object.name)
         self.assertEqual(object.name, obj.name)
 
+    def test_swift_get_object_range(self):
+        container = self.containers.first()
+        object = self.objects.first()
+        headers = {'content-length': '4',
+                   'content-range': 'bytes 2-5/10',
+                   'etag': 'abc',
+                   'last-modified': 'Tue, 20 Oct 2015 10:00:00 GMT'}
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_object(
+            container.name, object.name, resp_chunk_size=api.swift.CHUNK_SIZE,
+            headers={'Range': 'bytes=2-5'}
+        ).AndReturn([headers, iter([b'data'])])
+
+        self.mox.ReplayAll()
+
+        obj = api.swift.swift_get_object(
+            self.request, container.name, object.name,
+            headers={'Range': 'bytes=2-5'})
+        self.assertEqual('4', obj.bytes)
+        self.assertEqual('bytes 2-5/10', obj.content_range)
+        self.assertEqual('Tue, 20 Oct 2015 10:00:00 GMT', obj.last_modified)
+
     def test_swift_get_object_without_data(self):
         container = self.containers.first()
         object = self.objects.first()
@@ -197,6 +292,44 @@ class SwiftApiTests(test.APITestCase):
                                       obj.name,
                                       test_file)
 
+    def test_swift_upload_object_segmented(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+        self.addCleanup(setattr, api.swift, 'SEGMENT_SIZE',
+                        api.swift.SEGMENT_SIZE)
+        api.swift.SEGMENT_SIZE = 4
+        test_file = SimpleUploadedFile('fake_object.jpg', b'abcdefghij')
+        segment_container = container.name + '_segments'
+
+        def segment(index):
+            return mox.Regex(r'^[0-9a-f]{32}/4/%08d$' % index)
+
+        def manifest_headers(headers):
+            return (headers['X-Object-Meta-Orig-Filename'] ==
+                    'fake_object.jpg' and
+                    headers['X-Object-Manifest'].startswith(
+                        segment_container + '/'))
+
+        # One connection for the calls of the request and one per segment.
+        swift_api = self.stub_swiftclient(expected_calls=4)
+        swift_api.put_container(segment_container)
+        for index, data in enumerate((b'abcd', b'efgh', b'ij')):
+            swift_api.put_object(segment_container, segment(index), data,
+                                 content_length=len(data)).InAnyOrder()
+        swift_api.put_object(container.name,
+                             obj.name,
+                             '',
+                             content_length=0,
+                             headers=mox.Func(manifest_headers)) \
+            .AndReturn('etag')
+        self.mox.ReplayAll()
+
+        response = api.swift.swift_upload_object(self.request,
+                                                 container.name,
+                                                 obj.name,
+                                                 test_file)
+        self.assertEqual(10, response['bytes'])
+
     def test_swift_upload_object_without_file(self):
         container = self.containers.first()
         obj = self.objects.first()
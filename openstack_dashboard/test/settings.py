@@ -123,6 +123,51 @@ OPENSTACK_NEUTRON_NETWORK = {
     # 'profile_support': 'cisco'
 }
 
+# Capability lookups are stubbed per test, so they must not be cached across
+# tests.
+OPENSTACK_CAPABILITY_CACHE = {
+    'timeout': 0,
+}
+
+# Table data is loaded through stubbed API calls in every test.
+TABLE_DATA_CACHE = {
+    'timeout': 0,
+}
+
+# Panel access checks are stubbed per test and every test uses the same token.
+NAVIGATION_CACHE_TIMEOUT = 0
+
+# API calls are stubbed with mox, whose expectations are not thread-safe, so
+# the calls views issue concurrently run inline. The worker pool itself is
+# tested with plain functions.
+API_CONCURRENCY_WORKERS = 0
+
+# Statistics are stubbed per test.
+CEILOMETER_STATISTICS_CACHE = {
+    'timeout': 0,
+}
+
+# Project lists are stubbed per test.
+PROJECT_NAMES_CACHE = {
+    'timeout': 0,
+}
+
+# Project and user listings are stubbed per test.
+IDENTITY_LIST_CACHE = {
+    'timeout': 0,
+}
+
+# Flavors, availability zones and images are stubbed per test.
+RESOURCE_LIST_CACHE = {
+    'timeout': 0,
+}
+PUBLIC_IMAGE_CATALOG = {
+    'refresh_interval': 0,
+}
+
+# Image uploads run in the test thread, against the stubbed client.
+IMAGE_UPLOAD_WORKERS = 0
+
 OPENSTACK_HYPERVISOR_FEATURES = {
     'can_set_mount_point': False,
     'can_set_password': True,
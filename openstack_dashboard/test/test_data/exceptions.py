@@ -70,6 +70,10 @@ def data(TEST):
     nova_unauth = nova_exceptions.Unauthorized
     TEST.exceptions.nova_unauthorized = create_stubbed_exception(nova_unauth)
 
+    nova_not_found = nova_exceptions.NotFound
+    TEST.exceptions.nova_not_found = create_stubbed_exception(nova_not_found,
+                                                              404)
+
     glance_exception = glance_exceptions.ClientException
     TEST.exceptions.glance = create_stubbed_exception(glance_exception)
 
@@ -10,6 +10,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import os
+import shutil
+import tempfile
+
+from django import http
 from django.test.utils import override_settings
 
 from openstack_dashboard import policy
@@ -69,6 +74,58 @@ class PolicyBackendTestCase(test.TestCase):
                              request=self.request)
         self.assertTrue(value)
 
+    @override_settings(POLICY_CHECK_FUNCTION=policy_backend.check)
+    def test_check_cached_for_request(self):
+        policy_backend.reset()
+        for i in range(3):
+            value = policy.check((("identity", "admin_required"),),
+                                 request=self.request)
+            self.assertFalse(value)
+        policy.check((("compute", "context_is_admin"),),
+                     request=self.request)
+        state = self.request._policy_check_state
+        self.assertEqual((4, 2), (state.checks, state.evaluated))
+
+    @override_settings(POLICY_CHECK_FUNCTION=policy_backend.check,
+                       POLICY_CHECK_CACHE={'per_token': True})
+    def test_check_cached_for_token(self):
+        policy_backend.reset()
+        policy.check((("identity", "admin_required"),),
+                     request=self.request)
+        request = self.factory.get('/')
+        request.user = self.request.user
+        policy.check((("identity", "admin_required"),), request=request)
+        state = request._policy_check_state
+        self.assertEqual((1, 0), (state.checks, state.evaluated))
+
+    def test_policy_file_reloaded_when_changed(self):
+        policy_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, policy_dir)
+        policy_path = os.path.join(policy_dir, 'keystone_policy.json')
+        shutil.copy(os.path.join(policy_backend._BASE_PATH,
+                                 'keystone_policy.json'), policy_path)
+        self.mox.stubs.Set(policy_backend, '_BASE_PATH', policy_dir)
+        with self.settings(POLICY_FILES={'identity': 'keystone_policy.json'}):
+            policy_backend.reset()
+            enforcer = policy_backend._get_enforcer()['identity']
+            self.assertIs(enforcer, policy_backend._get_enforcer()['identity'])
+            mtime = os.path.getmtime(policy_path)
+            os.utime(policy_path, (mtime + 10, mtime + 10))
+            self.assertIsNot(enforcer,
+                             policy_backend._get_enforcer()['identity'])
+        policy_backend.reset()
+
+    @override_settings(POLICY_CHECK_FUNCTION=policy_backend.check,
+                       DEBUG=True)
+    def test_policy_check_counter_middleware(self):
+        policy_backend.reset()
+        policy.check((("identity", "admin_required"),), request=self.request)
+        policy.check((("identity", "admin_required"),), request=self.request)
+        middleware = policy_backend.PolicyCheckCounterMiddleware()
+        response = middleware.process_response(self.request,
+                                               http.HttpResponse())
+        self.assertEqual('2; evaluated=1', response['X-Policy-Checks'])
+
 
 class PolicyBackendTestCaseAdmin(test.BaseAdminViewTests):
     @override_settings(POLICY_CHECK_FUNCTION=policy_backend.check)
@@ -0,0 +1,60 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from django.core.cache import cache
+from django import http
+from django.test.utils import override_settings
+from mox import IsA  # noqa
+
+from openstack_dashboard import api
+from openstack_dashboard.test import helpers as test
+from openstack_dashboard.usage import projects
+
+
+class ProjectNamesTests(test.APITestCase):
+    def test_index_by_id(self):
+        tenants = self.tenants.list()
+        index = projects.index_by_id(tenants)
+        self.assertEqual([t.id for t in tenants], list(index.keys()))
+        self.assertIs(tenants[0], index[tenants[0].id])
+
+    @override_settings(PROJECT_NAMES_CACHE={'timeout': 60})
+    @test.create_stubs({api.keystone: ('tenant_list',)})
+    def test_get_project_names_cached(self):
+        cache.clear()
+        tenants = self.tenants.list()
+        # The second listing is caused by the ID of a project which is not
+        # known yet, the third ID is never found and is remembered.
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([tenants[:1], False])
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([tenants, False])
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([tenants, False])
+        self.mox.ReplayAll()
+
+        expected = dict((t.id, t.name) for t in tenants)
+        names = projects.get_project_names(self.request, [tenants[0].id])
+        self.assertEqual({tenants[0].id: tenants[0].name}, names)
+        names = projects.get_project_names(self.request,
+                                           [tenants[1].id, 'deleted'])
+        self.assertEqual(expected, names)
+        names = projects.get_project_names(self.request,
+                                           [tenants[1].id, 'deleted'])
+        self.assertEqual(expected, names)
+        # Another unknown ID causes a listing, the ones found unknown before
+        # are still remembered.
+        names = projects.get_project_names(self.request, ['also-deleted'])
+        self.assertEqual(expected, names)
+        names = projects.get_project_names(self.request,
+                                           ['deleted', 'also-deleted'])
+        self.assertEqual(expected, names)
@@ -263,3 +263,42 @@ class QuotaTests(test.APITestCase):
 
         # Compare internal structure of usages to expected.
         self.assertItemsEqual(expected_output, quota_usages.usages)
+
+    @test.create_stubs({api.nova: ('server_list',
+                                   'flavor_list',
+                                   'tenant_quota_get',),
+                        api.base: ('is_service_enabled',)})
+    def test_tenant_quota_usages_with_targets(self):
+        servers = [s for s in self.servers.list()
+                   if s.tenant_id == self.request.user.tenant_id]
+
+        api.base.is_service_enabled(IsA(http.HttpRequest),
+                                    'volume').AndReturn(True)
+        api.base.is_service_enabled(IsA(http.HttpRequest),
+                                    'network').AndReturn(False)
+        api.nova.flavor_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
+        api.nova.tenant_quota_get(IsA(http.HttpRequest), '1') \
+            .AndReturn(self.quotas.first())
+        search_opts = {'tenant_id': self.request.user.tenant_id}
+        api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts,
+                             all_tenants=True) \
+            .AndReturn([servers, False])
+
+        self.mox.ReplayAll()
+
+        quota_usages = quotas.tenant_quota_usages(self.request,
+                                                  targets=['instances'])
+        expected_output = self.get_usages()
+
+        # Only the compute usages are computed, and no volume or floating
+        # IP listing is made.
+        self.assertItemsEqual(['instances', 'cores', 'ram'],
+                              quota_usages.usages)
+        for name in ('instances', 'cores', 'ram'):
+            self.assertEqual(expected_output[name], quota_usages[name])
+
+        # The result is memoized for the request.
+        self.assertIs(quota_usages,
+                      quotas.tenant_quota_usages(self.request,
+                                                 targets=('instances',)))
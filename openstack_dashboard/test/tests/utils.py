@@ -14,10 +14,18 @@
 #    under the License.
 
 import datetime
+import threading
+import time
 import uuid
 
+from django.test.utils import override_settings
+from mox import IsA  # noqa
+import requests
+
 from openstack_dashboard.test import helpers as test
+from openstack_dashboard.utils import concurrency
 from openstack_dashboard.utils import filters
+from openstack_dashboard.utils import http_pool
 from openstack_dashboard.utils import metering
 
 
@@ -63,3 +71,188 @@ class UtilsMeteringTests(test.TestCase):
     def test_calc_date_args_invalid(self):
         self.assertRaises(
             ValueError, metering.calc_date_args, object, object, "other")
+
+
+class UtilsConcurrencyTests(test.TestCase):
+    # The test settings run the calls inline, these tests use a pool with
+    # workers. Its threads live as long as the process, so it is shared.
+    pool = concurrency.WorkerPool(4)
+
+    def setUp(self):
+        super(UtilsConcurrencyTests, self).setUp()
+        self._saved_pool = concurrency._pool
+        concurrency._pool = self.pool
+        self.addCleanup(setattr, concurrency, '_pool', self._saved_pool)
+
+    def test_submit_returns_result(self):
+        future = concurrency.submit(self.request, lambda x, y=0: x + y, 1, y=2)
+        self.assertEqual(3, future.result())
+
+    def test_submit_reraises_exception(self):
+        def fail():
+            raise ValueError("boom")
+
+        future = concurrency.submit(self.request, fail)
+        self.assertRaises(ValueError, future.result)
+
+    def test_submit_runs_calls_concurrently(self):
+        # Both calls can only finish if they are running at the same time.
+        barrier = threading.Semaphore(0)
+
+        def wait_for_other():
+            barrier.release()
+            return barrier.acquire()
+
+        futures = [concurrency.submit(self.request, wait_for_other)
+                   for i in range(2)]
+        for future in futures:
+            self.assertTrue(future.result(timeout=5))
+
+    def test_nested_submit_runs_inline(self):
+        def outer():
+            return concurrency.submit(self.request, threading.current_thread)
+
+        future = concurrency.submit(self.request, outer)
+        inner = future.result()
+        self.assertTrue(inner.done())
+
+    def test_run_bounded_returns_results_in_order(self):
+        results = concurrency.run_bounded(self.request, lambda x: x * 2,
+                                          range(10), limit=3)
+        self.assertEqual([x * 2 for x in range(10)], results)
+
+    def test_run_bounded_limits_calls_in_flight(self):
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def work(item):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+        concurrency.run_bounded(self.request, work, range(12), limit=2)
+        self.assertLessEqual(peak[0], 2)
+
+    def test_run_bounded_cancels_remaining_calls_on_error(self):
+        calls = []
+
+        def work(item):
+            calls.append(item)
+            if item == 0:
+                raise ValueError("boom")
+            time.sleep(0.01)
+
+        self.assertRaises(ValueError, concurrency.run_bounded,
+                          self.request, work, range(20), limit=2)
+        self.assertLess(len(calls), 20)
+
+    def test_imap_bounded_cancels_calls_when_closed(self):
+        calls = []
+
+        def work(item):
+            calls.append(item)
+            time.sleep(0.01)
+            return item
+
+        results = concurrency.imap_bounded(self.request, work, range(20),
+                                           limit=2)
+        self.assertEqual(0, next(results))
+        results.close()
+        time.sleep(0.05)
+        self.assertLess(len(calls), 20)
+
+    def test_cancel_prevents_call(self):
+        future = concurrency.Future()
+        self.assertTrue(future.cancel())
+        self.assertRaises(concurrency.CancelledError, future.result)
+        concurrency._run(future, self.fail, (), {})
+
+    def test_pool_without_workers_runs_inline(self):
+        pool = concurrency.WorkerPool(0)
+        future = pool.submit(threading.current_thread)
+        self.assertTrue(future.done())
+        self.assertIs(threading.current_thread(), future.result())
+
+    def test_pool_runs_calls_in_workers(self):
+        future = self.pool.submit(threading.current_thread)
+        self.assertIsNot(threading.current_thread(), future.result(timeout=5))
+
+    @override_settings(API_CONCURRENCY_WORKERS=0)
+    def test_pool_size_from_settings(self):
+        concurrency._pool = None
+        pool = concurrency.get_pool()
+        self.assertEqual(0, pool.max_workers)
+        self.assertIs(pool, concurrency.get_pool())
+
+
+class UtilsHTTPPoolTests(test.TestCase):
+    def setUp(self):
+        super(UtilsHTTPPoolTests, self).setUp()
+        http_pool.clear()
+        self.addCleanup(http_pool.clear)
+
+    def test_adapter_shared_per_endpoint_and_tls_settings(self):
+        adapter = http_pool.get_adapter('https://Glance.example.com:9292/v1')
+        self.assertIs(adapter,
+                      http_pool.get_adapter('https://glance.example.com:9292'))
+        self.assertIsNot(adapter,
+                         http_pool.get_adapter('https://glance.example.com'))
+        self.assertIsNot(adapter,
+                         http_pool.get_adapter('https://glance.example.com:'
+                                               '9292', verify='/ca.pem'))
+
+    def test_mount_keeps_session_headers(self):
+        sessions = [requests.Session(), requests.Session()]
+        for token, session in zip(('token1', 'token2'), sessions):
+            session.headers['X-Auth-Token'] = token
+            self.assertTrue(http_pool.mount(session,
+                                            'http://nova.example.com/v2'))
+        adapters = [session.get_adapter('http://nova.example.com/v2/servers')
+                    for session in sessions]
+        self.assertIs(adapters[0], adapters[1])
+        self.assertIsNot(adapters[0],
+                         sessions[0].get_adapter('http://other.example.com'))
+        self.assertEqual('token1', sessions[0].headers['X-Auth-Token'])
+        self.assertEqual('token2', sessions[1].headers['X-Auth-Token'])
+
+    @override_settings(API_HTTP_POOL_SIZE=0)
+    def test_pooling_disabled(self):
+        session = requests.Session()
+        self.assertFalse(http_pool.mount(session, 'http://nova.example.com'))
+        self.assertIsNone(http_pool.get_adapter('http://nova.example.com'))
+        self.assertIsNotNone(
+            http_pool.AdapterPool().get('http://nova.example.com'))
+
+    def test_stats(self):
+        adapter = http_pool.get_adapter('http://nova.example.com:8774')
+        pool = adapter.poolmanager.connection_from_url(
+            'http://nova.example.com:8774')
+        pool.num_connections = 2
+        pool.num_requests = 5
+        self.assertEqual({'http://nova.example.com:8774': {'hits': 3,
+                                                           'misses': 2}},
+                         http_pool.get_stats())
+
+    def test_log_stats(self):
+        self.addCleanup(setattr, http_pool, '_stats_logged_at',
+                        http_pool._stats_logged_at)
+        http_pool._stats_logged_at = 0
+        self.mox.StubOutWithMock(http_pool, 'LOG')
+        self.mox.StubOutWithMock(http_pool, 'time')
+        http_pool.get_adapter('http://nova.example.com:8774')
+        http_pool.LOG.isEnabledFor(IsA(int)).MultipleTimes() \
+            .AndReturn(True)
+        http_pool.time.time().AndReturn(1000)
+        http_pool.LOG.debug(IsA(str), {'endpoint':
+                                       'http://nova.example.com:8774',
+                                       'hits': 0, 'misses': 0})
+        http_pool.time.time().AndReturn(1100)
+        self.mox.ReplayAll()
+
+        self.assertTrue(http_pool.log_stats(interval=300))
+        # The statistics are not logged again within the interval.
+        self.assertFalse(http_pool.log_stats(interval=300))
@@ -17,7 +17,10 @@
 from openstack_dashboard.usage.base import BaseUsage  # noqa
 from openstack_dashboard.usage.base import GlobalUsage  # noqa
 from openstack_dashboard.usage.base import ProjectUsage  # noqa
+from openstack_dashboard.usage.projects import get_project_names  # noqa
+from openstack_dashboard.usage.projects import index_by_id  # noqa
 from openstack_dashboard.usage.tables import BaseUsageTable  # noqa
 from openstack_dashboard.usage.tables import GlobalUsageTable  # noqa
 from openstack_dashboard.usage.tables import ProjectUsageTable  # noqa
+from openstack_dashboard.usage.views import UsageCsvStreamingResponse  # noqa
 from openstack_dashboard.usage.views import UsageView  # noqa
@@ -0,0 +1,83 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Helpers for correlating resources with the projects owning them.
+
+Admin panels list the resources of all projects and show the name of the
+project of each one. Looking the project up in the project list for every
+row costs O(rows x projects); the helpers below index the projects by ID
+once, and keep the names of all projects in the Django cache so that they
+are not listed from Keystone on every page view.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.utils.datastructures import SortedDict
+
+from openstack_dashboard.api import base
+from openstack_dashboard.api import keystone
+
+
+def index_by_id(items, attr='id'):
+    """Returns an ordered dict of ``items`` keyed on their ``attr``."""
+    return SortedDict((getattr(item, attr), item) for item in items)
+
+
+def _get_config():
+    config = {'backend': 'default', 'timeout': 300}
+    config.update(getattr(settings, 'PROJECT_NAMES_CACHE', {}))
+    return config
+
+
+def _get_cache_key(request):
+    # The projects listed depend on the Keystone server and, with Keystone
+    # v3, on the domain of the user and the domain context of an admin.
+    key = repr((getattr(settings, 'OPENSTACK_KEYSTONE_URL', None),
+                getattr(request.user, 'user_domain_id', None),
+                request.session.get('domain_context')))
+    return 'project_names:%s' % hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def get_project_names(request, project_ids=()):
+    """Returns a dict mapping the ID of every project to its name.
+
+    The names are listed with ``keystone.tenant_list`` and are shared by
+    all requests for ``timeout`` seconds through the Django cache
+    configured by ``PROJECT_NAMES_CACHE``. If one of ``project_ids`` is
+    not found in the cached names, e.g. because the project was created
+    since, they are listed again. IDs which are still not found then, i.e.
+    the ones of deleted projects, are remembered and do not cause another
+    listing.
+
+    Exceptions raised by ``tenant_list`` are not handled.
+    """
+    config = _get_config()
+    project_ids = set(project_ids)
+    unknown = set()
+    if config['timeout']:
+        cache = base._get_cache(config['backend'])
+        key = _get_cache_key(request)
+        cached = cache.get(key)
+        if cached is not None:
+            names, unknown = cached
+            if not project_ids - unknown - set(names):
+                return names
+    tenants, has_more = keystone.tenant_list(request)
+    names = dict((tenant.id, getattr(tenant, 'name', None))
+                 for tenant in tenants)
+    if config['timeout']:
+        # The IDs found unknown before are still remembered, unless their
+        # project showed up since.
+        cache.set(key, (names, (unknown | project_ids) - set(names)),
+                  config['timeout'])
+    return names
@@ -59,6 +59,16 @@ NEUTRON_QUOTA_FIELDS = ("network",
 
 QUOTA_FIELDS = NOVA_QUOTA_FIELDS + CINDER_QUOTA_FIELDS + NEUTRON_QUOTA_FIELDS
 
+# Usages which are computed together from the same resource listings. Asking
+# tenant_quota_usages() for one of them yields the whole group.
+USAGE_GROUPS = (("instances", "cores", "ram"),
+                ("floating_ips",),
+                ("security_groups",),
+                ("networks",),
+                ("subnets",),
+                ("routers",),
+                ("volumes", "snapshots", "gigabytes"),)
+
 QUOTA_NAMES = {
     "metadata_items": _('Metadata Items'),
     "cores": _('VCPUs'),
@@ -253,7 +263,10 @@ def get_disabled_quotas(request):
     return disabled_quotas
 
 
-def _get_tenant_compute_usages(request, usages, disabled_quotas, tenant_id):
+def _get_tenant_compute_usages(request, usages, disabled_quotas, tenant_id,
+                               targets=None):
+    if targets is not None and 'instances' not in targets:
+        return
     if tenant_id:
         # determine if the user has permission to view across projects
         # there are cases where an administrator wants to check the quotas
@@ -291,33 +304,38 @@ def _get_tenant_compute_usages(request, usages, disabled_quotas, tenant_id):
         usages.tally('ram', 0)
 
 
-def _get_tenant_network_usages(request, usages, disabled_quotas, tenant_id):
-    floating_ips = []
-    try:
-        if network.floating_ip_supported(request):
-            floating_ips = network.tenant_floating_ip_list(request)
-    except Exception:
-        pass
-    usages.tally('floating_ips', len(floating_ips))
+def _get_tenant_network_usages(request, usages, disabled_quotas, tenant_id,
+                               targets=None):
+    def wanted(name):
+        return targets is None or name in targets
+
+    if wanted('floating_ips'):
+        floating_ips = []
+        try:
+            if network.floating_ip_supported(request):
+                floating_ips = network.tenant_floating_ip_list(request)
+        except Exception:
+            pass
+        usages.tally('floating_ips', len(floating_ips))
 
-    if 'security_group' not in disabled_quotas:
+    if 'security_group' not in disabled_quotas and wanted('security_groups'):
         security_groups = []
         security_groups = network.security_group_list(request)
         usages.tally('security_groups', len(security_groups))
 
-    if 'network' not in disabled_quotas:
+    if 'network' not in disabled_quotas and wanted('networks'):
         networks = []
         networks = neutron.network_list(request, shared=False)
         if tenant_id:
             networks = filter(lambda net: net.tenant_id == tenant_id, networks)
         usages.tally('networks', len(networks))
 
-    if 'subnet' not in disabled_quotas:
+    if 'subnet' not in disabled_quotas and wanted('subnets'):
         subnets = []
         subnets = neutron.subnet_list(request)
         usages.tally('subnets', len(subnets))
 
-    if 'router' not in disabled_quotas:
+    if 'router' not in disabled_quotas and wanted('routers'):
         routers = []
         routers = neutron.router_list(request)
         if tenant_id:
@@ -325,7 +343,10 @@ def _get_tenant_network_usages(request, usages, disabled_quotas, tenant_id):
         usages.tally('routers', len(routers))
 
 
-def _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id):
+def _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id,
+                              targets=None):
+    if targets is not None and 'volumes' not in targets:
+        return
     if 'volumes' not in disabled_quotas:
         if tenant_id:
             opts = {'all_tenants': 1, 'project_id': tenant_id}
@@ -339,27 +360,60 @@ def _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id):
         usages.tally('snapshots', len(snapshots))
 
 
-@memoized
-def tenant_quota_usages(request, tenant_id=None):
+def tenant_quota_usages(request, tenant_id=None, targets=None):
     """Get our quotas and construct our usage object.
     If no tenant_id is provided, a the request.user.project_id
-    is assumed to be used
+    is assumed to be used.
+
+    If ``targets`` is given, only the usages of the named quotas (e.g.
+    ``('instances', 'networks')``) are returned, and only the resources
+    needed to compute them are listed. Usages in the same group of
+    ``USAGE_GROUPS`` are always computed together.
+
+    The result is memoized for the duration of the request.
     """
+    if targets is not None:
+        targets = set(targets)
+        for group in USAGE_GROUPS:
+            if targets.intersection(group):
+                targets.update(group)
+        # Make it hashable and stable, for memoization.
+        targets = tuple(sorted(targets))
+    return _tenant_quota_usages(request, tenant_id, targets)
+
+
+@memoized
+def _tenant_quota_usages(request, tenant_id, targets):
     if not tenant_id:
         tenant_id = request.user.project_id
 
     disabled_quotas = get_disabled_quotas(request)
     usages = QuotaUsage()
 
-    for quota in get_tenant_quota_data(request,
-                                       disabled_quotas=disabled_quotas,
-                                       tenant_id=tenant_id):
-        usages.add_quota(quota)
+    # Quotas of services none of the targets belong to don't need to be
+    # fetched at all.
+    skipped_quotas = []
+    if targets is not None:
+        if not set(targets).intersection(CINDER_QUOTA_FIELDS):
+            skipped_quotas.extend(CINDER_QUOTA_FIELDS)
+        if not set(targets).intersection(
+                ('floating_ips', 'security_groups', 'networks', 'subnets',
+                 'routers')):
+            skipped_quotas.extend(NEUTRON_QUOTA_FIELDS)
+
+    for quota in get_tenant_quota_data(
+            request, disabled_quotas=disabled_quotas + skipped_quotas,
+            tenant_id=tenant_id):
+        if targets is None or quota.name in targets:
+            usages.add_quota(quota)
 
     # Get our usages.
-    _get_tenant_compute_usages(request, usages, disabled_quotas, tenant_id)
-    _get_tenant_network_usages(request, usages, disabled_quotas, tenant_id)
-    _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id)
+    _get_tenant_compute_usages(request, usages, disabled_quotas, tenant_id,
+                               targets)
+    _get_tenant_network_usages(request, usages, disabled_quotas, tenant_id,
+                               targets)
+    _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id,
+                              targets)
 
     return usages
 
@@ -10,18 +10,50 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from django import VERSION  # noqa
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
 from horizon import tables
+from horizon.utils import csvbase
 from openstack_dashboard import api
 from openstack_dashboard.usage import base
 
 
+if VERSION >= (1, 5, 0):
+    _CsvResponseBase = csvbase.BaseCsvStreamingResponse
+else:
+    # Django 1.4 cannot stream responses, the export is rendered at once
+    # from the usage loaded by the view.
+    _CsvResponseBase = csvbase.BaseCsvResponse
+
+
+class UsageCsvStreamingResponse(_CsvResponseBase):
+    """Streams the CSV export of a :class:`UsageView`.
+
+    The usage is only loaded, by the view's ``get_data``, once the response
+    headers have been sent, and the rows are sent in chunks of
+    ``chunk_size``.
+    """
+
+    def load_data(self):
+        self.context['view'].get_data()
+
+
 class UsageView(tables.DataTableView):
+    """Displays the usage of the ``usage_class`` for a date range.
+
+    With ``?format=csv`` the usage is exported with the
+    ``csv_response_class``. If it is a
+    :class:`horizon.utils.csvbase.BaseCsvStreamingResponse` subclass, e.g.
+    :class:`UsageCsvStreamingResponse`, the export is streamed in chunks of
+    ``csv_chunk_size`` rows, and neither the limits nor the tables and
+    charts of the page are loaded for it.
+    """
     usage_class = None
     show_terminated = True
     csv_template_name = None
+    csv_chunk_size = 100
     page_title = _("Overview")
 
     def __init__(self, *args, **kwargs):
@@ -41,13 +73,32 @@ class UsageView(tables.DataTableView):
             return "text/csv"
         return "text/html"
 
+    def is_csv_streaming(self):
+        streaming_class = getattr(csvbase, 'BaseCsvStreamingResponse', None)
+        return (streaming_class is not None and
+                self.request.GET.get('format', 'html') == 'csv' and
+                issubclass(getattr(self, 'csv_response_class', object),
+                           streaming_class))
+
+    def get_usage(self):
+        project_id = self.kwargs.get('project_id',
+                                     self.request.user.tenant_id)
+        return self.usage_class(self.request, project_id)
+
+    def get(self, request, *args, **kwargs):
+        if self.is_csv_streaming():
+            self.usage = self.get_usage()
+            return self.render_to_response({'usage': self.usage,
+                                            'view': self})
+        return super(UsageView, self).get(request, *args, **kwargs)
+
     def get_data(self):
         try:
-            project_id = self.kwargs.get('project_id',
-                                         self.request.user.tenant_id)
-            self.usage = self.usage_class(self.request, project_id)
+            if not self.is_csv_streaming():
+                self.usage = self.get_usage()
             self.usage.summarize(*self.usage.get_date_range())
-            self.usage.get_limits()
+            if not self.is_csv_streaming():
+                self.usage.get_limits()
             self.kwargs['usage'] = self.usage
             return self.usage.usage_list
         except Exception:
@@ -101,6 +152,8 @@ class UsageView(tables.DataTableView):
         if self.request.GET.get('format', 'html') == 'csv':
             render_class = self.csv_response_class
             response_kwargs.setdefault("filename", "usage.csv")
+            if self.is_csv_streaming():
+                response_kwargs.setdefault("chunk_size", self.csv_chunk_size)
         else:
             render_class = self.response_class
         context = self.render_context_with_title(context)
@@ -0,0 +1,266 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Helpers for issuing independent API calls concurrently.
+
+Views frequently need several listings (flavors, images, ports...) that do
+not depend on each other. Running them one after another makes a page as
+slow as the sum of the calls; running them on the shared worker pool makes
+it roughly as slow as the slowest one::
+
+    flavors = concurrency.submit(request, api.nova.flavor_list, request)
+    images = concurrency.submit(request, api.glance.image_list_detailed,
+                                request)
+    try:
+        flavors = flavors.result()
+    except Exception:
+        exceptions.handle(request, ignore=True)
+
+Exceptions raised by the call are re-raised by ``Future.result()`` in the
+calling thread, so the usual ``exceptions.handle`` logic keeps working.
+
+Views issuing many calls of the same kind, e.g. one per resource, should use
+:func:`run_bounded` so that a single request cannot take over the whole pool.
+"""
+
+import collections
+import itertools
+import logging
+import sys
+import threading
+import time
+
+from django.conf import settings
+from django.utils import translation
+import six
+from six.moves import queue
+
+LOG = logging.getLogger(__name__)
+
+_pool = None
+_pool_lock = threading.Lock()
+_local = threading.local()
+
+
+class CancelledError(Exception):
+    """Raised by ``Future.result()`` for a call which was cancelled."""
+
+
+class Future(object):
+    """The pending result of a call submitted to the worker pool."""
+
+    def __init__(self):
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._started = False
+        self._result = None
+        self._exc_info = None
+
+    def done(self):
+        return self._done.is_set()
+
+    def start(self):
+        """Marks the call as running, returns False if it was cancelled."""
+        with self._lock:
+            if self._done.is_set():
+                return False
+            self._started = True
+            return True
+
+    def cancel(self):
+        """Prevents the call from running if it has not started yet.
+
+        Returns whether the call was cancelled.
+        """
+        with self._lock:
+            if self._started or self._done.is_set():
+                return False
+            try:
+                raise CancelledError()
+            except CancelledError:
+                self._exc_info = sys.exc_info()
+            self._done.set()
+            return True
+
+    def set_result(self, result):
+        self._result = result
+        self._done.set()
+
+    def set_exc_info(self, exc_info):
+        self._exc_info = exc_info
+        self._done.set()
+
+    def result(self, timeout=None):
+        """Waits for the call to finish and returns its result.
+
+        If the call raised an exception, the same exception is raised here.
+        """
+        if not self._done.wait(timeout):
+            raise RuntimeError("Timed out waiting for a concurrent call.")
+        if self._exc_info is not None:
+            six.reraise(*self._exc_info)
+        return self._result
+
+
+class WorkerPool(object):
+    """A fixed-size pool of daemon threads consuming a shared work queue.
+
+    The threads are started lazily, on the first submitted call, and live
+    for the lifetime of the process.
+    """
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self._queue = queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def _start_workers(self):
+        with self._lock:
+            while len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._work)
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self):
+        _local.in_worker = True
+        while True:
+            future, fn, args, kwargs = self._queue.get()
+            _run(future, fn, args, kwargs)
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        if self.max_workers < 1 or getattr(_local, 'in_worker', False):
+            # Calls made from within a worker run inline, waiting on the
+            # pool from one of its own threads could otherwise deadlock.
+            _run(future, fn, args, kwargs)
+            return future
+        if len(self._threads) < self.max_workers:
+            self._start_workers()
+        self._queue.put((future, fn, args, kwargs))
+        return future
+
+
+def _run(future, fn, args, kwargs):
+    if not future.start():
+        return
+    try:
+        future.set_result(fn(*args, **kwargs))
+    except Exception:
+        future.set_exc_info(sys.exc_info())
+
+
+def get_pool():
+    """Returns the process-wide worker pool.
+
+    Its size is taken from the ``API_CONCURRENCY_WORKERS`` setting; a value
+    lower than 1 makes every submitted call run inline.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = WorkerPool(
+                    getattr(settings, 'API_CONCURRENCY_WORKERS', 10))
+    return _pool
+
+
+def submit(request, fn, *args, **kwargs):
+    """Runs ``fn(*args, **kwargs)`` on the worker pool for ``request``.
+
+    The call sees the same active language as the request and has access to
+    the request's token through the request object passed to the API
+    functions, so it behaves as if it was made from the view itself.
+
+    Returns a :class:`Future`.
+    """
+    language = getattr(request, 'LANGUAGE_CODE', translation.get_language())
+    caller = threading.current_thread()
+
+    def call():
+        if threading.current_thread() is caller:
+            return fn(*args, **kwargs)
+        translation.activate(language)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            translation.deactivate()
+
+    return get_pool().submit(call)
+
+
+def imap_bounded(request, fn, items, limit=None, timeout=None):
+    """Calls ``fn(item)`` for each of ``items`` on the worker pool.
+
+    At most ``limit`` of the calls, by default ``API_CONCURRENCY_PER_REQUEST``,
+    are running or queued at once, the following ones are submitted as the
+    previous ones finish. The results are yielded in the order of ``items``
+    as soon as they are available, so they can be processed, e.g. streamed
+    to the client, while the next calls are running.
+
+    If a call raises an exception or the calls take more than ``timeout``
+    seconds in total, the exception is raised. The calls which have not
+    started yet are cancelled then, and also when the generator is closed
+    early, e.g. because the client of a streaming response disconnected.
+    """
+    items = iter(items)
+    if limit is None:
+        limit = getattr(settings, 'API_CONCURRENCY_PER_REQUEST', 5)
+    deadline = time.time() + timeout if timeout else None
+    pending = collections.deque()
+    durations = []
+
+    def call(item):
+        started = time.time()
+        try:
+            return fn(item)
+        finally:
+            durations.append(time.time() - started)
+
+    def submit_next():
+        for item in itertools.islice(items, 1):
+            pending.append(submit(request, call, item))
+
+    started = time.time()
+    try:
+        for i in range(max(limit, 1)):
+            submit_next()
+        while pending:
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - time.time(), 0)
+            result = pending[0].result(timeout=remaining)
+            pending.popleft()
+            submit_next()
+            yield result
+    finally:
+        cancelled = len([future for future in pending if future.cancel()])
+        LOG.debug("Ran %(count)d calls of %(fn)s in %(time).3fs "
+                  "(%(call).3fs per call on average), "
+                  "cancelled %(cancelled)d.",
+                  {'count': len(durations),
+                   'fn': getattr(fn, '__name__', fn),
+                   'time': time.time() - started,
+                   'call': sum(durations) / max(len(durations), 1),
+                   'cancelled': cancelled})
+
+
+def run_bounded(request, fn, items, limit=None, timeout=None):
+    """Calls ``fn(item)`` for each of ``items`` on the worker pool.
+
+    The calls are made as described for :func:`imap_bounded`, without
+    taking more than ``limit`` workers for one request. Returns the list
+    of the results in the order of ``items``.
+    """
+    return list(imap_bounded(request, fn, items, limit=limit,
+                             timeout=timeout))
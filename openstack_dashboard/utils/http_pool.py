@@ -0,0 +1,159 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Process-wide pools of keep-alive connections to the service endpoints.
+
+The API wrappers create a new client, with a new HTTP session, for every
+request, so each page view used to open (and TLS handshake) a new
+connection to every service it talks to. The helpers below keep one
+``requests`` transport adapter per endpoint and TLS settings for the
+lifetime of the process; mounting it on the session of a client makes the
+client borrow an idle connection from the shared pool and give it back
+once the response has been read::
+
+    client = glance_client.Client(version, url, token=token)
+    session = client.http_client.session
+    http_pool.mount(session, url, verify=session.verify, cert=session.cert)
+
+Only the connections are shared. The session, and so the headers carrying
+the token of the request, still belongs to the client of one request.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from requests import adapters
+from six.moves.urllib import parse
+
+LOG = logging.getLogger(__name__)
+
+_adapters = {}
+_lock = threading.Lock()
+_stats_logged_at = 0
+
+# The minimum number of seconds between two logs of the statistics.
+STATS_LOG_INTERVAL = 300
+
+
+def _get_pool_size():
+    return getattr(settings, 'API_HTTP_POOL_SIZE', 10)
+
+
+def _get_endpoint(url):
+    parts = parse.urlsplit(url)
+    # Requests matches the mounted prefixes against the lowercased URL.
+    return ('%s://%s' % (parts.scheme, parts.netloc)).lower()
+
+
+def get_adapter(url, verify=True, cert=None):
+    """Returns the shared transport adapter for the endpoint of ``url``.
+
+    Connections are only shared between clients using the same
+    ``verify`` and ``cert`` TLS settings. Returns None if pooling is
+    disabled by setting ``API_HTTP_POOL_SIZE`` to 0.
+    """
+    pool_size = _get_pool_size()
+    if pool_size < 1:
+        return None
+    key = (_get_endpoint(url), verify, cert)
+    with _lock:
+        adapter = _adapters.get(key)
+        if adapter is None:
+            LOG.debug("Creating a pool of %(size)d connections to "
+                      "%(endpoint)s.", {'size': pool_size,
+                                        'endpoint': key[0]})
+            adapter = adapters.HTTPAdapter(pool_maxsize=pool_size)
+            _adapters[key] = adapter
+    return adapter
+
+
+def mount(session, url, verify=True, cert=None):
+    """Makes ``session`` use the shared connections to the endpoint of ``url``.
+
+    Returns whether the shared adapter was mounted.
+    """
+    adapter = get_adapter(url, verify=verify, cert=cert)
+    if adapter is None:
+        return False
+    session.mount(_get_endpoint(url), adapter)
+    log_stats()
+    return True
+
+
+class AdapterPool(object):
+    """Hands out the shared adapters to clients which look them up by URL.
+
+    Novaclient can be given such an object, in place of its own per-client
+    connection pool, to reuse connections across requests.
+    """
+
+    def __init__(self, verify=True, cert=None):
+        self.verify = verify
+        self.cert = cert
+
+    def get(self, url):
+        return (get_adapter(url, verify=self.verify, cert=self.cert) or
+                adapters.HTTPAdapter())
+
+
+def get_stats():
+    """Returns the hits and misses of the shared pools for every endpoint.
+
+    A hit is a request sent over a kept-alive connection, a miss a request
+    which had to open a new connection.
+    """
+    with _lock:
+        items = list(_adapters.items())
+    stats = {}
+    for (endpoint, verify, cert), adapter in items:
+        endpoint_stats = stats.setdefault(endpoint, {'hits': 0, 'misses': 0})
+        for pool_key in adapter.poolmanager.pools.keys():
+            pool = adapter.poolmanager.pools.get(pool_key)
+            if pool is None:
+                continue
+            endpoint_stats['hits'] += pool.num_requests - pool.num_connections
+            endpoint_stats['misses'] += pool.num_connections
+    return stats
+
+
+def log_stats(interval=STATS_LOG_INTERVAL):
+    """Logs the statistics of the shared pools at the debug level.
+
+    They are logged at most once every ``interval`` seconds by a process.
+    Returns whether they were logged.
+    """
+    global _stats_logged_at
+    if not LOG.isEnabledFor(logging.DEBUG):
+        return False
+    now = time.time()
+    with _lock:
+        if now - _stats_logged_at < interval:
+            return False
+        _stats_logged_at = now
+    for endpoint, stats in sorted(get_stats().items()):
+        LOG.debug("Shared connections to %(endpoint)s: %(hits)d requests "
+                  "sent over kept-alive connections, %(misses)d new "
+                  "connections opened.",
+                  {'endpoint': endpoint, 'hits': stats['hits'],
+                   'misses': stats['misses']})
+    return True
+
+
+def clear():
+    """Closes all of the shared connections."""
+    with _lock:
+        items = list(_adapters.values())
+        _adapters.clear()
+    for adapter in items:
+        adapter.close()
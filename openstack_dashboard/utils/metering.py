@@ -175,9 +175,11 @@ def get_unit(meter, request):
 
 class ProjectAggregatesQuery(object):
     def __init__(self, request, date_from, date_to,
-                 period=None, additional_query=[]):
+                 period=None, additional_query=None):
         if not period:
             period = calc_period(date_from, date_to)
+        self.base_query = list(additional_query or [])
+        additional_query = list(self.base_query)
         if date_from:
             additional_query.append({'field': 'timestamp',
                                      'op': 'ge',
@@ -190,6 +192,11 @@ class ProjectAggregatesQuery(object):
         self.request = request
         self.period = period
         self.additional_query = additional_query
+        self.date_range = None
+        if period == api.ceilometer.DAY and date_from and date_to:
+            # Daily statistics are cached per day, see
+            # api.ceilometer.statistic_list_daily.
+            self.date_range = (date_from, date_to)
         tenants, more = api.keystone.tenant_list(request,
                                                  domain=None,
                                                  paginate=False)
@@ -203,13 +210,19 @@ class ProjectAggregatesQuery(object):
 
             self.queries[tenant.name] = tenant_query
 
+    def _statistics_kwargs(self):
+        if self.date_range:
+            return {'additional_query': self.base_query,
+                    'date_range': self.date_range}
+        return {'additional_query': self.additional_query}
+
     def query(self, meter):
         unit = get_unit(meter, self.request)
         ceilometer_usage = api.ceilometer.CeilometerUsage(self.request)
         resources = ceilometer_usage.resource_aggregates_with_statistics(
             self.queries, [meter], period=self.period,
             stats_attr=None,
-            additional_query=self.additional_query)
+            **self._statistics_kwargs())
         return resources, unit
 
 
@@ -242,7 +255,7 @@ class MeterQuery(ProjectAggregatesQuery):
             self.queries, [meter],
             period=self.period,
             stats_attr=None,
-            additional_query=self.additional_query,
-            filter_func=filter_by_meter_name)
+            filter_func=filter_by_meter_name,
+            **self._statistics_kwargs())
 
         return resources, unit